@@ -0,0 +1,70 @@
+"""Add audit log keyset pagination indexes
+
+Revision ID: n9o1p2q3r4s5
+Revises: m8n0o1p2q3r4
+Create Date: 2026-10-16
+
+Changes:
+- Replace ix_audit_logs_tenant_created (tenant_id, created_at) with
+  (tenant_id, created_at DESC, id DESC) WHERE is_active for tenant-scoped
+  cursor pages
+- Add (created_at DESC, id DESC) WHERE is_active for unscoped super admin
+  cursor pages
+- Both are partial indexes, matching the filter every audit log endpoint
+  applies, and are built (and the old index dropped) CONCURRENTLY so audit
+  log writes are not blocked
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'n9o1p2q3r4s5'
+down_revision = 'm8n0o1p2q3r4'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text('is_active')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_tenant_created_id',
+            'audit_logs',
+            ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_audit_logs_created_id',
+            'audit_logs',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+        # Superseded by ix_audit_logs_tenant_created_id
+        op.drop_index(
+            'ix_audit_logs_tenant_created',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_tenant_created',
+            'audit_logs',
+            ['tenant_id', 'created_at'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_created_id',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_tenant_created_id',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
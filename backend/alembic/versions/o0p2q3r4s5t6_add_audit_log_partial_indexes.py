@@ -0,0 +1,55 @@
+"""Add partial indexes for active audit log queries
+
+Revision ID: o0p2q3r4s5t6
+Revises: n9o1p2q3r4s5
+Create Date: 2026-10-16
+
+Changes:
+- Add (tenant_id, action, created_at DESC) WHERE is_active for tenant-scoped
+  action filters and the distinct actions lookup
+- Add (tenant_id, resource) WHERE is_active for the distinct resources lookup
+- Both are partial on is_active like the keyset indexes, and are built
+  CONCURRENTLY so audit log writes are not blocked while the indexes build
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'o0p2q3r4s5t6'
+down_revision = 'n9o1p2q3r4s5'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text('is_active')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_tenant_action_created',
+            'audit_logs',
+            ['tenant_id', 'action', sa.text('created_at DESC')],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_audit_logs_tenant_resource',
+            'audit_logs',
+            ['tenant_id', 'resource'],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_audit_logs_tenant_resource',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_tenant_action_created',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,56 @@
+"""Add tenant-scoped user and status indexes for active audit logs
+
+Revision ID: p1q3r4s5t6u7
+Revises: o0p2q3r4s5t6
+Create Date: 2026-10-16
+
+Changes:
+- Add (tenant_id, user_id, created_at DESC) WHERE is_active for the user
+  filter on the tenant-scoped audit log list
+- Add (tenant_id, status, created_at DESC) WHERE is_active for the status
+  filter on the tenant-scoped audit log list
+- Both are built CONCURRENTLY so audit log writes are not blocked while
+  the indexes build
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'p1q3r4s5t6u7'
+down_revision = 'o0p2q3r4s5t6'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text('is_active')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_tenant_user_created',
+            'audit_logs',
+            ['tenant_id', 'user_id', sa.text('created_at DESC')],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_audit_logs_tenant_status_created',
+            'audit_logs',
+            ['tenant_id', 'status', sa.text('created_at DESC')],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_audit_logs_tenant_status_created',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_tenant_user_created',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
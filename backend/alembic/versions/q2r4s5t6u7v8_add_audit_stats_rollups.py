@@ -0,0 +1,79 @@
+"""Add hourly audit statistics rollup tables
+
+Revision ID: q2r4s5t6u7v8
+Revises: p1q3r4s5t6u7
+Create Date: 2026-10-16
+
+Changes:
+- Add audit_stats_hourly: audit log counts per tenant, hour, action and
+  status
+- Add audit_stats_users: rolled-up audit log counts per tenant and user,
+  for the distinct-user total
+- Both are backfilled here with every complete hour up to an hour ago (the
+  same window AuditStatsService.refresh uses), so no statistics request has
+  to aggregate the whole table; the statistics endpoint keeps them current
+  from then on. NULLS NOT DISTINCT needs PostgreSQL 15+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 'q2r4s5t6u7v8'
+down_revision = 'p1q3r4s5t6u7'
+branch_labels = None
+depends_on = None
+
+# Mirrors AuditStatsService.refresh for the first run: active logs in
+# complete hours that ended at least an hour ago
+BACKFILL_UNTIL = "date_trunc('hour', now() - interval '1 hour')"
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_stats_hourly',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('hour_bucket', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('action', sa.String(100), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('log_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tenant_id', 'hour_bucket', 'action', 'status',
+                            name='uix_audit_stats_hourly_key', postgresql_nulls_not_distinct=True),
+    )
+    op.create_index('ix_audit_stats_hourly_bucket', 'audit_stats_hourly', ['hour_bucket'])
+
+    op.create_table(
+        'audit_stats_users',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('log_count', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('tenant_id', 'user_id',
+                            name='uix_audit_stats_users_key', postgresql_nulls_not_distinct=True),
+    )
+    op.create_index('ix_audit_stats_users_user_id', 'audit_stats_users', ['user_id'])
+
+    op.execute(f"""
+        INSERT INTO audit_stats_hourly (id, tenant_id, hour_bucket, action, status, log_count)
+        SELECT gen_random_uuid(), tenant_id, date_trunc('hour', created_at), action, status, count(*)
+        FROM audit_logs
+        WHERE is_active AND created_at < {BACKFILL_UNTIL}
+        GROUP BY tenant_id, date_trunc('hour', created_at), action, status
+    """)
+    op.execute(f"""
+        INSERT INTO audit_stats_users (id, tenant_id, user_id, log_count)
+        SELECT gen_random_uuid(), tenant_id, user_id, count(*)
+        FROM audit_logs
+        WHERE is_active AND user_id IS NOT NULL AND created_at < {BACKFILL_UNTIL}
+        GROUP BY tenant_id, user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_stats_users_user_id', table_name='audit_stats_users')
+    op.drop_table('audit_stats_users')
+    op.drop_index('ix_audit_stats_hourly_bucket', table_name='audit_stats_hourly')
+    op.drop_table('audit_stats_hourly')
@@ -0,0 +1,61 @@
+"""Add trigram indexes for audit log request ID / IP address search
+
+Revision ID: r3s5t6u7v8w9
+Revises: q2r4s5t6u7v8
+Create Date: 2026-10-16
+
+Changes:
+- Enable the pg_trgm extension
+- Add GIN trigram indexes on request_id and ip_address WHERE is_active, so
+  the list endpoint's ILIKE '%...%' search can use an index
+- Both are built CONCURRENTLY so audit log writes are not blocked while
+  the indexes build
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'r3s5t6u7v8w9'
+down_revision = 'q2r4s5t6u7v8'
+branch_labels = None
+depends_on = None
+
+ACTIVE = sa.text('is_active')
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_request_id_trgm',
+            'audit_logs',
+            ['request_id'],
+            postgresql_using='gin',
+            postgresql_ops={'request_id': 'gin_trgm_ops'},
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_audit_logs_ip_address_trgm',
+            'audit_logs',
+            ['ip_address'],
+            postgresql_using='gin',
+            postgresql_ops={'ip_address': 'gin_trgm_ops'},
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_audit_logs_ip_address_trgm',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_request_id_trgm',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,41 @@
+"""Add a BRIN index on audit_logs.created_at
+
+Revision ID: s4t6u7v8w9x0
+Revises: r3s5t6u7v8w9
+Create Date: 2026-10-16
+
+Changes:
+- Add a BRIN index on created_at (pages_per_range=32) for cross-tenant
+  time-range scans: archive deletes (created_at < cutoff, any is_active)
+  and the statistics rollups. Audit logs are appended in created_at
+  order, so the block ranges stay tight and the index stays a few pages
+- Built CONCURRENTLY so audit log writes are not blocked while it builds
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 's4t6u7v8w9x0'
+down_revision = 'r3s5t6u7v8w9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_created_brin',
+            'audit_logs',
+            ['created_at'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_audit_logs_created_brin',
+            'audit_logs',
+            postgresql_concurrently=True,
+        )
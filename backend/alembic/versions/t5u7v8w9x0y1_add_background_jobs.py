@@ -0,0 +1,42 @@
+"""Add background_jobs table
+
+Revision ID: t5u7v8w9x0y1
+Revises: s4t6u7v8w9x0
+Create Date: 2026-10-16
+
+Changes:
+- Add background_jobs: status, progress and result of seed-data,
+  reset-database and audit archive jobs, so any worker can answer a
+  status poll; records are purged a day after creation
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = 't5u7v8w9x0y1'
+down_revision = 's4t6u7v8w9x0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'background_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('action', sa.String(100), nullable=False),
+        sa.Column('tenant_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('progress', sa.JSON(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_background_jobs_created_at', 'background_jobs', ['created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_background_jobs_created_at', table_name='background_jobs')
+    op.drop_table('background_jobs')
@@ -6,10 +6,14 @@ Provides dependency injection for:
 - Authorization (system/tenant permission checks)
 - Tenant context resolution
 """
-from fastapi import Depends, Header, HTTPException, status
+import hashlib
+import threading
+import time
+
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.orm import Session, joinedload
+from typing import Dict, Optional, Tuple
 from uuid import UUID
 
 from app.core.database import get_db
@@ -26,20 +30,57 @@ from app.core.permissions import (
 
 security = HTTPBearer()
 
+# Verified access token payloads, keyed by SHA-256 of the token. Entries are
+# dropped after TOKEN_CACHE_TTL seconds or at the token's own expiry,
+# whichever comes first. Per worker process, like app.core.cache.
+TOKEN_CACHE_TTL = 30
+TOKEN_CACHE_SIZE = 10000
+_token_cache: Dict[str, Tuple[float, dict]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _decode_access_token(token: str) -> Optional[dict]:
+    """decode_token() with the signature check memoized for repeat requests"""
+    key = hashlib.sha256(token.encode()).hexdigest()
+    now = time.time()
+
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    payload = decode_token(token)
+    if payload:
+        expires_at = min(now + TOKEN_CACHE_TTL, payload.get("exp", now))
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_SIZE:
+                for stale in [k for k, (until, _) in _token_cache.items() if until <= now]:
+                    del _token_cache[stale]
+                if len(_token_cache) >= TOKEN_CACHE_SIZE:
+                    _token_cache.clear()
+            _token_cache[key] = (expires_at, payload)
+    return payload
+
 
 # ========================================
 # Core Authentication
 # ========================================
 
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """
     Get current authenticated user from JWT token
+
+    The user's tenant is loaded in the same query, and its ID is kept on
+    request.state so the usage tracking middleware doesn't decode the
+    token again. Only the token's signature check is cached; the user is
+    always re-read so deactivation and role changes apply immediately.
     """
     token = credentials.credentials
-    payload = decode_token(token)
+    payload = _decode_access_token(token)
 
     if not payload:
         raise HTTPException(
@@ -56,7 +97,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User).options(joinedload(User.tenant)).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,6 +110,7 @@ def get_current_user(
             detail="Inactive user"
         )
 
+    request.state.tenant_id = user.tenant_id
     return user
 
 
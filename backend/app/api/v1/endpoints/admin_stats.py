@@ -1,54 +1,97 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, select, lambda_stmt
 from datetime import datetime, timedelta
 
-from app.core.database import get_db
+from app.core.database import get_db_ro
+from app.core.cache import ttl_cache
 from app.api.deps import get_super_admin_user
 from app.models.user import User
 from app.models.tenant import Tenant
 from app.models.branch import Branch
 from app.models.audit_log import AuditLog, AuditAction
+from app.schemas.stats import (
+    SystemStatistics,
+    SystemStatsBreakdowns,
+    SystemStatsOverview,
+    SystemStatsRecentActivity,
+    SystemStatsGrowth,
+)
 
-router = APIRouter(prefix="/admin/stats", tags=["Admin - Stats"])
+router = APIRouter(
+    prefix="/admin/stats",
+    tags=["Admin - Stats"],
+    default_response_class=ORJSONResponse,
+)
 
 
-@router.get("")
-async def get_system_statistics(
-    current_user: User = Depends(get_super_admin_user),
-    db: Session = Depends(get_db)
-):
-    """
-    Get system-wide statistics (Super Admin only)
-
-    Returns:
-    - Total counts for tenants, users, branches
-    - Recent activity metrics
-    - Growth trends
-    - System health indicators
-    """
+# ── Stats sections ───────────────────────────────────────────────────────────
+#
+# Each section is computed independently and cached with a TTL matching how
+# quickly its numbers change, so clients can refresh only what they display.
+# All statements are lambda_stmt()s: SQLAlchemy caches the compiled SQL per
+# lambda and turns captured locals (the cutoffs) into bind params.
 
+@ttl_cache(seconds=60)
+def _overview(db: Session) -> SystemStatsOverview:
+    """Platform-wide totals."""
     # Basic counts
-    total_tenants = db.query(Tenant).filter(Tenant.is_active == True).count()
-    total_users = db.query(User).filter(User.is_active == True).count()
-    total_branches = db.query(Branch).filter(Branch.is_active == True).count()
+    total_tenants = db.execute(lambda_stmt(
+        lambda: select(func.count(Tenant.id)).where(Tenant.is_active == True)
+    )).scalar_one()
+    total_users = db.execute(lambda_stmt(
+        lambda: select(func.count(User.id)).where(User.is_active == True)
+    )).scalar_one()
+    total_branches = db.execute(lambda_stmt(
+        lambda: select(func.count(Branch.id)).where(Branch.is_active == True)
+    )).scalar_one()
+
+    # Verified vs unverified users
+    verified_users = db.execute(lambda_stmt(
+        lambda: select(func.count(User.id)).where(
+            User.is_verified == True,
+            User.is_active == True
+        )
+    )).scalar_one()
+
+    unverified_users = db.execute(lambda_stmt(
+        lambda: select(func.count(User.id)).where(
+            User.is_verified == False,
+            User.is_active == True
+        )
+    )).scalar_one()
 
+    # Active vs inactive tenants
+    inactive_tenants = db.execute(lambda_stmt(
+        lambda: select(func.count(Tenant.id)).where(Tenant.is_active == False)
+    )).scalar_one()
+
+    return SystemStatsOverview.model_construct(
+        total_tenants=total_tenants,
+        total_users=total_users,
+        total_branches=total_branches,
+        verified_users=verified_users,
+        unverified_users=unverified_users,
+        inactive_tenants=inactive_tenants,
+    )
+
+
+@ttl_cache(seconds=60)
+def _breakdowns(db: Session) -> SystemStatsBreakdowns:
+    """Active users by role and active tenants by tier."""
     # Users by role (system users + tenant users)
-    system_users_by_role = db.query(
-        User.system_role,
-        func.count(User.id).label('count')
-    ).filter(
-        User.is_active == True,
-        User.system_role.isnot(None)
-    ).group_by(User.system_role).all()
-
-    tenant_users_by_role = db.query(
-        User.tenant_role,
-        func.count(User.id).label('count')
-    ).filter(
-        User.is_active == True,
-        User.tenant_role.isnot(None)
-    ).group_by(User.tenant_role).all()
+    system_users_by_role = db.execute(lambda_stmt(
+        lambda: select(User.system_role, func.count(User.id))
+        .where(User.is_active == True, User.system_role.isnot(None))
+        .group_by(User.system_role)
+    )).all()
+
+    tenant_users_by_role = db.execute(lambda_stmt(
+        lambda: select(User.tenant_role, func.count(User.id))
+        .where(User.is_active == True, User.tenant_role.isnot(None))
+        .group_by(User.tenant_role)
+    )).all()
 
     role_breakdown = {}
     for role, count in system_users_by_role:
@@ -59,57 +102,103 @@ async def get_system_statistics(
             role_breakdown[f"tenant_{role.value}"] = count
 
     # Tenants by tier
-    tenants_by_tier = db.query(
-        Tenant.tier,
-        func.count(Tenant.id).label('count')
-    ).filter(
-        Tenant.is_active == True
-    ).group_by(Tenant.tier).all()
+    tenants_by_tier = db.execute(lambda_stmt(
+        lambda: select(Tenant.tier, func.count(Tenant.id))
+        .where(Tenant.is_active == True)
+        .group_by(Tenant.tier)
+    )).all()
 
     tier_breakdown = {tier: count for tier, count in tenants_by_tier}
 
+    return SystemStatsBreakdowns.model_construct(
+        users_by_role=role_breakdown,
+        tenants_by_tier=tier_breakdown,
+    )
+
+
+@ttl_cache(seconds=10)
+def _activity(db: Session) -> SystemStatsRecentActivity:
+    """Registrations in the last 30 days and audit activity in the last 24 hours."""
+    # Anchor both windows to the same instant
+    now = datetime.utcnow()
+    thirty_days_ago = now - timedelta(days=30)
+    twenty_four_hours_ago = now - timedelta(hours=24)
+
     # Recent registrations (last 30 days)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+    new_tenants_30d = db.execute(lambda_stmt(
+        lambda: select(func.count(Tenant.id)).where(
+            Tenant.created_at >= thirty_days_ago,
+            Tenant.is_active == True
+        )
+    )).scalar_one()
 
-    new_tenants_30d = db.query(Tenant).filter(
-        Tenant.created_at >= thirty_days_ago,
-        Tenant.is_active == True
-    ).count()
+    new_users_30d = db.execute(lambda_stmt(
+        lambda: select(func.count(User.id)).where(
+            User.created_at >= thirty_days_ago,
+            User.is_active == True
+        )
+    )).scalar_one()
 
-    new_users_30d = db.query(User).filter(
-        User.created_at >= thirty_days_ago,
-        User.is_active == True
-    ).count()
+    # Recent activity (last 24 hours)
+    recent_logins = db.execute(lambda_stmt(
+        lambda: select(func.count(AuditLog.id)).where(
+            AuditLog.action == AuditAction.LOGIN,
+            AuditLog.created_at >= twenty_four_hours_ago
+        )
+    )).scalar_one()
 
-    # Growth metrics (last 7 days vs previous 7 days)
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    fourteen_days_ago = datetime.utcnow() - timedelta(days=14)
+    recent_actions = db.execute(lambda_stmt(
+        lambda: select(func.count(AuditLog.id)).where(
+            AuditLog.created_at >= twenty_four_hours_ago
+        )
+    )).scalar_one()
+
+    return SystemStatsRecentActivity.model_construct(
+        new_tenants_30d=new_tenants_30d,
+        new_users_30d=new_users_30d,
+        logins_24h=recent_logins,
+        total_actions_24h=recent_actions,
+    )
 
-    tenants_last_7d = db.query(Tenant).filter(
-        Tenant.created_at >= seven_days_ago,
-        Tenant.is_active == True
-    ).count()
 
-    tenants_prev_7d = db.query(Tenant).filter(
-        and_(
+@ttl_cache(seconds=600)
+def _growth(db: Session) -> SystemStatsGrowth:
+    """Registrations in the last 7 days compared with the previous 7 days."""
+    # Anchor both windows to the same instant
+    now = datetime.utcnow()
+    fourteen_days_ago = now - timedelta(days=14)
+    seven_days_ago = now - timedelta(days=7)
+
+    # Growth metrics (last 7 days vs previous 7 days)
+    tenants_last_7d = db.execute(lambda_stmt(
+        lambda: select(func.count(Tenant.id)).where(
+            Tenant.created_at >= seven_days_ago,
+            Tenant.is_active == True
+        )
+    )).scalar_one()
+
+    tenants_prev_7d = db.execute(lambda_stmt(
+        lambda: select(func.count(Tenant.id)).where(
             Tenant.created_at >= fourteen_days_ago,
             Tenant.created_at < seven_days_ago,
             Tenant.is_active == True
         )
-    ).count()
+    )).scalar_one()
 
-    users_last_7d = db.query(User).filter(
-        User.created_at >= seven_days_ago,
-        User.is_active == True
-    ).count()
+    users_last_7d = db.execute(lambda_stmt(
+        lambda: select(func.count(User.id)).where(
+            User.created_at >= seven_days_ago,
+            User.is_active == True
+        )
+    )).scalar_one()
 
-    users_prev_7d = db.query(User).filter(
-        and_(
+    users_prev_7d = db.execute(lambda_stmt(
+        lambda: select(func.count(User.id)).where(
             User.created_at >= fourteen_days_ago,
             User.created_at < seven_days_ago,
             User.is_active == True
         )
-    ).count()
+    )).scalar_one()
 
     # Calculate growth percentages
     tenant_growth = 0
@@ -120,55 +209,86 @@ async def get_system_statistics(
     if users_prev_7d > 0:
         user_growth = ((users_last_7d - users_prev_7d) / users_prev_7d) * 100
 
-    # Recent activity (last 24 hours)
-    twenty_four_hours_ago = datetime.utcnow() - timedelta(hours=24)
+    return SystemStatsGrowth.model_construct(
+        tenants_last_7d=tenants_last_7d,
+        tenants_prev_7d=tenants_prev_7d,
+        tenant_growth_percentage=round(tenant_growth, 2),
+        users_last_7d=users_last_7d,
+        users_prev_7d=users_prev_7d,
+        user_growth_percentage=round(user_growth, 2),
+    )
 
-    recent_logins = db.query(AuditLog).filter(
-        AuditLog.action == AuditAction.LOGIN,
-        AuditLog.created_at >= twenty_four_hours_ago
-    ).count()
 
-    recent_actions = db.query(AuditLog).filter(
-        AuditLog.created_at >= twenty_four_hours_ago
-    ).count()
+def invalidate_stats_cache():
+    """Drop all cached stats sections (call after bulk data changes)."""
+    for section in (_overview, _breakdowns, _activity, _growth):
+        section.cache_clear()
 
-    # Verified vs unverified users
-    verified_users = db.query(User).filter(
-        User.is_verified == True,
-        User.is_active == True
-    ).count()
 
-    unverified_users = db.query(User).filter(
-        User.is_verified == False,
-        User.is_active == True
-    ).count()
+# ── Endpoints ────────────────────────────────────────────────────────────────
+#
+# Sections are trusted server-built payloads: they are constructed without
+# validation and returned directly so FastAPI does not re-validate them.
 
-    # Active vs inactive tenants
-    inactive_tenants = db.query(Tenant).filter(Tenant.is_active == False).count()
-
-    return {
-        "overview": {
-            "total_tenants": total_tenants,
-            "total_users": total_users,
-            "total_branches": total_branches,
-            "verified_users": verified_users,
-            "unverified_users": unverified_users,
-            "inactive_tenants": inactive_tenants
-        },
-        "users_by_role": role_breakdown,
-        "tenants_by_tier": tier_breakdown,
-        "recent_activity": {
-            "new_tenants_30d": new_tenants_30d,
-            "new_users_30d": new_users_30d,
-            "logins_24h": recent_logins,
-            "total_actions_24h": recent_actions
-        },
-        "growth": {
-            "tenants_last_7d": tenants_last_7d,
-            "tenants_prev_7d": tenants_prev_7d,
-            "tenant_growth_percentage": round(tenant_growth, 2),
-            "users_last_7d": users_last_7d,
-            "users_prev_7d": users_prev_7d,
-            "user_growth_percentage": round(user_growth, 2)
-        }
-    }
+@router.get("", response_model=SystemStatistics)
+async def get_system_statistics(
+    current_user: User = Depends(get_super_admin_user),
+    db: Session = Depends(get_db_ro)
+):
+    """
+    Get system-wide statistics (Super Admin only)
+
+    Returns:
+    - Total counts for tenants, users, branches
+    - Recent activity metrics
+    - Growth trends
+    - System health indicators
+
+    Combines the /overview, /breakdowns, /activity and /growth sections.
+    Served from the read replica when REPLICA_DATABASE_URL is configured.
+    """
+    breakdowns = _breakdowns(db)
+    stats = SystemStatistics.model_construct(
+        overview=_overview(db),
+        users_by_role=breakdowns.users_by_role,
+        tenants_by_tier=breakdowns.tenants_by_tier,
+        recent_activity=_activity(db),
+        growth=_growth(db),
+    )
+    return ORJSONResponse(content=stats.model_dump())
+
+
+@router.get("/overview", response_model=SystemStatsOverview)
+async def get_stats_overview(
+    current_user: User = Depends(get_super_admin_user),
+    db: Session = Depends(get_db_ro)
+):
+    """Platform-wide totals (Super Admin only). Cached for 60 seconds."""
+    return ORJSONResponse(content=_overview(db).model_dump())
+
+
+@router.get("/breakdowns", response_model=SystemStatsBreakdowns)
+async def get_stats_breakdowns(
+    current_user: User = Depends(get_super_admin_user),
+    db: Session = Depends(get_db_ro)
+):
+    """Users by role and tenants by tier (Super Admin only). Cached for 60 seconds."""
+    return ORJSONResponse(content=_breakdowns(db).model_dump())
+
+
+@router.get("/activity", response_model=SystemStatsRecentActivity)
+async def get_stats_activity(
+    current_user: User = Depends(get_super_admin_user),
+    db: Session = Depends(get_db_ro)
+):
+    """Recent registrations and audit activity (Super Admin only). Cached for 10 seconds."""
+    return ORJSONResponse(content=_activity(db).model_dump())
+
+
+@router.get("/growth", response_model=SystemStatsGrowth)
+async def get_stats_growth(
+    current_user: User = Depends(get_super_admin_user),
+    db: Session = Depends(get_db_ro)
+):
+    """Week-over-week growth (Super Admin only). Cached for 10 minutes."""
+    return ORJSONResponse(content=_growth(db).model_dump())
@@ -1,41 +1,69 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.exc import ProgrammingError
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Callable, Iterable, Iterator, Optional, List, Tuple
 import sys
 import time
 import platform
 import os
-import re
+import json
+import fastapi as _fastapi
+import mmap
+import orjson
 
-from app.core.database import get_db
+from app.core.database import get_db, SessionLocal
 from app.api.deps import get_super_admin_user
+from app.api.v1.endpoints.admin_stats import invalidate_stats_cache
 from app.models.user import User, TenantRole, SystemRole
 from app.models.tenant import Tenant
 from app.models.branch import Branch
 from app.core.security import get_password_hash
 from app.services.audit_service import AuditService
+from app.services.background_job_service import BackgroundJobService
 from app.models.audit_log import AuditAction, AuditStatus
 from app.config import settings
+from app.core.log_buffer import log_buffer, log_buffer_sink
+from app.middleware.rate_limiter import rate_limiter
 from datetime import datetime
 import uuid
 from loguru import logger
 
-router = APIRouter(prefix="/admin/tools", tags=["Admin - Tools"])
+router = APIRouter(
+    prefix="/admin/tools",
+    tags=["Admin - Tools"],
+    default_response_class=ORJSONResponse,
+)
 
 # ── In-memory runtime config (resets on server restart) ──────────────────────
 _server_start_time = time.time()
 
+# Facts that can't change while the process is running
+_PYTHON_VERSION = sys.version
+_FASTAPI_VERSION = _fastapi.__version__
+_PLATFORM = platform.platform()
+
 _runtime_settings = {
     "dev_mode": settings.DEV_MODE,
     "log_level": "INFO",
     "rate_limit_enabled": settings.RATE_LIMIT_ENABLED,
 }
 
-# Sensitive env var patterns — values will be masked
-_SENSITIVE_PATTERNS = re.compile(
-    r"(SECRET|PASSWORD|KEY|TOKEN|DATABASE_URL)", re.IGNORECASE
-)
+# Application log file, written by the handlers in main.py / _set_log_level
+_LOG_PATH = "logs/app.log"
+
+# Loguru handlers installed by _set_log_level and their current threshold
+_log_state = {"handlers_installed": False, "min_level_no": 20}
+
+# Sensitive env var name fragments (upper-case) — values will be masked
+_SENSITIVE_TOKENS = ("SECRET", "PASSWORD", "KEY", "TOKEN", "DATABASE_URL")
+
+# /system-info snapshot cache (shared across workers via Redis, env vars excluded)
+_SYSTEM_INFO_CACHE_KEY = "admin_tools:system_info"
+_SYSTEM_INFO_CACHE_TTL = 10  # seconds
 
 
 # ── Pydantic models for the new endpoints ────────────────────────────────────
@@ -67,12 +95,42 @@ async def get_runtime_settings(
     return RuntimeSettingsResponse(**_runtime_settings)
 
 
+def _runtime_level_filter(record) -> bool:
+    return record["level"].no >= _log_state["min_level_no"]
+
+
+def _set_log_level(level: str) -> None:
+    """
+    Change the minimum level of the application log handlers.
+
+    The first call replaces the startup handlers with stderr, rotating file
+    and in-memory buffer handlers that read the threshold through a filter; later
+    calls only move the threshold, so no handler or file is reopened.
+    """
+    _log_state["min_level_no"] = logger.level(level).no
+    if _log_state["handlers_installed"]:
+        return
+
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG", filter=_runtime_level_filter)
+    logger.add(
+        _LOG_PATH,
+        rotation="500 MB",
+        retention="10 days",
+        level="DEBUG",
+        filter=_runtime_level_filter,
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+    )
+    logger.add(log_buffer_sink, level="DEBUG", filter=_runtime_level_filter)
+    _log_state["handlers_installed"] = True
+
+
 @router.post("/settings", response_model=RuntimeSettingsResponse)
 async def update_runtime_settings(
     data: RuntimeSettingsUpdate,
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_super_admin_user),
-    db: Session = Depends(get_db),
 ):
     """
     Update runtime settings (Super Admin only).
@@ -99,28 +157,21 @@ async def update_runtime_settings(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid log level. Must be one of: {', '.join(valid_levels)}",
             )
-        _runtime_settings["log_level"] = level
-        # Reconfigure loguru
-        logger.remove()
-        logger.add(sys.stderr, level=level)
-        logger.add(
-            "logs/app.log",
-            rotation="500 MB",
-            retention="10 days",
-            level=level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
-        )
+        if level != _runtime_settings["log_level"]:
+            _runtime_settings["log_level"] = level
+            _set_log_level(level)
         changes["log_level"] = level
 
-    AuditService.log_action(
-        db=db,
+    # Audit entry is written after the response is sent
+    background_tasks.add_task(
+        AuditService.log_action_detached,
         user_id=current_user.id,
         tenant_id=None,
         action="system.settings_updated",
         resource="system",
         details={"changes": changes},
         status=AuditStatus.SUCCESS,
-        request=request,
+        **AuditService.get_request_meta(request),
     )
 
     return RuntimeSettingsResponse(**_runtime_settings)
@@ -128,329 +179,614 @@ async def update_runtime_settings(
 
 # ── System Info Endpoint ─────────────────────────────────────────────────────
 
-@router.get("/system-info")
-async def get_system_info(
-    current_user: User = Depends(get_super_admin_user),
-    db: Session = Depends(get_db),
-):
-    """
-    Get system information including versions, connection statuses,
-    migration version, uptime, and masked environment variables.
-    """
-    import fastapi as _fastapi
-
-    # Database status
+async def _collect_system_info(db: Session) -> dict:
+    """Gather the system-info fields that don't change second to second."""
+    # Database status + Alembic migration version in one round trip.
+    # The engine uses pool_pre_ping, so the checkout behind this query has
+    # already proven the connection is alive; no separate SELECT 1 needed.
     db_status = "connected"
+    migration_version = "unknown"
     try:
-        from sqlalchemy import text
-        db.execute(text("SELECT 1"))
+        row = db.execute(text(
+            "SELECT 1 AS ok, "
+            "(SELECT version_num FROM alembic_version LIMIT 1) AS version"
+        )).fetchone()
+        if row and row.version:
+            migration_version = row.version
+    except ProgrammingError:
+        # The server answered (e.g. alembic_version doesn't exist yet),
+        # so the database itself is reachable
+        db.rollback()
     except Exception as e:
         db_status = f"disconnected: {e}"
 
     # Redis status
     redis_status = "not_configured"
     try:
-        from app.middleware.rate_limiter import rate_limiter
         if rate_limiter.redis_client:
             await rate_limiter.redis_client.ping()
             redis_status = "connected"
     except Exception as e:
         redis_status = f"disconnected: {e}"
 
-    # Alembic migration version
-    migration_version = "unknown"
-    try:
-        from sqlalchemy import text
-        result = db.execute(text("SELECT version_num FROM alembic_version"))
-        row = result.fetchone()
-        if row:
-            migration_version = row[0]
-    except Exception:
-        pass
-
-    # Uptime
-    uptime_seconds = int(time.time() - _server_start_time)
-    hours, remainder = divmod(uptime_seconds, 3600)
-    minutes, secs = divmod(remainder, 60)
-    uptime_str = f"{hours}h {minutes}m {secs}s"
-
-    # Masked environment variables
-    env_vars = {}
-    for key, value in sorted(os.environ.items()):
-        if _SENSITIVE_PATTERNS.search(key):
-            env_vars[key] = "********"
-        else:
-            env_vars[key] = value
-
     return {
-        "python_version": sys.version,
-        "fastapi_version": _fastapi.__version__,
-        "platform": platform.platform(),
+        "python_version": _PYTHON_VERSION,
+        "fastapi_version": _FASTAPI_VERSION,
+        "platform": _PLATFORM,
         "database_status": db_status,
         "redis_status": redis_status,
         "migration_version": migration_version,
-        "uptime": uptime_str,
-        "uptime_seconds": uptime_seconds,
-        "env_vars": env_vars,
     }
 
 
-# ── Application Logs Endpoint ────────────────────────────────────────────────
+def _masked_env_vars() -> dict:
+    """Environment variables sorted by name, with sensitive values masked."""
+    env_vars = {}
+    for key in sorted(os.environ):
+        key_upper = key.upper()
+        if any(token in key_upper for token in _SENSITIVE_TOKENS):
+            env_vars[key] = "********"
+        else:
+            env_vars[key] = os.environ[key]
+    return env_vars
 
-@router.get("/logs", response_model=List[LogEntry])
-async def get_application_logs(
-    level: Optional[str] = Query(None, description="Filter by log level"),
-    limit: int = Query(100, ge=1, le=1000, description="Max entries to return"),
-    offset: int = Query(0, ge=0, description="Number of entries to skip"),
+
+@router.get("/system-info")
+async def get_system_info(
+    include_env: bool = Query(False, description="Include masked environment variables"),
     current_user: User = Depends(get_super_admin_user),
+    db: Session = Depends(get_db),
 ):
     """
-    Read recent application log entries from logs/app.log.
+    Get system information including versions, connection statuses,
+    migration version, uptime, and (with include_env) masked environment
+    variables.
 
-    Returns parsed log entries with timestamp, level, and message.
+    The snapshot is cached in Redis for a few seconds so repeated polling
+    from the admin dashboard doesn't re-probe the database on every
+    request. Uptime is always computed fresh; env vars are never cached.
     """
-    log_path = "logs/app.log"
-    entries: List[LogEntry] = []
+    redis_client = rate_limiter.redis_client
+
+    info = None
+    if redis_client:
+        try:
+            cached = await redis_client.get(_SYSTEM_INFO_CACHE_KEY)
+            if cached:
+                info = orjson.loads(cached)
+        except Exception:
+            info = None
+
+    if info is None:
+        info = await _collect_system_info(db)
+        if redis_client:
+            try:
+                await redis_client.set(
+                    _SYSTEM_INFO_CACHE_KEY,
+                    orjson.dumps(info),
+                    ex=_SYSTEM_INFO_CACHE_TTL,
+                )
+            except Exception:
+                pass
 
-    if not os.path.isfile(log_path):
-        return entries
+    # Uptime
+    uptime_seconds = int(time.time() - _server_start_time)
+    hours, remainder = divmod(uptime_seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    info["uptime"] = f"{hours}h {minutes}m {secs}s"
+    info["uptime_seconds"] = uptime_seconds
 
-    try:
-        with open(log_path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-    except Exception:
-        return entries
+    if include_env:
+        info["env_vars"] = _masked_env_vars()
+
+    return info
+
+
+# ── Application Logs Endpoint ────────────────────────────────────────────────
+
+def _iter_log_lines_reversed(log_path: str) -> Iterator[bytes]:
+    """
+    Yield raw lines of a log file newest-first, without the trailing newline.
+
+    The file is memory-mapped and scanned backwards for newlines, so only
+    the pages holding the lines actually consumed are read from disk.
+    """
+    with open(log_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0:
+                start = mm.rfind(b"\n", 0, end) + 1
+                yield mm[start:end]
+                end = start - 1
+
+
+def _read_log_entries(
+    log_path: str, level: Optional[str], offset: int, limit: int
+) -> List[LogEntry]:
+    """
+    Return up to `limit` log entries, newest first, after skipping `offset`
+    matching entries.
+
+    Walks the file backwards from EOF and stops as soon as the newest
+    `offset + limit` matching lines have been found. Lines are split and
+    filtered as bytes; only the entries actually returned are decoded and
+    turned into LogEntry objects. Loguru writes the level unpadded and
+    upper-case, so it is compared to the filter as is.
+    """
+    entries: List[LogEntry] = []
+    level_filter = level.upper().encode() if level else None
+    need = offset + limit
+    skipped = 0
 
     # Parse lines (format: "YYYY-MM-DD HH:mm:ss | LEVEL | message")
-    for line in reversed(lines):
-        line = line.strip()
+    for line in _iter_log_lines_reversed(log_path):
+        # The newline is already gone; drop a CR left by CRLF line endings
+        if line.endswith(b"\r"):
+            line = line[:-1]
         if not line:
             continue
 
-        parts = line.split(" | ", 2)
+        # Without a level filter every line matches, so lines inside
+        # the offset don't need parsing at all.
+        if not level_filter and skipped < offset:
+            skipped += 1
+            continue
+
+        parts = line.split(b" | ", 2)
         if len(parts) == 3:
             ts, lvl, msg = parts
-            lvl = lvl.strip()
         else:
             # Unparseable line — treat as INFO
-            ts = ""
-            lvl = "INFO"
+            ts = b""
+            lvl = b"INFO"
             msg = line
 
-        if level and lvl.upper() != level.upper():
+        if level_filter and lvl != level_filter:
             continue
 
-        entries.append(LogEntry(timestamp=ts, level=lvl, message=msg))
+        if skipped < offset:
+            skipped += 1
+            continue
+
+        entries.append(LogEntry(
+            timestamp=ts.decode("utf-8", errors="replace"),
+            level=lvl.decode("utf-8", errors="replace"),
+            message=msg.decode("utf-8", errors="replace"),
+        ))
+        if skipped + len(entries) >= need:
+            break
 
-    # Apply offset + limit after filtering
-    entries = entries[offset : offset + limit]
     return entries
 
 
-# ── Existing Endpoints (seed-data, reset-database) ───────────────────────────
+def _read_buffered_log_entries(
+    level: Optional[str], offset: int, limit: int
+) -> Optional[List[LogEntry]]:
+    """
+    Serve a page of log entries from this process's in-memory log buffer.
 
-@router.post("/seed-data")
-async def seed_dummy_data(
-    request: Request,
+    Returns None when the buffer doesn't hold `offset + limit` matching
+    records, so the caller can fall back to reading the log file.
+    """
+    level_filter = level.upper() if level else None
+    need = offset + limit
+    matched: List[Tuple[str, str, str]] = []
+
+    for ts, lvl, msg in reversed(list(log_buffer)):
+        if level_filter and lvl != level_filter:
+            continue
+        matched.append((ts, lvl, msg))
+        if len(matched) >= need:
+            break
+    else:
+        return None
+
+    return [
+        LogEntry(timestamp=ts, level=lvl, message=msg)
+        for ts, lvl, msg in matched[offset:]
+    ]
+
+
+@router.get("/logs", response_model=List[LogEntry])
+async def get_application_logs(
+    level: Optional[str] = Query(None, description="Filter by log level"),
+    limit: int = Query(100, ge=1, le=1000, description="Max entries to return"),
+    offset: int = Query(0, ge=0, description="Number of entries to skip"),
     current_user: User = Depends(get_super_admin_user),
-    db: Session = Depends(get_db)
 ):
     """
-    Seed database with dummy tenants, branches, and users (Super Admin only)
+    Read recent application log entries.
+
+    Returns log entries with timestamp, level, and message, read from
+    logs/app.log in the threadpool so a slow disk doesn't stall the event
+    loop. On a single-worker server the first page comes straight from the
+    in-memory log buffer instead: with several workers each buffer only
+    holds its own worker's records, and deeper pages must count offsets
+    over the same lines as the file (a multi-line record is one buffer
+    entry but several file lines).
+    """
+    if settings.WEB_CONCURRENCY == 1 and offset == 0:
+        entries = _read_buffered_log_entries(level, offset, limit)
+        if entries is not None:
+            return entries
 
-    Creates:
-    - 3 demo tenants (free, basic, premium tiers)
-    - Multiple branches for each tenant
-    - Multiple users with different roles for each tenant
+    if not os.path.isfile(_LOG_PATH):
+        return []
+
+    try:
+        return await run_in_threadpool(_read_log_entries, _LOG_PATH, level, offset, limit)
+    except Exception:
+        return []
+
+
+# ── Background jobs (seed-data, reset-database) ─────────────────────────────
+#
+# Seeding and resetting run many INSERTs / bcrypt hashes / cascading DELETEs.
+# They are executed via BackgroundTasks on their own session so the request
+# returns 202 immediately; progress is polled through GET /jobs/{task_id}.
+# Job records live in the background_jobs table (BackgroundJobService), so
+# any worker can answer the poll.
+
+def _run_job(
+    task_id: str,
+    action: str,
+    work: Callable[[Session], Tuple[dict, dict]],
+    user_id: uuid.UUID,
+    request_meta: dict,
+):
     """
+    Execute a background job with its own database session.
 
+    ``work`` returns ``(result, audit_details)`` without committing; the job
+    commits the work together with its audit entry in a single transaction.
+    """
+    BackgroundJobService.start(task_id)
+
+    db = SessionLocal()
     try:
-        # Dummy data configuration
-        tenants_data = [
-            {
-                "name": "Acme Corporation",
-                "subdomain": "acme",
-                "tier": "premium",
-                "max_users": 100,
-                "max_branches": 20,
-                "max_storage_gb": 50
-            },
-            {
-                "name": "TechStart Inc",
-                "subdomain": "techstart",
-                "tier": "basic",
-                "max_users": 20,
-                "max_branches": 5,
-                "max_storage_gb": 10
-            },
-            {
-                "name": "Demo Company",
-                "subdomain": "demo",
-                "tier": "free",
-                "max_users": 5,
-                "max_branches": 1,
-                "max_storage_gb": 1
-            }
-        ]
+        result, audit_details = work(db)
+        # The summary audit row rides on the job's own transaction
+        AuditService.log_action(
+            db=db,
+            user_id=user_id,
+            tenant_id=None,
+            action=action,
+            resource="system",
+            details=audit_details,
+            status=AuditStatus.SUCCESS,
+            commit=False,
+            **request_meta,
+        )
+        db.commit()
+        invalidate_stats_cache()
+        BackgroundJobService.complete(task_id, result)
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Background job {action} ({task_id}) failed")
+        BackgroundJobService.fail(task_id, str(e))
+        AuditService.log_action(
+            db=db,
+            user_id=user_id,
+            tenant_id=None,
+            action=action,
+            resource="system",
+            details={"error": str(e)},
+            status=AuditStatus.ERROR,
+            **request_meta,
+        )
+    finally:
+        db.close()
+
+
+# Demo users created for every seeded tenant: (role, password)
+_SEED_USER_ROLES = [
+    (TenantRole.OWNER, "owner123"),
+    (TenantRole.ADMIN, "admin123"),
+    (TenantRole.MEMBER, "member123"),
+]
+
+# Column order must match the tuples yielded by _iter_seed_user_rows
+_SEED_USER_COLUMNS = (
+    "id", "tenant_id", "default_branch_id", "email", "password_hash",
+    "first_name", "last_name", "full_name", "tenant_role", "permissions",
+    "meta_data", "is_verified", "email_verified_at", "is_active",
+)
+# JSON columns are yielded as JSON text, which is what COPY expects
+_SEED_USER_JSON_COLUMNS = ("permissions", "meta_data")
+_SEED_USER_COPY_SQL = f"COPY users ({', '.join(_SEED_USER_COLUMNS)}) FROM STDIN"
+
+
+def _iter_seed_user_rows(
+    seeded_tenants: List[Tuple[uuid.UUID, dict, uuid.UUID]],
+) -> Iterator[tuple]:
+    """
+    Yield one COPY row per demo user so memory stays constant.
 
-        created_tenants = []
-        created_users = []
-        created_branches = []
-
-        for tenant_data in tenants_data:
-            # Check if tenant already exists
-            existing_tenant = db.query(Tenant).filter(
-                Tenant.subdomain == tenant_data["subdomain"]
-            ).first()
-
-            if existing_tenant:
-                continue  # Skip if already exists
-
-            # Create tenant
-            tenant = Tenant(**tenant_data)
-            db.add(tenant)
-            db.flush()  # Get tenant ID
-            created_tenants.append(tenant)
-
-            # Create HQ branch
-            hq_branch = Branch(
-                tenant_id=tenant.id,
-                name="Head Office",
-                code="HQ",
-                is_hq=True
+    ``seeded_tenants`` holds ``(tenant_id, tenant_data, hq_branch_id)`` tuples.
+    """
+    verified_at = datetime.utcnow()
+    # bcrypt is deliberately slow: hash each distinct password once, not per tenant
+    password_hashes = {password: get_password_hash(password) for _, password in _SEED_USER_ROLES}
+
+    for tenant_id, tenant_data, hq_branch_id in seeded_tenants:
+        tenant_name = tenant_data["name"]
+        for role, password in _SEED_USER_ROLES:
+            label = role.value.capitalize()
+            yield (
+                uuid.uuid4(),
+                tenant_id,
+                hq_branch_id,
+                f"{role.value}@{tenant_data['subdomain']}.com",
+                password_hashes[password],
+                tenant_name,
+                label,
+                f"{tenant_name} {label}",
+                role.value,
+                "[]",
+                "{}",
+                True,
+                verified_at,
+                True,
             )
-            db.add(hq_branch)
-            db.flush()
-            created_branches.append(hq_branch)
 
-            # Create additional branches (except for free tier)
-            if tenant.tier != "free":
+
+def _copy_seed_users(db: Session, rows: Iterable[tuple]) -> int:
+    """
+    Stream user rows into the users table with COPY FROM STDIN.
+
+    Runs on the session's own connection, so the rows share the seed
+    transaction with the tenant/branch inserts and roll back with them.
+
+    COPY bypasses the ORM entirely: no mapper events fire and no Python-side
+    column defaults are applied, which is why _iter_seed_user_rows supplies
+    every column (id, permissions, meta_data, ...) explicitly.
+    """
+    count = 0
+    with db.connection().connection.cursor() as cursor:
+        with cursor.copy(_SEED_USER_COPY_SQL) as copy:
+            for row in rows:
+                copy.write_row(row)
+                count += 1
+    return count
+
+
+def _bulk_insert_seed_users(db: Session, rows: Iterable[tuple]) -> int:
+    """Insert user rows with a single executemany INSERT (any dialect)."""
+    mappings = []
+    for row in rows:
+        mapping = dict(zip(_SEED_USER_COLUMNS, row))
+        for column in _SEED_USER_JSON_COLUMNS:
+            mapping[column] = json.loads(mapping[column])
+        mappings.append(mapping)
+    if mappings:
+        db.execute(insert(User), mappings)
+    return len(mappings)
+
+
+def _insert_seed_users(db: Session, rows: Iterable[tuple]) -> int:
+    """
+    Bulk-load demo users, using COPY on PostgreSQL and a single executemany
+    INSERT on any other dialect (e.g. SQLite in local experiments).
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _copy_seed_users(db, rows)
+    return _bulk_insert_seed_users(db, rows)
+
+
+def _seed_dummy_data(db: Session) -> Tuple[dict, dict]:
+    """
+    Create the demo tenants, branches, and users.
+
+    Runs a fixed number of statements no matter how many tenants are
+    seeded: one lookup of existing subdomains, one insert().returning() for
+    tenants, one for branches, and one bulk load for users. Nothing is
+    committed here; _run_job commits together with the audit entry.
+    """
+    # Dummy data configuration
+    tenants_data = [
+        {
+            "name": "Acme Corporation",
+            "subdomain": "acme",
+            "tier": "premium",
+            "max_users": 100,
+            "max_branches": 20,
+            "max_storage_gb": 50
+        },
+        {
+            "name": "TechStart Inc",
+            "subdomain": "techstart",
+            "tier": "basic",
+            "max_users": 20,
+            "max_branches": 5,
+            "max_storage_gb": 10
+        },
+        {
+            "name": "Demo Company",
+            "subdomain": "demo",
+            "tier": "free",
+            "max_users": 5,
+            "max_branches": 1,
+            "max_storage_gb": 1
+        }
+    ]
+
+    # Look up which demo tenants already exist in a single query
+    existing_subdomains = set(db.scalars(
+        select(Tenant.subdomain).where(
+            Tenant.subdomain.in_([t["subdomain"] for t in tenants_data])
+        )
+    ).all())
+    new_tenants = [t for t in tenants_data if t["subdomain"] not in existing_subdomains]
+
+    # Plain copies for the response / audit details, so nothing reads
+    # ORM attributes after the job commits
+    created_tenants = [
+        {"name": t["name"], "subdomain": t["subdomain"], "tier": t["tier"]}
+        for t in new_tenants
+    ]
+    branches_created = 0
+    seeded_tenants = []
+
+    if new_tenants:
+        # Create tenants in one batched INSERT ... RETURNING
+        tenant_ids = db.scalars(
+            insert(Tenant).returning(Tenant.id, sort_by_parameter_order=True),
+            new_tenants,
+        ).all()
+
+        # Create HQ + additional branches (except for free tier) in one batch
+        branch_rows = []
+        for tenant_id, tenant_data in zip(tenant_ids, new_tenants):
+            branch_rows.append(
+                {"tenant_id": tenant_id, "name": "Head Office", "code": "HQ", "is_hq": True}
+            )
+
+            if tenant_data["tier"] != "free":
                 additional_branches = [
                     {"name": "New York Office", "code": "NY"},
                     {"name": "London Office", "code": "LON"},
                 ]
 
-                if tenant.tier == "premium":
+                if tenant_data["tier"] == "premium":
                     additional_branches.extend([
                         {"name": "Tokyo Office", "code": "TKY"},
                         {"name": "Singapore Office", "code": "SG"},
                     ])
 
                 for branch_data in additional_branches:
-                    branch = Branch(
-                        tenant_id=tenant.id,
-                        **branch_data
-                    )
-                    db.add(branch)
-                    db.flush()
-                    created_branches.append(branch)
-
-            # Create users with different roles
-            users_to_create = [
-                {
-                    "email": f"owner@{tenant.subdomain}.com",
-                    "password": "owner123",
-                    "full_name": f"{tenant.name} Owner",
-                    "first_name": f"{tenant.name}",
-                    "last_name": "Owner",
-                    "tenant_role": TenantRole.OWNER,
-                    "branch": hq_branch
-                },
-                {
-                    "email": f"admin@{tenant.subdomain}.com",
-                    "password": "admin123",
-                    "full_name": f"{tenant.name} Admin",
-                    "first_name": f"{tenant.name}",
-                    "last_name": "Admin",
-                    "tenant_role": TenantRole.ADMIN,
-                    "branch": hq_branch
-                },
-                {
-                    "email": f"member@{tenant.subdomain}.com",
-                    "password": "member123",
-                    "full_name": f"{tenant.name} Member",
-                    "first_name": f"{tenant.name}",
-                    "last_name": "Member",
-                    "tenant_role": TenantRole.MEMBER,
-                    "branch": hq_branch
-                },
+                    branch_rows.append({"tenant_id": tenant_id, "is_hq": False, **branch_data})
+
+        created_branch_rows = db.execute(
+            insert(Branch).returning(
+                Branch.id, Branch.tenant_id, Branch.is_hq, sort_by_parameter_order=True
+            ),
+            branch_rows,
+        ).all()
+        branches_created = len(created_branch_rows)
+        hq_by_tenant = {row.tenant_id: row.id for row in created_branch_rows if row.is_hq}
+
+        seeded_tenants = [
+            (tenant_id, tenant_data, hq_by_tenant[tenant_id])
+            for tenant_id, tenant_data in zip(tenant_ids, new_tenants)
+        ]
+
+    # Create users with different roles (streamed in one COPY on PostgreSQL)
+    users_created = _insert_seed_users(db, _iter_seed_user_rows(seeded_tenants))
+
+    result = {
+        "message": "Dummy data seeded successfully",
+        "created": {
+            "tenants": len(created_tenants),
+            "branches": branches_created,
+            "users": users_created
+        },
+        "details": {
+            "tenants": created_tenants,
+            "sample_credentials": [
+                {"tenant": "acme", "email": "owner@acme.com", "password": "owner123", "role": "owner"},
+                {"tenant": "techstart", "email": "owner@techstart.com", "password": "owner123", "role": "owner"},
+                {"tenant": "demo", "email": "owner@demo.com", "password": "owner123", "role": "owner"}
             ]
+        }
+    }
+    audit_details = {
+        "tenants_created": len(created_tenants),
+        "branches_created": branches_created,
+        "users_created": users_created,
+        "tenant_names": [t["name"] for t in created_tenants]
+    }
+    return result, audit_details
 
-            for user_data in users_to_create:
-                branch = user_data.pop("branch")
-                password = user_data.pop("password")
-
-                user = User(
-                    tenant_id=tenant.id,
-                    default_branch_id=branch.id,
-                    password_hash=get_password_hash(password),
-                    is_verified=True,
-                    email_verified_at=datetime.utcnow(),
-                    **user_data
-                )
-                db.add(user)
-                created_users.append(user)
 
-        db.commit()
+def _reset_database(db: Session) -> Tuple[dict, dict]:
+    """Delete all tenant data, preserving system users."""
+    # Order matters due to foreign key constraints!
+    # Plain DELETE statements: the job session holds no loaded rows, so
+    # there's nothing to synchronize and no need to SELECT the PKs first.
+    # (TRUNCATE ... CASCADE is not an option — users.tenant_id references
+    # tenants, so it would also wipe the system users we keep.)
+    no_sync = {"synchronize_session": False}
 
-        # Log audit event for seeding data
-        AuditService.log_action(
-            db=db,
-            user_id=current_user.id,
-            tenant_id=None,
-            action="system.seed_data",
-            resource="system",
-            details={
-                "tenants_created": len(created_tenants),
-                "branches_created": len(created_branches),
-                "users_created": len(created_users),
-                "tenant_names": [t.name for t in created_tenants]
-            },
-            status=AuditStatus.SUCCESS,
-            request=request
-        )
+    # Nothing to delete (e.g. reset clicked twice in a row) — skip the
+    # DELETEs; tenant users and branches can't exist without a tenant.
+    has_tenants = db.scalar(select(select(Tenant.id).exists()))
 
-        return {
-            "message": "Dummy data seeded successfully",
-            "created": {
-                "tenants": len(created_tenants),
-                "branches": len(created_branches),
-                "users": len(created_users)
-            },
-            "details": {
-                "tenants": [{"name": t.name, "subdomain": t.subdomain, "tier": t.tier} for t in created_tenants],
-                "sample_credentials": [
-                    {"tenant": "acme", "email": "owner@acme.com", "password": "owner123", "role": "owner"},
-                    {"tenant": "techstart", "email": "owner@techstart.com", "password": "owner123", "role": "owner"},
-                    {"tenant": "demo", "email": "owner@demo.com", "password": "owner123", "role": "owner"}
-                ]
-            }
-        }
+    deleted_users = deleted_branches = deleted_tenants = 0
+    if has_tenants:
+        # 1. First delete tenant users (non-super-admin)
+        deleted_users = db.execute(
+            delete(User).where(User.tenant_id.isnot(None)),  # Only delete users with tenant_id
+            execution_options=no_sync,
+        ).rowcount
 
-    except Exception as e:
-        db.rollback()
-        # Log failed seed attempt
-        AuditService.log_action(
-            db=db,
-            user_id=current_user.id,
-            tenant_id=None,
-            action="system.seed_data",
-            resource="system",
-            details={"error": str(e)},
-            status=AuditStatus.ERROR,
-            request=request
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to seed data: {str(e)}"
-        )
+        # 2. Delete branches
+        deleted_branches = db.execute(delete(Branch), execution_options=no_sync).rowcount
+
+        # 3. Finally delete tenants
+        deleted_tenants = db.execute(delete(Tenant), execution_options=no_sync).rowcount
+
+    # Count remaining system admins
+    remaining_super_admins = db.query(User).filter(
+        User.system_role.isnot(None)
+    ).count()
+
+    result = {
+        "message": "Database reset successfully" if has_tenants else "Database already clean",
+        "deleted": {
+            "tenants": deleted_tenants,
+            "branches": deleted_branches,
+            "users": deleted_users
+        },
+        "preserved": {
+            "super_admins": remaining_super_admins
+        },
+    }
+    if has_tenants:
+        result["warning"] = "All tenant data has been permanently deleted"
+    audit_details = {
+        "tenants_deleted": deleted_tenants,
+        "branches_deleted": deleted_branches,
+        "users_deleted": deleted_users,
+        "super_admins_preserved": remaining_super_admins
+    }
+    return result, audit_details
 
 
-@router.post("/reset-database")
-async def reset_database(
+@router.post("/seed-data", status_code=status.HTTP_202_ACCEPTED)
+def seed_dummy_data(
     request: Request,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_super_admin_user),
+):
+    """
+    Seed database with dummy tenants, branches, and users (Super Admin only)
+
+    Creates:
+    - 3 demo tenants (free, basic, premium tiers)
+    - Multiple branches for each tenant
+    - Multiple users with different roles for each tenant
+
+    Runs in the background; poll GET /jobs/{task_id} for the result.
+    """
+    task_id = BackgroundJobService.create("system.seed_data")
+    background_tasks.add_task(
+        _run_job,
+        task_id,
+        "system.seed_data",
+        _seed_dummy_data,
+        current_user.id,
+        AuditService.get_request_meta(request),
+    )
+    return {"status": "accepted", "task_id": task_id}
+
+
+@router.post("/reset-database", status_code=status.HTTP_202_ACCEPTED)
+def reset_database(
+    request: Request,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_super_admin_user),
-    db: Session = Depends(get_db)
 ):
     """
     Reset database to clean state (Super Admin only)
@@ -460,72 +796,30 @@ async def reset_database(
     - Preserves super admin users
 
     Use this for testing or fresh installation.
+    Runs in the background; poll GET /jobs/{task_id} for the result.
     """
+    task_id = BackgroundJobService.create("system.reset_database")
+    background_tasks.add_task(
+        _run_job,
+        task_id,
+        "system.reset_database",
+        _reset_database,
+        current_user.id,
+        AuditService.get_request_meta(request),
+    )
+    return {"status": "accepted", "task_id": task_id}
 
-    try:
-        # Order matters due to foreign key constraints!
-        # 1. First delete tenant users (non-super-admin)
-        deleted_users = db.query(User).filter(
-            User.tenant_id.isnot(None)  # Only delete users with tenant_id
-        ).delete(synchronize_session='fetch')
-
-        # 2. Delete branches
-        deleted_branches = db.query(Branch).delete(synchronize_session='fetch')
-
-        # 3. Finally delete tenants
-        deleted_tenants = db.query(Tenant).delete(synchronize_session='fetch')
-
-        db.commit()
-
-        # Count remaining system admins
-        remaining_super_admins = db.query(User).filter(
-            User.system_role.isnot(None)
-        ).count()
-
-        # Log audit event for database reset
-        AuditService.log_action(
-            db=db,
-            user_id=current_user.id,
-            tenant_id=None,
-            action="system.reset_database",
-            resource="system",
-            details={
-                "tenants_deleted": deleted_tenants,
-                "branches_deleted": deleted_branches,
-                "users_deleted": deleted_users,
-                "super_admins_preserved": remaining_super_admins
-            },
-            status=AuditStatus.SUCCESS,
-            request=request
-        )
-
-        return {
-            "message": "Database reset successfully",
-            "deleted": {
-                "tenants": deleted_tenants,
-                "branches": deleted_branches,
-                "users": deleted_users
-            },
-            "preserved": {
-                "super_admins": remaining_super_admins
-            },
-            "warning": "All tenant data has been permanently deleted"
-        }
 
-    except Exception as e:
-        db.rollback()
-        # Log failed reset attempt
-        AuditService.log_action(
-            db=db,
-            user_id=current_user.id,
-            tenant_id=None,
-            action="system.reset_database",
-            resource="system",
-            details={"error": str(e)},
-            status=AuditStatus.ERROR,
-            request=request
-        )
+@router.get("/jobs/{task_id}")
+def get_job_status(
+    task_id: str,
+    current_user: User = Depends(get_super_admin_user),
+):
+    """Get the status and result of a seed-data / reset-database job."""
+    job = BackgroundJobService.get(task_id)
+    if not job or job["action"] not in ("system.seed_data", "system.reset_database"):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to reset database: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
         )
+    return job
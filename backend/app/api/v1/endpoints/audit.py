@@ -5,26 +5,42 @@ Endpoints for viewing audit logs. Super admins see all logs system-wide;
 tenant admins see only their own tenant's logs. Access is controlled via
 the AUDIT_VIEW permission.
 """
-from fastapi import APIRouter, Depends, Query, HTTPException, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, distinct
-from typing import Optional, List
+from sqlalchemy import delete, func, distinct, literal, select, text, tuple_
+from typing import Callable, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID
+import asyncio
+import base64
+import gzip
+import io
+import ipaddress
 import json
+import orjson
 import os
+import re
+import stat
 from pathlib import Path
 
+import anyio
+from loguru import logger
+
 from fastapi import Request
-from app.core.database import get_db
+from app.core.cache import ttl_cache
+from app.core.database import SessionLocal, get_db
 from app.api.deps import require_permission, get_super_admin_user, get_current_tenant
 from app.core.permissions import Permission
+from app.middleware.rate_limiter import rate_limiter
 from app.models.tenant import Tenant
 from app.config import settings
 from app.models.user import User
 from app.models.audit_log import AuditLog, AuditAction, AuditStatus
 from app.services.audit_service import AuditService
+from app.services.audit_stats_service import AuditStatsService
+from app.services.background_job_service import BackgroundJobService
 from app.schemas.audit import (
     AuditLogResponse,
     AuditLogListResponse,
@@ -34,8 +50,22 @@ from app.schemas.audit import (
 # Archive directory
 ARCHIVE_DIR = Path("archives/audit")
 ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
-
-router = APIRouter(prefix="/admin/audit-logs", tags=["Admin - Audit"])
+ARCHIVE_SUFFIX = ".json.gz"
+ARCHIVE_META_SUFFIX = ".meta.json"
+# Buffer size on both sides of the archive compressor: rows are batched
+# before compression and compressed output before it hits the disk
+ARCHIVE_WRITE_BUFFER_SIZE = 1024 * 1024
+# Names produced by the archive job (.json before archives were gzipped)
+_ARCHIVE_NAME_RE = re.compile(r"audit_archive_\d{8}_\d{6}\.json(\.gz)?")
+
+# background_jobs action of archive jobs
+_ARCHIVE_JOB_ACTION = "audit_logs.archive"
+
+router = APIRouter(
+    prefix="/admin/audit-logs",
+    tags=["Admin - Audit"],
+    default_response_class=ORJSONResponse,
+)
 
 
 def _apply_tenant_scope(query, current_user: User, tenant_id_param: Optional[UUID] = None):
@@ -45,17 +75,104 @@ def _apply_tenant_scope(query, current_user: User, tenant_id_param: Optional[UUI
     - Super admins: no automatic scoping; may optionally filter by tenant_id param
     - Other roles: always scoped to current_user.tenant_id
     """
-    if current_user.role == "super_admin":
-        if tenant_id_param:
-            query = query.filter(AuditLog.tenant_id == tenant_id_param)
-    else:
-        query = query.filter(AuditLog.tenant_id == current_user.tenant_id)
-    return query
+    all_tenants, tenant_id = _cache_scope(current_user)
+    if all_tenants and tenant_id_param:
+        all_tenants, tenant_id = False, tenant_id_param
+    return _scope_to_tenant(query, all_tenants, tenant_id)
+
+
+# Columns read by the list endpoint and written to archives, in the order
+# _log_response_dict / _archive_log_dict unpack them
+_AUDIT_LOG_COLUMNS = (
+    AuditLog.id,
+    AuditLog.user_id,
+    AuditLog.tenant_id,
+    AuditLog.action,
+    AuditLog.resource,
+    AuditLog.resource_id,
+    AuditLog.details,
+    AuditLog.status,
+    AuditLog.ip_address,
+    AuditLog.user_agent,
+    AuditLog.request_id,
+    AuditLog.created_at,
+)
+# Rows deleted by the archive job also carry is_active, so the rollups only
+# lose the rows they counted
+_ARCHIVE_COLUMNS = (*_AUDIT_LOG_COLUMNS, AuditLog.is_active)
+
+
+def _log_response_dict(row) -> dict:
+    """
+    AuditLogResponse-shaped dict of one _AUDIT_LOG_COLUMNS row, built
+    without model validation; orjson encodes the UUIDs and datetimes.
+    """
+    return {
+        "id": row.id,
+        "user_id": row.user_id,
+        "tenant_id": row.tenant_id,
+        "action": row.action,
+        "resource": row.resource,
+        "resource_id": row.resource_id,
+        "details": row.details,
+        "status": row.status,
+        "ip_address": row.ip_address,
+        "user_agent": row.user_agent,
+        "request_id": row.request_id,
+        "timestamp": row.created_at,
+    }
+
+
+def _is_ip_address(value: str) -> bool:
+    """Whether `value` is a complete IPv4 / IPv6 address."""
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _encode_audit_cursor(log) -> str:
+    """Opaque keyset cursor pointing just past the given log."""
+    raw = json.dumps({"t": log.created_at.isoformat(), "id": str(log.id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_audit_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(data["t"]), UUID(data["id"])
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _estimate_audit_log_count(db: Session) -> Optional[int]:
+    """
+    Row estimate for the whole audit_logs table from planner statistics.
+
+    Avoids a full COUNT(*) on an unfiltered listing. Returns None when no
+    estimate is available (non-PostgreSQL, or the table hasn't been
+    analyzed yet) so the caller can fall back to an exact count.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = db.execute(
+        # regclass resolves the table through search_path, so a same-named
+        # table in another schema can't be picked up
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'audit_logs'::regclass")
+    ).scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
 
 
 @router.get("/", response_model=AuditLogListResponse)
 def get_audit_logs(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (deprecated; use cursor)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of records to return"),
     action: Optional[str] = Query(None, description="Filter by action type"),
     resource: Optional[str] = Query(None, description="Filter by resource type"),
@@ -65,6 +182,7 @@ def get_audit_logs(
     start_date: Optional[datetime] = Query(None, description="Filter logs after this date"),
     end_date: Optional[datetime] = Query(None, description="Filter logs before this date"),
     search: Optional[str] = Query(None, description="Search in request_id or IP address"),
+    with_total: bool = Query(False, description="Also return the total number of matching logs"),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission(Permission.AUDIT_VIEW)),
 ):
@@ -73,9 +191,14 @@ def get_audit_logs(
 
     Tenant admins see only their own tenant's logs.
     Super admins see all logs and may optionally filter by tenant_id.
+
+    The total is only computed when with_total is set; use has_more to
+    drive next-page navigation. Pass next_cursor back as cursor to fetch
+    the following page: keyset pagination on (created_at, id) costs the
+    same at any depth, unlike skip.
     """
-    # Build base query
-    query = db.query(AuditLog).filter(AuditLog.is_active == True)
+    # Build base query over plain columns: no ORM objects per row
+    query = db.query(*_AUDIT_LOG_COLUMNS).filter(AuditLog.is_active == True)
 
     # Apply tenant scoping
     query = _apply_tenant_scope(query, current_user, tenant_id)
@@ -94,31 +217,114 @@ def get_audit_logs(
     if end_date:
         query = query.filter(AuditLog.created_at <= end_date)
     if search:
-        search_filter = f"%{search}%"
-        query = query.filter(
-            (AuditLog.request_id.ilike(search_filter)) |
-            (AuditLog.ip_address.ilike(search_filter))
+        if _is_ip_address(search):
+            # A complete address can only be an exact IP match
+            query = query.filter(AuditLog.ip_address == search)
+        else:
+            # Served by the trigram indexes on PostgreSQL
+            search_filter = f"%{search}%"
+            query = query.filter(
+                (AuditLog.request_id.ilike(search_filter)) |
+                (AuditLog.ip_address.ilike(search_filter))
+            )
+
+    # Get paginated results (ordered by most recent first); one extra row
+    # tells us whether there is a next page without a COUNT
+    page_query = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+    if cursor:
+        cursor_ts, cursor_id = _decode_audit_cursor(cursor)
+        page_query = page_query.filter(
+            tuple_(AuditLog.created_at, AuditLog.id) < tuple_(cursor_ts, cursor_id)
         )
+    elif skip:
+        page_query = page_query.offset(skip)
+    logs = page_query.limit(limit + 1).all()
+    has_more = len(logs) > limit
+    logs = logs[:limit]
+    next_cursor = _encode_audit_cursor(logs[-1]) if has_more else None
+
+    total = None
+    if with_total:
+        unfiltered = current_user.role == "super_admin" and not any(
+            (tenant_id, action, resource, status, user_id, start_date, end_date, search)
+        )
+        if unfiltered:
+            total = _estimate_audit_log_count(db)
+        if total is None:
+            total = query.count()
+
+    # Serialize the rows directly; the shape matches AuditLogListResponse
+    return ORJSONResponse(content={
+        "logs": [_log_response_dict(row) for row in logs],
+        "total": total,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "limit": limit,
+        "offset": 0 if cursor else skip,
+    })
+
+
+def _cache_scope(current_user: User) -> Tuple[bool, Optional[UUID]]:
+    """
+    (all_tenants, tenant_id) for the user — the one place the role decides
+    the audit scope. Hashable, so it also keys the caches.
+    """
+    return current_user.role == "super_admin", current_user.tenant_id
 
-    # Get total count
-    total = query.count()
 
-    # Get paginated results (ordered by most recent first)
-    logs = query.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit).all()
+def _scope_to_tenant(query, all_tenants: bool, tenant_id: Optional[UUID]):
+    """Filter an audit log query to a _cache_scope tuple."""
+    if not all_tenants:
+        query = query.filter(AuditLog.tenant_id == tenant_id)
+    return query
 
-    # Convert to response format
-    log_responses = [AuditLogResponse.from_audit_log(log) for log in logs]
 
-    return AuditLogListResponse(
-        logs=log_responses,
-        total=total,
-        limit=limit,
-        offset=skip,
-    )
+def _raw_tenant_scope(all_tenants: bool, tenant_id: Optional[UUID]) -> Tuple[str, dict]:
+    """_scope_to_tenant for raw SQL: an " AND ..." clause and its parameters."""
+    if all_tenants:
+        return "", {}
+    if tenant_id is None:
+        return " AND tenant_id IS NULL", {}
+    return " AND tenant_id = :tenant_id", {"tenant_id": tenant_id}
+
+
+# Statistics cache, shared across workers via Redis: one key per scope
+# ("all" or a tenant ID). The lock key lets a single request recompute an
+# expired entry while concurrent requests wait for its result.
+_AUDIT_STATS_CACHE_PREFIX = "audit:stats:"
+_AUDIT_STATS_CACHE_TTL = 30  # seconds
+_AUDIT_STATS_LOCK_TTL = 10  # seconds
+_AUDIT_STATS_LOCK_WAIT = 5  # seconds a request waits for another's recompute
+
+
+async def _drop_cached_audit_statistics() -> None:
+    """Delete every cached statistics entry (and lock) from Redis."""
+    redis_client = rate_limiter.redis_client
+    if not redis_client:
+        return
+    keys = [key async for key in redis_client.scan_iter(match=f"{_AUDIT_STATS_CACHE_PREFIX}*")]
+    if keys:
+        await redis_client.delete(*keys)
+
+
+def invalidate_audit_caches() -> None:
+    """
+    Drop cached statistics and dropdown values (after clear/archive).
+
+    Called from sync endpoints and background jobs, which run on worker
+    threads; the Redis entries are deleted through the event loop.
+    """
+    _local_audit_statistics.cache_clear()
+    _distinct_audit_values.cache_clear()
+    try:
+        anyio.from_thread.run(_drop_cached_audit_statistics)
+    except Exception as e:
+        logger.warning(f"Could not drop cached audit statistics: {e}")
 
 
 @router.get("/statistics", response_model=AuditStatistics)
-def get_audit_statistics(
+async def get_audit_statistics(
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission(Permission.AUDIT_VIEW)),
 ):
@@ -126,81 +332,246 @@ def get_audit_statistics(
     Get audit log statistics for dashboard display.
 
     Tenant admins see statistics scoped to their tenant only.
-    Super admins see system-wide statistics.
+    Super admins see system-wide statistics. Cached for 30 seconds per scope
+    (in Redis when available, otherwise per worker). Whenever the cache
+    doesn't answer, newly completed hours are rolled up after the response
+    is sent, so the statistics query itself only sums the rollups and the
+    live tail after them.
     """
+    all_tenants, tenant_id = _cache_scope(current_user)
+    redis_client = rate_limiter.redis_client
+    if not redis_client:
+        background_tasks.add_task(_refresh_audit_rollups)
+        return await run_in_threadpool(_local_audit_statistics, db, all_tenants, tenant_id)
+
+    cache_key = f"{_AUDIT_STATS_CACHE_PREFIX}{'all' if all_tenants else tenant_id}"
+    lock_key = f"{cache_key}:lock"
+    have_lock = False
+    try:
+        cached = await redis_client.get(cache_key)
+        if cached:
+            return AuditStatistics.model_validate_json(cached)
+
+        # Stampede guard: the first request recomputes, the others poll
+        have_lock = await redis_client.set(lock_key, "1", nx=True, ex=_AUDIT_STATS_LOCK_TTL)
+        if not have_lock:
+            for _ in range(int(_AUDIT_STATS_LOCK_WAIT / 0.1)):
+                await asyncio.sleep(0.1)
+                cached = await redis_client.get(cache_key)
+                if cached:
+                    return AuditStatistics.model_validate_json(cached)
+    except Exception:
+        pass
+
+    stats = await run_in_threadpool(_audit_statistics, db, all_tenants, tenant_id)
+    background_tasks.add_task(_refresh_audit_rollups)
+
+    try:
+        await redis_client.set(cache_key, stats.model_dump_json(), ex=_AUDIT_STATS_CACHE_TTL)
+        if have_lock:
+            await redis_client.delete(lock_key)
+    except Exception:
+        pass
+    return stats
+
+
+def _refresh_audit_rollups() -> None:
+    """
+    Roll up newly completed hours (PostgreSQL only).
+
+    Runs from BackgroundTasks after a statistics response has been sent,
+    on a session of its own: AuditStatsService.refresh commits, or rolls
+    back while another worker holds the rollup lock. Failures are logged,
+    never raised.
+    """
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            AuditStatsService.refresh(db)
+    except Exception:
+        db.rollback()
+        logger.exception("Failed to refresh audit statistics rollups")
+    finally:
+        db.close()
+
+
+def _audit_statistics(db: Session, all_tenants: bool, tenant_id: Optional[UUID]) -> AuditStatistics:
     # Get time boundaries
     now = datetime.utcnow()
     last_24h = now - timedelta(hours=24)
 
-    # Base filter
-    def base_filter(q):
-        q = q.filter(AuditLog.is_active == True)
-        return _apply_tenant_scope(q, current_user)
-
-    # Total logs
-    total_logs = base_filter(
-        db.query(func.count(AuditLog.id))
-    ).scalar() or 0
-
-    # Unique users
-    total_users = base_filter(
-        db.query(func.count(distinct(AuditLog.user_id))).filter(
-            AuditLog.user_id.isnot(None)
-        )
-    ).scalar() or 0
-
-    # Unique actions
-    total_actions = base_filter(
-        db.query(func.count(distinct(AuditLog.action)))
-    ).scalar() or 0
-
-    # Failed logins in last 24 hours
-    failed_logins_24h = base_filter(
-        db.query(func.count(AuditLog.id)).filter(
-            AuditLog.action == AuditAction.LOGIN_FAILED,
-            AuditLog.created_at >= last_24h,
+    action_counts = {}
+    actions_by_status = {}
+    if db.get_bind().dialect.name == "postgresql":
+        # Rolled-up hours plus a live count of everything after them, in one
+        # statement so both halves see the same snapshot
+        scope, params = _raw_tenant_scope(all_tenants, tenant_id)
+        params.update(
+            login=AuditAction.LOGIN,
+            login_failed=AuditAction.LOGIN_FAILED,
+            last_24h=last_24h,
         )
-    ).scalar() or 0
-
-    # Successful logins in last 24 hours
-    successful_logins_24h = base_filter(
-        db.query(func.count(AuditLog.id)).filter(
-            AuditLog.action == AuditAction.LOGIN,
-            AuditLog.created_at >= last_24h,
-        )
-    ).scalar() or 0
+        rows = db.execute(text(_ROLLUP_STATISTICS_SQL.format(scope=scope)), params).all()
+        for row in rows:
+            if row.action is None:
+                continue
+            action_counts[row.action] = action_counts.get(row.action, 0) + row.log_count
+            actions_by_status[row.status] = actions_by_status.get(row.status, 0) + row.log_count
+        totals = rows[0]
+        total_logs = sum(action_counts.values())
+    else:
+        # Base filter
+        def base_filter(q):
+            q = q.filter(AuditLog.is_active == True)
+            return _scope_to_tenant(q, all_tenants, tenant_id)
+
+        users_grouped = base_filter(
+            db.query(AuditLog.user_id).filter(AuditLog.user_id.isnot(None))
+        ).group_by(AuditLog.user_id).subquery()
+
+        # FILTER restricts the login counters to the last 24 hours
+        def last_24h_logins(action):
+            return func.count(AuditLog.id).filter(
+                AuditLog.action == action,
+                AuditLog.created_at >= last_24h,
+            )
+
+        # Scalar counters in one query, then both groupings in a second
+        totals = base_filter(db.query(
+            func.count(AuditLog.id).label("total_logs"),
+            select(func.count()).select_from(users_grouped).scalar_subquery().label("total_users"),
+            last_24h_logins(AuditAction.LOGIN_FAILED).label("failed_logins_24h"),
+            last_24h_logins(AuditAction.LOGIN).label("successful_logins_24h"),
+        )).one()
+        total_logs = totals.total_logs or 0
+        by_action = base_filter(
+            db.query(
+                literal("action").label("kind"),
+                AuditLog.action.label("key"),
+                func.count(AuditLog.id).label("count"),
+            )
+        ).group_by(AuditLog.action)
+        by_status = base_filter(
+            db.query(
+                literal("status").label("kind"),
+                AuditLog.status.label("key"),
+                func.count(AuditLog.id).label("count"),
+            )
+        ).group_by(AuditLog.status)
+        for kind, key, count in by_action.union_all(by_status).all():
+            if kind == "action":
+                action_counts[key] = count
+            else:
+                actions_by_status[key] = count
 
     # Actions by type (top 10)
-    actions_by_type_query = base_filter(
-        db.query(
-            AuditLog.action,
-            func.count(AuditLog.id).label('count')
-        )
-    ).group_by(AuditLog.action).order_by(func.count(AuditLog.id).desc()).limit(10).all()
-
-    actions_by_type = {row.action: row.count for row in actions_by_type_query}
-
-    # Actions by status
-    actions_by_status_query = base_filter(
-        db.query(
-            AuditLog.status,
-            func.count(AuditLog.id).label('count')
-        )
-    ).group_by(AuditLog.status).all()
-
-    actions_by_status = {row.status: row.count for row in actions_by_status_query}
+    top_actions = sorted(action_counts.items(), key=lambda item: item[1], reverse=True)[:10]
 
     return AuditStatistics(
         total_logs=total_logs,
-        total_users=total_users,
-        total_actions=total_actions,
-        failed_logins_24h=failed_logins_24h,
-        successful_logins_24h=successful_logins_24h,
-        actions_by_type=actions_by_type,
+        total_users=totals.total_users or 0,
+        # Unique actions fall out of the per-action grouping
+        total_actions=len(action_counts),
+        failed_logins_24h=totals.failed_logins_24h or 0,
+        successful_logins_24h=totals.successful_logins_24h or 0,
+        actions_by_type=dict(top_actions),
         actions_by_status=actions_by_status,
     )
 
 
+# Statistics from the hourly rollups (see AuditStatsService): rolled-up
+# counts plus a live aggregate of audit_logs from the end of the newest
+# rollup bucket on. Always returns at least one row, carrying the totals;
+# action / status are NULL on it when there are no logs. {scope} is the
+# tenant filter.
+_ROLLUP_STATISTICS_SQL = """
+WITH since AS (
+    SELECT coalesce(max(hour_bucket) + interval '1 hour', '-infinity') AS ts
+    FROM audit_stats_hourly
+),
+grouped AS (
+    SELECT action, status, sum(n)::bigint AS n
+    FROM (
+        SELECT action, status, log_count AS n
+        FROM audit_stats_hourly
+        WHERE log_count > 0{scope}
+        UNION ALL
+        SELECT action, status, count(*)
+        FROM audit_logs, since
+        WHERE is_active AND created_at >= since.ts{scope}
+        GROUP BY action, status
+    ) counts
+    GROUP BY action, status
+),
+users AS (
+    SELECT user_id
+    FROM audit_stats_users
+    WHERE log_count > 0{scope}
+    UNION
+    SELECT user_id
+    FROM audit_logs, since
+    WHERE is_active AND user_id IS NOT NULL AND created_at >= since.ts{scope}
+),
+logins AS (
+    SELECT count(*) FILTER (WHERE action = :login_failed) AS failed_logins_24h,
+           count(*) FILTER (WHERE action = :login) AS successful_logins_24h
+    FROM audit_logs
+    WHERE is_active AND action IN (:login_failed, :login)
+      AND created_at >= :last_24h{scope}
+)
+SELECT grouped.action, grouped.status, grouped.n AS log_count,
+       (SELECT count(*) FROM users) AS total_users,
+       logins.failed_logins_24h, logins.successful_logins_24h
+FROM logins LEFT JOIN grouped ON true
+"""
+
+
+# Per-worker fallback when Redis isn't configured
+_local_audit_statistics = ttl_cache(seconds=_AUDIT_STATS_CACHE_TTL)(_audit_statistics)
+
+
+# Loose index scan: jump from one distinct value to the next through the
+# index instead of reading every row. {column} is "action" or "resource".
+_DISTINCT_SKIP_SCAN_SQL = """
+WITH RECURSIVE t AS (
+    (SELECT {column} AS v FROM audit_logs
+     WHERE is_active{scope} ORDER BY {column} LIMIT 1)
+    UNION ALL
+    SELECT (SELECT {column} FROM audit_logs
+            WHERE is_active{scope} AND {column} > t.v ORDER BY {column} LIMIT 1)
+    FROM t WHERE t.v IS NOT NULL
+)
+SELECT v FROM t WHERE v IS NOT NULL
+"""
+
+
+# Action / resource names change rarely, and clearing or archiving logs
+# drops the cache (invalidate_audit_caches)
+_DISTINCT_VALUES_CACHE_TTL = 300  # seconds
+
+
+@ttl_cache(seconds=_DISTINCT_VALUES_CACHE_TTL)
+def _distinct_audit_values(
+    db: Session, column_name: str, all_tenants: bool, tenant_id: Optional[UUID]
+) -> List[str]:
+    """
+    Sorted distinct values of an audit log column, tenant-scoped like the
+    other endpoints. Uses a recursive skip scan on PostgreSQL, where the
+    column's indexes let each step be a single index probe. Cached for
+    five minutes per scope; these only feed filter dropdowns.
+    """
+    column = getattr(AuditLog, column_name)
+
+    if db.get_bind().dialect.name != "postgresql":
+        query = db.query(distinct(column)).filter(AuditLog.is_active == True)
+        query = _scope_to_tenant(query, all_tenants, tenant_id)
+        return [row[0] for row in query.order_by(column).all()]
+
+    scope, params = _raw_tenant_scope(all_tenants, tenant_id)
+    sql = _DISTINCT_SKIP_SCAN_SQL.format(column=column_name, scope=scope)
+    return list(db.execute(text(sql), params).scalars())
+
+
 @router.get("/actions", response_model=List[str])
 def get_audit_actions(
     db: Session = Depends(get_db),
@@ -211,11 +582,7 @@ def get_audit_actions(
 
     Scoped to tenant for non-super-admin users.
     """
-    query = db.query(distinct(AuditLog.action)).filter(AuditLog.is_active == True)
-    query = _apply_tenant_scope(query, current_user)
-    actions = query.order_by(AuditLog.action).all()
-
-    return [action[0] for action in actions]
+    return _distinct_audit_values(db, "action", *_cache_scope(current_user))
 
 
 @router.get("/resources", response_model=List[str])
@@ -228,11 +595,7 @@ def get_audit_resources(
 
     Scoped to tenant for non-super-admin users.
     """
-    query = db.query(distinct(AuditLog.resource)).filter(AuditLog.is_active == True)
-    query = _apply_tenant_scope(query, current_user)
-    resources = query.order_by(AuditLog.resource).all()
-
-    return [resource[0] for resource in resources]
+    return _distinct_audit_values(db, "resource", *_cache_scope(current_user))
 
 
 @router.delete("/")
@@ -253,10 +616,19 @@ def clear_audit_logs(
             detail="Clearing audit logs is only allowed in DEV_MODE",
         )
 
-    count = db.query(AuditLog).delete(synchronize_session="fetch")
-    db.commit()
+    if db.get_bind().dialect.name == "postgresql":
+        # TRUNCATE skips the per-row scan and WAL of a DELETE; the lock keeps
+        # the count exact by blocking inserts until the commit. The
+        # statistics rollups go with the logs.
+        db.execute(text("LOCK TABLE audit_logs IN ACCESS EXCLUSIVE MODE"))
+        count = db.scalar(select(func.count()).select_from(AuditLog))
+        db.execute(text("TRUNCATE TABLE audit_logs, audit_stats_hourly, audit_stats_users"))
+    else:
+        count = db.execute(
+            delete(AuditLog).execution_options(synchronize_session=False)
+        ).rowcount
 
-    # Log the clear action itself (meta)
+    # Log the clear action itself (meta), committed together with the clear
     AuditService.log_action(
         db=db,
         user_id=current_user.id,
@@ -266,18 +638,21 @@ def clear_audit_logs(
         details={"records_deleted": count},
         status=AuditStatus.SUCCESS,
         request=request,
+        commit=False,
     )
+    db.commit()
+    invalidate_audit_caches()
 
     return {"message": "Audit logs cleared", "deleted": count}
 
 
-@router.post("/archive")
+@router.post("/archive", status_code=status.HTTP_202_ACCEPTED)
 def archive_audit_logs(
     request: Request,
+    background_tasks: BackgroundTasks,
     before_date: Optional[datetime] = Query(
         None, description="Archive logs older than this date (default: 90 days ago)"
     ),
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_super_admin_user),
 ):
     """
@@ -287,88 +662,189 @@ def archive_audit_logs(
     Default cutoff is 90 days ago.
 
     This will:
-    1. Export matching logs to a JSON file in archives/audit/
+    1. Export matching logs to a gzipped JSON file in archives/audit/
     2. Delete the logs from the database
-    3. Return info about the created archive file
+    3. Report the created archive file in the job result
+
+    Runs in the background; poll GET /archive/{task_id} for progress
+    and the result.
     """
     cutoff = before_date or (datetime.utcnow() - timedelta(days=90))
 
-    # Query logs to archive
-    logs_to_archive = (
-        db.query(AuditLog)
-        .filter(AuditLog.created_at < cutoff)
-        .order_by(AuditLog.created_at.asc())
-        .all()
+    task_id = _create_archive_job(tenant_id=None)
+    background_tasks.add_task(
+        _run_archive_job,
+        task_id,
+        cutoff,
+        current_user.id,
+        current_user.email,
+        None,
+        None,
+        AuditService.get_request_meta(request),
     )
+    return {
+        "status": "accepted",
+        "task_id": task_id,
+        "status_url": request.url_for("get_archive_job", task_id=task_id).path,
+    }
 
-    count = len(logs_to_archive)
 
-    if count == 0:
-        return {
-            "message": "No logs found to archive",
-            "archived": 0,
-            "before_date": cutoff.isoformat(),
-            "file": None,
-        }
+@router.get("/archive/{task_id}")
+def get_archive_job(
+    task_id: str,
+    current_user: User = Depends(get_super_admin_user),
+):
+    """
+    Get the progress and result of an archive job.
 
-    # Prepare data for JSON export
-    archive_data = {
-        "archived_at": datetime.utcnow().isoformat(),
-        "archived_by": current_user.email,
-        "before_date": cutoff.isoformat(),
-        "total_records": count,
-        "logs": [],
-    }
+    Super Admin only.
+    """
+    job = BackgroundJobService.get(task_id)
+    if not job or job["action"] != _ARCHIVE_JOB_ACTION or job["tenant_id"] is not None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archive job not found",
+        )
+    return job
+
+
+# ── Archive jobs ─────────────────────────────────────────────────────────────
+#
+# Archiving exports and deletes every log older than the cutoff, which can
+# take longer than a proxy keeps a request open. It runs via BackgroundTasks
+# on its own session so the request returns 202 immediately; progress is
+# polled through GET /archive/{task_id} (or /tenant/archive/{task_id}).
+# Job records live in the background_jobs table (BackgroundJobService), so
+# any worker can answer the poll.
+
+def _create_archive_job(tenant_id: Optional[UUID]) -> str:
+    """Register a new archive job and return its task ID."""
+    return BackgroundJobService.create(
+        _ARCHIVE_JOB_ACTION,
+        tenant_id=tenant_id,
+        progress={"records_processed": 0, "bytes_written": 0},
+    )
+
+
+def _run_archive_job(
+    task_id: str,
+    cutoff: datetime,
+    user_id: UUID,
+    user_email: str,
+    tenant_id: Optional[UUID],
+    tenant_name: Optional[str],
+    request_meta: dict,
+):
+    """
+    Execute an archive job with its own database session.
+
+    The deletes and the summary audit entry are committed together, once
+    the archive file is complete.
+    """
+    BackgroundJobService.start(task_id)
 
-    for log in logs_to_archive:
-        archive_data["logs"].append({
-            "id": str(log.id),
-            "user_id": str(log.user_id) if log.user_id else None,
-            "tenant_id": str(log.tenant_id) if log.tenant_id else None,
-            "action": log.action,
-            "resource": log.resource,
-            "resource_id": str(log.resource_id) if log.resource_id else None,
-            "details": log.details,
-            "status": log.status,
-            "ip_address": log.ip_address,
-            "user_agent": log.user_agent,
-            "request_id": log.request_id,
-            "created_at": log.created_at.isoformat() if log.created_at else None,
+    def report_progress(records_processed: int, bytes_written: int) -> None:
+        BackgroundJobService.report_progress(task_id, {
+            "records_processed": records_processed,
+            "bytes_written": bytes_written,
         })
 
+    db = SessionLocal()
+    try:
+        result, audit_details = _archive_logs(
+            db, report_progress, cutoff, user_email, tenant_id, tenant_name
+        )
+        if audit_details:
+            AuditService.log_action(
+                db=db,
+                user_id=user_id,
+                tenant_id=tenant_id,
+                action="system.audit_logs_archived",
+                resource="audit_log",
+                details=audit_details,
+                status=AuditStatus.SUCCESS,
+                commit=False,
+                **request_meta,
+            )
+        db.commit()
+        invalidate_audit_caches()
+        BackgroundJobService.complete(task_id, result)
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Audit log archive job ({task_id}) failed")
+        BackgroundJobService.fail(task_id, str(e))
+        AuditService.log_action(
+            db=db,
+            user_id=user_id,
+            tenant_id=tenant_id,
+            action="system.audit_logs_archived",
+            resource="audit_log",
+            details={"error": str(e), "before_date": cutoff.isoformat()},
+            status=AuditStatus.ERROR,
+            **request_meta,
+        )
+    finally:
+        db.close()
+
+
+def _archive_logs(
+    db: Session,
+    report_progress: Optional[Callable[[int, int], None]],
+    cutoff: datetime,
+    archived_by: str,
+    tenant_id: Optional[UUID] = None,
+    tenant_name: Optional[str] = None,
+) -> Tuple[dict, Optional[dict]]:
+    """
+    Move audit logs older than `cutoff` into a new archive file.
+
+    Without a tenant this archives logs system-wide into archives/audit/;
+    with one, only that tenant's logs into its own directory. Nothing is
+    committed here. Returns ``(result, audit_details)``; audit_details is
+    None when there was nothing to archive.
+    """
     # Generate filename with timestamp
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"audit_archive_{timestamp}.json"
-    filepath = ARCHIVE_DIR / filename
+    filename = f"audit_archive_{timestamp}{ARCHIVE_SUFFIX}"
+
+    archive_header = {
+        "archived_at": datetime.utcnow().isoformat(),
+        "archived_by": archived_by,
+    }
+    if tenant_id:
+        filepath = _get_tenant_archive_dir(tenant_id) / filename
+        criteria = (AuditLog.tenant_id == tenant_id, AuditLog.created_at < cutoff)
+        archive_header.update({"tenant_id": str(tenant_id), "tenant_name": tenant_name})
+    else:
+        filepath = ARCHIVE_DIR / filename
+        criteria = (AuditLog.created_at < cutoff,)
+    archive_header["before_date"] = cutoff.isoformat()
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    # Delete logs batch by batch, streaming the returned rows into the file
+    logs_to_archive = _delete_returning_batches(db, *criteria)
+    if db.get_bind().dialect.name == "postgresql":
+        logs_to_archive = AuditStatsService.subtract_deleted(db, logs_to_archive)
+    count = _write_archive(
+        filepath,
+        archive_header,
+        logs_to_archive,
+        include_tenant_id=tenant_id is None,
+        report_progress=report_progress,
+    )
 
-    # Write to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(archive_data, f, indent=2, ensure_ascii=False)
+    if count == 0:
+        return {
+            "message": "No logs found to archive",
+            "archived": 0,
+            "before_date": cutoff.isoformat(),
+            "file": None,
+        }, None
 
     # Get file size
     file_size = os.path.getsize(filepath)
 
-    # Delete archived logs from database
-    db.query(AuditLog).filter(AuditLog.created_at < cutoff).delete(synchronize_session="fetch")
-    db.commit()
-
-    AuditService.log_action(
-        db=db,
-        user_id=current_user.id,
-        tenant_id=None,
-        action="system.audit_logs_archived",
-        resource="audit_log",
-        details={
-            "records_archived": count,
-            "before_date": cutoff.isoformat(),
-            "archive_file": filename,
-            "file_size_bytes": file_size,
-        },
-        status=AuditStatus.SUCCESS,
-        request=request,
-    )
-
-    return {
+    result = {
         "message": f"Successfully archived {count} audit logs",
         "archived": count,
         "before_date": cutoff.isoformat(),
@@ -378,15 +854,237 @@ def archive_audit_logs(
             "size_readable": _format_file_size(file_size),
         },
     }
+    audit_details = {
+        "records_archived": count,
+        "before_date": cutoff.isoformat(),
+        "archive_file": filename,
+        "file_size_bytes": file_size,
+    }
+    return result, audit_details
+
+
+def _archive_log_dict(row, include_tenant_id: bool) -> dict:
+    """Archive representation of one audit log row (see _ARCHIVE_COLUMNS)."""
+    (
+        log_id, user_id, tenant_id, action, resource, resource_id,
+        details, log_status, ip_address, user_agent, request_id, created_at,
+        _is_active,
+    ) = row
+    entry = {
+        "id": str(log_id),
+        "user_id": str(user_id) if user_id else None,
+    }
+    if include_tenant_id:
+        entry["tenant_id"] = str(tenant_id) if tenant_id else None
+    entry.update({
+        "action": action,
+        "resource": resource,
+        "resource_id": str(resource_id) if resource_id else None,
+        "details": details,
+        "status": log_status,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "request_id": request_id,
+        "created_at": created_at.isoformat() if created_at else None,
+    })
+    return entry
+
+
+def _delete_returning_batches(db: Session, *criteria, batch_size: int = 1000) -> Iterator:
+    """
+    Delete the audit logs matching `criteria`, oldest first, yielding each
+    deleted row.
+
+    Each batch is a single DELETE ... RETURNING of just the archived
+    columns, so rows are read once and never loaded as ORM objects.
+    Nothing is committed here: the caller commits once the archive is
+    safely on disk, so a failed write rolls the deletes back.
+    """
+    while True:
+        batch_ids = (
+            select(AuditLog.id)
+            .where(*criteria)
+            .order_by(AuditLog.created_at.asc(), AuditLog.id.asc())
+            .limit(batch_size)
+        )
+        rows = db.execute(
+            delete(AuditLog)
+            .where(AuditLog.id.in_(batch_ids))
+            .returning(*_ARCHIVE_COLUMNS)
+            .execution_options(synchronize_session=False)
+        ).all()
+        if not rows:
+            return
+        # RETURNING order is unspecified; restore chronological order
+        rows.sort(key=lambda row: (row.created_at, row.id))
+        yield from rows
+        if len(rows) < batch_size:
+            return
+
+
+def _write_archive(
+    filepath: Path,
+    header: dict,
+    logs: Iterable,
+    include_tenant_id: bool,
+    report_progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Stream audit logs from `logs` into a gzipped JSON archive file.
+
+    Rows are consumed in batches and written as they arrive, so memory use
+    doesn't grow with the size of the archive. total_records is written
+    after the logs array, once it is known. The file only appears at
+    `filepath` once complete, and not at all when there are no logs; a
+    small metadata sidecar is written next to it for the listings.
+    `report_progress`, if given, is called every 1000 rows with the
+    records processed so far and the (compressed) bytes written.
+    Returns the number of logs.
+    """
+    partial_path = filepath.with_name(filepath.name + ".partial")
+    count = 0
+    try:
+        with open(partial_path, "wb", buffering=ARCHIVE_WRITE_BUFFER_SIZE) as raw, \
+                gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as gz, \
+                io.BufferedWriter(gz, buffer_size=ARCHIVE_WRITE_BUFFER_SIZE) as f:
+            f.write(b"{\n")
+            for key, value in header.items():
+                f.write(b"  " + orjson.dumps(key) + b": " + orjson.dumps(value) + b",\n")
+            f.write(b'  "logs": [')
+            for log in logs:
+                f.write(b",\n    " if count else b"\n    ")
+                f.write(orjson.dumps(_archive_log_dict(log, include_tenant_id)))
+                count += 1
+                if report_progress is not None and count % 1000 == 0:
+                    report_progress(count, raw.tell())
+            f.write(b"\n  ]" if count else b"]")
+            f.write(b',\n  "total_records": %d\n}\n' % count)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+    if report_progress is not None:
+        report_progress(count, partial_path.stat().st_size)
+
+    if count:
+        partial_path.replace(filepath)
+        _archive_meta_path(filepath).write_bytes(orjson.dumps({
+            "total_records": count,
+            "archived_at": header.get("archived_at"),
+            "before_date": header.get("before_date"),
+        }))
+    else:
+        partial_path.unlink()
+    return count
+
+
+def _archive_meta_path(filepath: Path) -> Path:
+    """Metadata sidecar for an archive file (audit_archive_X.meta.json)."""
+    stem = filepath.name.removesuffix(".gz").removesuffix(".json")
+    return filepath.with_name(stem + ARCHIVE_META_SUFFIX)
+
+
+def _resolve_archive_file(archive_dir: Path, filename: str) -> Tuple[Path, os.stat_result]:
+    """
+    Locate an archive file by name, with a single stat call.
+
+    Raises 400 for anything but an archive file name (which also rules
+    out directory traversal) and 404 when there is no such regular file.
+    """
+    if not _ARCHIVE_NAME_RE.fullmatch(filename):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid filename",
+        )
+
+    filepath = archive_dir / filename
+    try:
+        stat_result = filepath.stat()
+    except OSError:
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archive file not found",
+        )
+    return filepath, stat_result
+
+
+def _archive_file_response(filepath: Path, stat_result: os.stat_result) -> FileResponse:
+    """
+    Serve an archive file. Gzipped archives are sent as-is with
+    Content-Encoding: gzip so the client decompresses them, and are
+    downloaded under their plain .json name.
+
+    Passing stat_result spares FileResponse another stat; the body is
+    sent with sendfile where the server supports it.
+    """
+    if filepath.name.endswith(".gz"):
+        return FileResponse(
+            path=filepath,
+            filename=filepath.name.removesuffix(".gz"),
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip"},
+            stat_result=stat_result,
+        )
+    return FileResponse(
+        path=filepath,
+        filename=filepath.name,
+        media_type="application/json",
+        stat_result=stat_result,
+    )
+
+
+def _list_archives(archive_dir: Path) -> List[dict]:
+    """
+    Describe the archive files in `archive_dir`, newest first.
+
+    Metadata comes from each archive's sidecar; archives written before
+    sidecars existed fall back to parsing the archive itself.
+    """
+    archives = []
+    if not archive_dir.exists():
+        return archives
+
+    for filepath in sorted(archive_dir.glob("audit_archive_*"), reverse=True):
+        if filepath.name.endswith(ARCHIVE_META_SUFFIX) or not (
+            filepath.name.endswith(ARCHIVE_SUFFIX) or filepath.suffix == ".json"
+        ):
+            continue
+        file_stat = filepath.stat()
+        meta_path = _archive_meta_path(filepath)
+        try:
+            if meta_path.exists():
+                data = orjson.loads(meta_path.read_bytes())
+            else:
+                opener = gzip.open if filepath.name.endswith(".gz") else open
+                with opener(filepath, "rb") as f:
+                    data = orjson.loads(f.read())
+        except Exception:
+            data = {}
+
+        archives.append({
+            "name": filepath.name,
+            "size_bytes": file_stat.st_size,
+            "size_readable": _format_file_size(file_stat.st_size),
+            "created_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+            "total_records": data.get("total_records", 0),
+            "archived_at": data.get("archived_at"),
+            "before_date": data.get("before_date"),
+        })
+
+    return archives
+
+
+_FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_FILE_SIZE_DIVISORS = tuple(1024 ** i for i in range(len(_FILE_SIZE_UNITS)))
 
 
 def _format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    i = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_FILE_SIZE_UNITS) - 1)
+    return f"{size_bytes / _FILE_SIZE_DIVISORS[i]:.1f} {_FILE_SIZE_UNITS[i]}"
 
 
 @router.get("/archives")
@@ -398,33 +1096,7 @@ def list_archive_files(
 
     Super Admin only.
     """
-    archives = []
-
-    if ARCHIVE_DIR.exists():
-        for filepath in sorted(ARCHIVE_DIR.glob("*.json"), reverse=True):
-            stat = filepath.stat()
-            # Try to read metadata from file
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    total_records = data.get("total_records", 0)
-                    archived_at = data.get("archived_at", None)
-                    before_date = data.get("before_date", None)
-            except Exception:
-                total_records = 0
-                archived_at = None
-                before_date = None
-
-            archives.append({
-                "name": filepath.name,
-                "size_bytes": stat.st_size,
-                "size_readable": _format_file_size(stat.st_size),
-                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "total_records": total_records,
-                "archived_at": archived_at,
-                "before_date": before_date,
-            })
-
+    archives = _list_archives(ARCHIVE_DIR)
     return {"archives": archives, "total": len(archives)}
 
 
@@ -438,26 +1110,8 @@ def download_archive_file(
 
     Super Admin only.
     """
-    # Validate filename to prevent directory traversal
-    if "/" in filename or "\\" in filename or ".." in filename:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid filename",
-        )
-
-    filepath = ARCHIVE_DIR / filename
-
-    if not filepath.exists() or not filepath.is_file():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Archive file not found",
-        )
-
-    return FileResponse(
-        path=filepath,
-        filename=filename,
-        media_type="application/json",
-    )
+    filepath, stat_result = _resolve_archive_file(ARCHIVE_DIR, filename)
+    return _archive_file_response(filepath, stat_result)
 
 
 @router.delete("/archives/{filename}")
@@ -478,22 +1132,10 @@ def delete_archive_file(
             detail="Deleting archive files is only allowed in DEV_MODE",
         )
 
-    # Validate filename
-    if "/" in filename or "\\" in filename or ".." in filename:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid filename",
-        )
-
-    filepath = ARCHIVE_DIR / filename
-
-    if not filepath.exists() or not filepath.is_file():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Archive file not found",
-        )
+    filepath, _ = _resolve_archive_file(ARCHIVE_DIR, filename)
 
     os.remove(filepath)
+    _archive_meta_path(filepath).unlink(missing_ok=True)
 
     AuditService.log_action(
         db=db,
@@ -520,20 +1162,20 @@ def get_audit_log(
 
     Tenant admins can only access logs belonging to their tenant.
     """
-    query = db.query(AuditLog).filter(
+    query = db.query(*_AUDIT_LOG_COLUMNS).filter(
         AuditLog.id == log_id,
         AuditLog.is_active == True
     )
     query = _apply_tenant_scope(query, current_user)
-    audit_log = query.first()
+    row = query.first()
 
-    if not audit_log:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Audit log not found"
         )
 
-    return AuditLogResponse.from_audit_log(audit_log)
+    return ORJSONResponse(content=_log_response_dict(row))
 
 
 # ============================================================================
@@ -541,123 +1183,72 @@ def get_audit_log(
 # ============================================================================
 
 def _get_tenant_archive_dir(tenant_id: UUID) -> Path:
-    """Get archive directory for a specific tenant."""
-    tenant_dir = ARCHIVE_DIR / f"tenant_{tenant_id}"
-    tenant_dir.mkdir(parents=True, exist_ok=True)
-    return tenant_dir
+    """
+    Get archive directory for a specific tenant.
+
+    Only builds the path; the directory is created when the tenant's first
+    archive is written, so listings and downloads cost no mkdir syscalls.
+    """
+    return ARCHIVE_DIR / f"tenant_{tenant_id}"
 
 
-@router.post("/tenant/archive")
+@router.post("/tenant/archive", status_code=status.HTTP_202_ACCEPTED)
 def archive_tenant_audit_logs(
     request: Request,
+    background_tasks: BackgroundTasks,
     before_date: Optional[datetime] = Query(
         None, description="Archive logs older than this date (default: 90 days ago)"
     ),
-    db: Session = Depends(get_db),
     current_user: User = Depends(require_permission(Permission.AUDIT_VIEW)),
     tenant: Tenant = Depends(get_current_tenant),
 ):
     """
     Archive old audit logs for current tenant.
 
-    Tenant Admin only. Exports logs to JSON file, then removes from database.
-    Default cutoff is 90 days ago.
+    Tenant Admin only. Exports logs to a gzipped JSON file, then removes
+    them from the database. Default cutoff is 90 days ago.
+
+    Runs in the background; poll GET /tenant/archive/{task_id} for progress
+    and the result.
     """
     cutoff = before_date or (datetime.utcnow() - timedelta(days=90))
 
-    # Query logs to archive (tenant-scoped)
-    logs_to_archive = (
-        db.query(AuditLog)
-        .filter(
-            AuditLog.tenant_id == tenant.id,
-            AuditLog.created_at < cutoff,
-        )
-        .order_by(AuditLog.created_at.asc())
-        .all()
+    task_id = _create_archive_job(tenant_id=tenant.id)
+    background_tasks.add_task(
+        _run_archive_job,
+        task_id,
+        cutoff,
+        current_user.id,
+        current_user.email,
+        tenant.id,
+        tenant.name,
+        AuditService.get_request_meta(request),
     )
-
-    count = len(logs_to_archive)
-
-    if count == 0:
-        return {
-            "message": "No logs found to archive",
-            "archived": 0,
-            "before_date": cutoff.isoformat(),
-            "file": None,
-        }
-
-    # Prepare data for JSON export
-    archive_data = {
-        "archived_at": datetime.utcnow().isoformat(),
-        "archived_by": current_user.email,
-        "tenant_id": str(tenant.id),
-        "tenant_name": tenant.name,
-        "before_date": cutoff.isoformat(),
-        "total_records": count,
-        "logs": [],
+    return {
+        "status": "accepted",
+        "task_id": task_id,
+        "status_url": request.url_for("get_tenant_archive_job", task_id=task_id).path,
     }
 
-    for log in logs_to_archive:
-        archive_data["logs"].append({
-            "id": str(log.id),
-            "user_id": str(log.user_id) if log.user_id else None,
-            "action": log.action,
-            "resource": log.resource,
-            "resource_id": str(log.resource_id) if log.resource_id else None,
-            "details": log.details,
-            "status": log.status,
-            "ip_address": log.ip_address,
-            "user_agent": log.user_agent,
-            "request_id": log.request_id,
-            "created_at": log.created_at.isoformat() if log.created_at else None,
-        })
-
-    # Generate filename with timestamp
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    filename = f"audit_archive_{timestamp}.json"
-    tenant_archive_dir = _get_tenant_archive_dir(tenant.id)
-    filepath = tenant_archive_dir / filename
-
-    # Write to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(archive_data, f, indent=2, ensure_ascii=False)
-
-    # Get file size
-    file_size = os.path.getsize(filepath)
-
-    # Delete archived logs from database (tenant-scoped)
-    db.query(AuditLog).filter(
-        AuditLog.tenant_id == tenant.id,
-        AuditLog.created_at < cutoff,
-    ).delete(synchronize_session="fetch")
-    db.commit()
 
-    AuditService.log_action(
-        db=db,
-        user_id=current_user.id,
-        tenant_id=tenant.id,
-        action="system.audit_logs_archived",
-        resource="audit_log",
-        details={
-            "records_archived": count,
-            "before_date": cutoff.isoformat(),
-            "archive_file": filename,
-            "file_size_bytes": file_size,
-        },
-        status=AuditStatus.SUCCESS,
-        request=request,
-    )
+@router.get("/tenant/archive/{task_id}")
+def get_tenant_archive_job(
+    task_id: str,
+    current_user: User = Depends(require_permission(Permission.AUDIT_VIEW)),
+    tenant: Tenant = Depends(get_current_tenant),
+):
+    """
+    Get the progress and result of an archive job for current tenant.
 
-    return {
-        "message": f"Successfully archived {count} audit logs",
-        "archived": count,
-        "before_date": cutoff.isoformat(),
-        "file": {
-            "name": filename,
-            "size_bytes": file_size,
-            "size_readable": _format_file_size(file_size),
-        },
-    }
+    Tenant Admin only.
+    """
+    job = BackgroundJobService.get(task_id)
+    if not job or job["action"] != _ARCHIVE_JOB_ACTION or job["tenant_id"] != str(tenant.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archive job not found",
+        )
+    return job
 
 
 @router.get("/tenant/archives")
@@ -670,33 +1261,7 @@ def list_tenant_archive_files(
 
     Tenant Admin only.
     """
-    archives = []
-    tenant_archive_dir = _get_tenant_archive_dir(tenant.id)
-
-    if tenant_archive_dir.exists():
-        for filepath in sorted(tenant_archive_dir.glob("*.json"), reverse=True):
-            stat = filepath.stat()
-            # Try to read metadata from file
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    total_records = data.get("total_records", 0)
-                    archived_at = data.get("archived_at", None)
-                    before_date = data.get("before_date", None)
-            except Exception:
-                total_records = 0
-                archived_at = None
-                before_date = None
-
-            archives.append({
-                "name": filepath.name,
-                "size_bytes": stat.st_size,
-                "size_readable": _format_file_size(stat.st_size),
-                "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "total_records": total_records,
-                "archived_at": archived_at,
-                "before_date": before_date,
-            })
+    archives = _list_archives(_get_tenant_archive_dir(tenant.id))
 
     return {"archives": archives, "total": len(archives)}
 
@@ -712,24 +1277,5 @@ def download_tenant_archive_file(
 
     Tenant Admin only.
     """
-    # Validate filename to prevent directory traversal
-    if "/" in filename or "\\" in filename or ".." in filename:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid filename",
-        )
-
-    tenant_archive_dir = _get_tenant_archive_dir(tenant.id)
-    filepath = tenant_archive_dir / filename
-
-    if not filepath.exists() or not filepath.is_file():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Archive file not found",
-        )
-
-    return FileResponse(
-        path=filepath,
-        filename=filename,
-        media_type="application/json",
-    )
+    filepath, stat_result = _resolve_archive_file(_get_tenant_archive_dir(tenant.id), filename)
+    return _archive_file_response(filepath, stat_result)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -17,7 +18,14 @@ from app.services.auth_service import AuthService
 from app.services.user_service import UserService
 from app.core.security import create_access_token, create_refresh_token
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["Authentication"],
+    default_response_class=ORJSONResponse,
+)
+
+# Handlers that don't await anything are plain `def`: FastAPI runs them in its
+# threadpool, so bcrypt and the synchronous session don't block the event loop
 
 @router.post("/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -40,7 +48,7 @@ async def register(
     return await auth_service.register(register_data, request)
 
 @router.post("/login", response_model=LoginResponse)
-async def login(
+def login(
     login_data: LoginRequest,
     request: Request,
     db: Session = Depends(get_db)
@@ -61,8 +69,9 @@ async def login(
     return auth_service.login(login_data, request)
 
 @router.post("/logout")
-async def logout(
+def logout(
     request: Request,
+    background_tasks: BackgroundTasks,
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -74,7 +83,7 @@ async def logout(
     This endpoint logs the logout event for audit purposes.
     """
     auth_service = AuthService(db)
-    return await auth_service.logout(current_user, request)
+    return auth_service.logout(current_user, background_tasks, request)
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -104,7 +113,7 @@ async def forgot_password(
     return await auth_service.forgot_password(forgot_request, request)
 
 @router.post("/reset-password", response_model=ResetPasswordResponse)
-async def reset_password(
+def reset_password(
     reset_request: ResetPasswordRequest,
     request: Request,
     db: Session = Depends(get_db),
@@ -119,7 +128,7 @@ async def reset_password(
     return auth_service.reset_password(reset_request, request)
 
 @router.post("/verify-email", response_model=VerifyEmailResponse)
-async def verify_email(
+def verify_email(
     request: VerifyEmailRequest,
     db: Session = Depends(get_db)
 ):
@@ -129,7 +138,7 @@ async def verify_email(
     Token is sent via email after registration.
     """
     auth_service = AuthService(db)
-    return await auth_service.verify_email(request)
+    return auth_service.verify_email(request)
 
 @router.post("/resend-verification")
 async def resend_verification(
@@ -145,7 +154,7 @@ async def resend_verification(
     return await auth_service.resend_verification(email)
 
 @router.post("/refresh", response_model=RefreshTokenResponse)
-async def refresh_token(
+def refresh_token(
     request: RefreshTokenRequest,
     db: Session = Depends(get_db)
 ):
@@ -160,7 +169,7 @@ async def refresh_token(
 
 
 @router.post("/accept-invite", response_model=AcceptInviteResponse)
-async def accept_invite(
+def accept_invite(
     invite_data: AcceptInviteRequest,
     request: Request,
     db: Session = Depends(get_db)
@@ -172,7 +181,7 @@ async def accept_invite(
     Returns authentication tokens so the user is logged in immediately.
     """
     auth_service = AuthService(db)
-    login_response = await auth_service.accept_invite(
+    login_response = auth_service.accept_invite(
         token=invite_data.token,
         password=invite_data.password,
         first_name=invite_data.first_name,
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
@@ -10,7 +11,11 @@ from app.models.tenant import Tenant
 from app.schemas.branch import BranchCreate, BranchUpdate, BranchResponse, BranchListResponse
 from app.services.branch_service import BranchService
 
-router = APIRouter(prefix="/branches", tags=["Branches"])
+router = APIRouter(
+    prefix="/branches",
+    tags=["Branches"],
+    default_response_class=ORJSONResponse,
+)
 
 @router.get("", response_model=BranchListResponse)
 async def list_branches(
@@ -36,12 +41,15 @@ async def list_branches(
         search=search
     )
 
-    return BranchListResponse(
-        branches=[BranchResponse.model_validate(b) for b in branches],
+    # Trusted DB rows: build the models without validation and serialize
+    # directly instead of letting FastAPI validate the page again
+    response = BranchListResponse.model_construct(
+        branches=[BranchResponse.from_branch(b) for b in branches],
         total=total,
         page=skip // limit + 1,
         page_size=limit
     )
+    return ORJSONResponse(content=response.model_dump(mode="json"))
 
 @router.post("", response_model=BranchResponse, status_code=status.HTTP_201_CREATED)
 async def create_branch(
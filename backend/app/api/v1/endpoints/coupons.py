@@ -3,10 +3,10 @@ Coupon API endpoints for managing promotional discounts.
 Includes admin CRUD operations and tenant-facing validation/redemption.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
-import math
 
 from app.api.deps import (
     get_db,
@@ -33,7 +33,21 @@ from app.schemas.coupon import (
 from app.services.coupon_service import CouponService
 from app.models.upgrade_request import UpgradeRequest
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def _page_count(total: int, page_size: int) -> int:
+    """Number of pages for `total` items (at least 1), in integer arithmetic"""
+    return (total + page_size - 1) // page_size if total else 1
+
+
+def _redemption_list_response(**fields) -> ORJSONResponse:
+    """
+    Serialize a page of redemptions built with from_row, skipping
+    FastAPI's re-validation of the page against response_model.
+    """
+    page = CouponRedemptionListResponse.model_construct(**fields)
+    return ORJSONResponse(content=page.model_dump(mode="json"))
 
 
 # ============== Admin Coupon Management ==============
@@ -82,7 +96,7 @@ async def list_coupons(
         total=total,
         page=page,
         page_size=page_size,
-        pages=math.ceil(total / page_size) if total > 0 else 1
+        pages=_page_count(total, page_size)
     )
 
 
@@ -157,48 +171,24 @@ async def get_coupon_redemptions(
     current_user: User = Depends(get_super_admin_user),
 ):
     """Get redemptions for a specific coupon (super admin only)"""
-    from app.models.coupon import CouponRedemption
-
     coupon = CouponService.get_coupon_by_id(db, coupon_id)
     if not coupon:
         raise HTTPException(status_code=404, detail="Coupon not found")
 
-    query = db.query(CouponRedemption).filter(
-        CouponRedemption.coupon_id == coupon_id,
-        CouponRedemption.is_active == True
+    rows, total = CouponService.get_coupon_redemptions(
+        db,
+        coupon_id=coupon_id,
+        page=page,
+        page_size=page_size,
     )
+    items = [CouponRedemptionResponse.from_row(row) for row in rows]
 
-    total = query.count()
-    redemptions = query.order_by(
-        CouponRedemption.applied_at.desc()
-    ).offset((page - 1) * page_size).limit(page_size).all()
-
-    # Enrich with coupon info
-    items = []
-    for r in redemptions:
-        item = CouponRedemptionResponse(
-            id=r.id,
-            coupon_id=r.coupon_id,
-            tenant_id=r.tenant_id,
-            upgrade_request_id=r.upgrade_request_id,
-            discount_type=r.discount_type,
-            discount_value=r.discount_value,
-            discount_applied=r.discount_applied,
-            applied_at=r.applied_at,
-            expires_at=r.expires_at,
-            is_expired=r.is_expired,
-            coupon_code=coupon.code,
-            coupon_name=coupon.name,
-            created_at=r.created_at
-        )
-        items.append(item)
-
-    return CouponRedemptionListResponse(
+    return _redemption_list_response(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        pages=math.ceil(total / page_size) if total > 0 else 1
+        pages=_page_count(total, page_size)
     )
 
 
@@ -264,7 +254,8 @@ async def apply_coupon(
         tenant_id=tenant.id,
         tier_code=upgrade_request.target_tier,
         billing_period=upgrade_request.billing_period,
-        amount=upgrade_request.amount
+        amount=upgrade_request.amount,
+        coupon=coupon
     )
 
     if not validation.valid:
@@ -284,7 +275,8 @@ async def apply_coupon(
         tenant_id=tenant.id,
         upgrade_request_id=upgrade_request.id,
         original_amount=upgrade_request.amount,
-        created_by_id=current_user.id
+        created_by_id=current_user.id,
+        coupon=coupon
     )
 
     if not redemption:
@@ -338,43 +330,21 @@ async def get_my_redemptions(
     tenant: Tenant = Depends(get_tenant_context),
 ):
     """Get coupon redemptions for the current tenant"""
-    from app.models.coupon import CouponRedemption, Coupon
-
-    redemptions, total = CouponService.get_tenant_redemptions(
+    rows, total = CouponService.get_tenant_redemptions(
         db,
         tenant_id=tenant.id,
         page=page,
         page_size=page_size,
         include_expired=include_expired
     )
+    items = [CouponRedemptionResponse.from_row(row) for row in rows]
 
-    # Enrich with coupon info
-    items = []
-    for r in redemptions:
-        coupon = db.query(Coupon).filter(Coupon.id == r.coupon_id).first()
-        item = CouponRedemptionResponse(
-            id=r.id,
-            coupon_id=r.coupon_id,
-            tenant_id=r.tenant_id,
-            upgrade_request_id=r.upgrade_request_id,
-            discount_type=r.discount_type,
-            discount_value=r.discount_value,
-            discount_applied=r.discount_applied,
-            applied_at=r.applied_at,
-            expires_at=r.expires_at,
-            is_expired=r.is_expired,
-            coupon_code=coupon.code if coupon else None,
-            coupon_name=coupon.name if coupon else None,
-            created_at=r.created_at
-        )
-        items.append(item)
-
-    return CouponRedemptionListResponse(
+    return _redemption_list_response(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        pages=math.ceil(total / page_size) if total > 0 else 1
+        pages=_page_count(total, page_size)
     )
 
 
@@ -3,11 +3,16 @@ Feature API Endpoints
 
 Endpoints for feature flag management and checking.
 """
+from functools import lru_cache
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
 
+from app.core.cache import ttl_cache
 from app.core.database import get_db
 from app.api.deps import (
     get_current_active_user,
@@ -22,6 +27,7 @@ from app.core.features import (
     FeatureModule,
     get_features_grouped_by_module,
     get_all_feature_codes,
+    get_feature_code_set,
 )
 from app.schemas.features import (
     FeatureMetadataResponse,
@@ -34,7 +40,11 @@ from app.schemas.features import (
     TenantFeatureOverride,
 )
 
-router = APIRouter(prefix="/features", tags=["Features"])
+router = APIRouter(
+    prefix="/features",
+    tags=["Features"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # ============================================================================
@@ -54,7 +64,7 @@ async def get_tenant_features(
     """
     features = FeatureService.get_tenant_features(db, tenant)
     return TenantFeaturesResponse(
-        features=sorted(list(features)),
+        features=sorted(features),
         tier=tenant.tier,
         overrides=tenant.features or {},
     )
@@ -90,21 +100,25 @@ async def get_features_detailed(
 # ADMIN ENDPOINTS (super admin only)
 # ============================================================================
 
-admin_router = APIRouter(prefix="/admin/features", tags=["Admin - Features"])
+admin_router = APIRouter(
+    prefix="/admin/features",
+    tags=["Admin - Features"],
+    default_response_class=ORJSONResponse,
+)
 
 
-@admin_router.get("", response_model=AllFeaturesResponse)
-async def get_all_features(
-    current_user: User = Depends(get_super_admin_user),
-):
+@lru_cache(maxsize=1)
+def _all_features_json() -> bytes:
     """
-    Get all available features grouped by module.
+    The get_all_features body, serialized once per process.
+
+    FEATURE_REGISTRY is static, so the response never changes while the
+    process runs.
     """
     grouped = get_features_grouped_by_module()
-    modules = {}
-    for module_name, features in grouped.items():
-        modules[module_name] = [
-            FeatureMetadataResponse(
+    modules = {
+        module_name: [
+            FeatureMetadataResponse.model_construct(
                 code=f.code,
                 name=f.name,
                 description=f.description,
@@ -112,11 +126,38 @@ async def get_all_features(
             )
             for f in features
         ]
-
-    return AllFeaturesResponse(
+        for module_name, features in grouped.items()
+    }
+    return orjson.dumps(AllFeaturesResponse.model_construct(
         modules=modules,
-        total_count=len(get_all_feature_codes()),
-    )
+        total_count=len(get_feature_code_set()),
+    ).model_dump())
+
+
+@ttl_cache(seconds=60)
+def _tier_feature_matrix_json(db: Session) -> bytes:
+    """
+    The get_tier_feature_matrix body, serialized.
+
+    Cleared by update_tier_features; other workers, and tier edits made
+    through the subscription tier endpoints, catch up within the TTL.
+    """
+    matrix = FeatureService.get_tier_feature_matrix(db)
+    return orjson.dumps(TierFeatureMatrix.model_construct(
+        tiers=list(matrix.keys()),
+        features=get_all_feature_codes(),
+        matrix=matrix,
+    ).model_dump())
+
+
+@admin_router.get("", response_model=AllFeaturesResponse)
+async def get_all_features(
+    current_user: User = Depends(get_super_admin_user),
+):
+    """
+    Get all available features grouped by module.
+    """
+    return Response(content=_all_features_json(), media_type="application/json")
 
 
 @admin_router.get("/matrix", response_model=TierFeatureMatrix)
@@ -127,12 +168,7 @@ async def get_tier_feature_matrix(
     """
     Get feature availability matrix across all tiers.
     """
-    matrix = FeatureService.get_tier_feature_matrix(db)
-    return TierFeatureMatrix(
-        tiers=list(matrix.keys()),
-        features=get_all_feature_codes(),
-        matrix=matrix,
-    )
+    return Response(content=_tier_feature_matrix_json(db), media_type="application/json")
 
 
 @admin_router.put("/tiers/{tier_code}", response_model=dict)
@@ -147,6 +183,7 @@ async def update_tier_features(
     """
     try:
         tier = FeatureService.update_tier_features(db, tier_code, data.features)
+        _tier_feature_matrix_json.cache_clear()
         return {
             "message": f"Updated features for tier '{tier_code}'",
             "tier_code": tier.code,
@@ -169,7 +206,7 @@ async def get_tenant_features_admin(
     """
     Get all features with status for a specific tenant (admin view).
     """
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    tenant = db.get(Tenant, tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -188,14 +225,14 @@ async def override_tenant_feature(
     """
     Enable or disable a specific feature for a tenant (override tier).
     """
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+    tenant = db.get(Tenant, tenant_id)
     if not tenant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tenant {tenant_id} not found",
         )
 
-    if data.feature_code not in get_all_feature_codes():
+    if data.feature_code not in get_feature_code_set():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid feature code: {data.feature_code}",
@@ -228,17 +265,15 @@ async def reset_tenant_overrides(
     """
     Reset a tenant's feature overrides to tier defaults.
     """
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
-    if not tenant:
+    tier = FeatureService.reset_tenant_overrides(db, tenant_id)
+    if tier is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tenant {tenant_id} not found",
         )
 
-    FeatureService.reset_tenant_overrides(db, tenant)
-
     return {
         "message": "Feature overrides reset to tier defaults",
         "tenant_id": str(tenant_id),
-        "tier": tenant.tier,
+        "tier": tier,
     }
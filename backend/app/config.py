@@ -6,6 +6,8 @@ class Settings(BaseSettings):
     DEBUG: bool = False
 
     DATABASE_URL: str
+    # Optional read replica for read-only endpoints (empty = use primary)
+    REPLICA_DATABASE_URL: str = ""
     REDIS_URL: str = "redis://localhost:6379/0"
 
     SECRET_KEY: str
@@ -19,6 +21,11 @@ class Settings(BaseSettings):
     DEV_MODE: bool = False
     RATE_LIMIT_ENABLED: bool = True
 
+    # Number of uvicorn worker processes (uvicorn reads the same variable
+    # as its --workers default). Per-process state such as the in-memory
+    # log buffer is only served when this is 1.
+    WEB_CONCURRENCY: int = 1
+
     # Email Configuration
     MAIL_ENABLED: bool = True
     MAIL_FROM: str = "noreply@harmony-saas.com"
@@ -0,0 +1,55 @@
+"""
+In-Process Caching
+
+Small TTL cache for expensive read-only aggregates (dashboard statistics,
+filter dropdown values). Entries live in the worker process's memory, so
+each worker keeps its own copy and everything resets on restart.
+"""
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+
+def ttl_cache(seconds: float) -> Callable:
+    """
+    Cache a function's return value for ``seconds``.
+
+    The decorated function must take a database session as its first
+    positional argument; the session is excluded from the cache key, the
+    remaining arguments form the key.
+
+    Usage:
+        @ttl_cache(seconds=60)
+        def _overview(db: Session) -> SystemStatsOverview:
+            ...
+
+        _overview.cache_clear()  # drop all cached entries
+    """
+    def decorator(func: Callable) -> Callable:
+        entries: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(db, *args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+            value = func(db, *args, **kwargs)
+            with lock:
+                entries[key] = (now + seconds, value)
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
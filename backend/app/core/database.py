@@ -9,14 +9,35 @@ DATABASE_URL = settings.DATABASE_URL.replace(
     "postgresql+psycopg://"
 )
 
+# Compiled SQL is cached per statement shape. Optional filters on list
+# endpoints (audit logs alone combine eight) produce many shapes, so the
+# cache is sized above SQLAlchemy's default of 500 to avoid recompiling
+# evicted statements.
+QUERY_CACHE_SIZE = 1200
+
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10
+    pool_size=10,
+    query_cache_size=QUERY_CACHE_SIZE,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read replica for read-only endpoints that tolerate a few seconds of lag.
+# Falls back to the primary engine when no replica is configured.
+if settings.REPLICA_DATABASE_URL:
+    replica_engine = create_engine(
+        settings.REPLICA_DATABASE_URL.replace("postgresql://", "postgresql+psycopg://"),
+        pool_pre_ping=True,
+        pool_size=10,
+        query_cache_size=QUERY_CACHE_SIZE,
+    )
+else:
+    replica_engine = engine
+
+ReadOnlySessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
 Base = declarative_base()
 
 def get_db():
@@ -25,3 +46,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_db_ro():
+    """Session bound to the read replica (never use for writes)."""
+    db = ReadOnlySessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -5,7 +5,8 @@ Defines all business features with metadata and tier-feature mappings.
 This is the central registry for feature gating across the application.
 """
 from enum import Enum
-from typing import Dict, Set, List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Set, List, Optional
 from dataclasses import dataclass
 
 
@@ -383,6 +384,12 @@ def get_all_feature_codes() -> List[str]:
     return [code.value for code in FeatureCode]
 
 
+@lru_cache(maxsize=1)
+def get_feature_code_set() -> FrozenSet[str]:
+    """Get all feature codes as a set, for validating codes"""
+    return frozenset(code.value for code in FeatureCode)
+
+
 def get_all_modules() -> List[FeatureModule]:
     """Get list of all modules"""
     return list(FeatureModule)
@@ -0,0 +1,25 @@
+"""
+In-Memory Log Buffer
+
+Loguru sink that keeps the most recent application log records in a bounded
+ring, so the admin log viewer can serve them without re-reading and
+re-parsing logs/app.log. The ring lives in the worker process's memory:
+each worker only sees its own records and everything resets on restart.
+"""
+from collections import deque
+from typing import Deque, Tuple
+
+LOG_BUFFER_SIZE = 5000
+
+# (timestamp, level, message) — same fields as a logs/app.log line
+log_buffer: Deque[Tuple[str, str, str]] = deque(maxlen=LOG_BUFFER_SIZE)
+
+
+def log_buffer_sink(message) -> None:
+    """Loguru sink: append the record to the ring (oldest entries drop off)."""
+    record = message.record
+    log_buffer.append((
+        record["time"].strftime("%Y-%m-%d %H:%M:%S"),
+        record["level"].name,
+        record["message"],
+    ))
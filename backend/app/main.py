@@ -5,6 +5,7 @@ from app.api.v1 import router as api_v1_router
 from app.middleware.error_handler import register_exception_handlers
 from app.middleware.logging import RequestLoggingMiddleware
 from app.middleware.usage_tracking import UsageTrackingMiddleware
+from app.core.log_buffer import log_buffer_sink
 from loguru import logger
 
 # Sentry error tracking (no-op if SENTRY_DSN not configured)
@@ -25,6 +26,8 @@ logger.add(
     level="INFO",
     format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
 )
+# Recent records kept in memory for GET /admin/tools/logs
+logger.add(log_buffer_sink, level="INFO")
 
 app = FastAPI(
     title=settings.APP_NAME,
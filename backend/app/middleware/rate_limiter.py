@@ -6,19 +6,62 @@ from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from typing import Optional, Callable
 import redis.asyncio as redis
-from datetime import datetime, timedelta
+from redis.commands.core import AsyncScript
 from loguru import logger
 import hashlib
+import time
 
 from app.config import settings
 
 
+# Leaky bucket, evaluated lazily: the bucket holds up to ARGV[1] requests and
+# drains ARGV[1] per ARGV[2] seconds. Nothing runs between requests; each
+# check first credits the time elapsed since the previous one, then takes a
+# slot if there is one. One atomic round-trip per check, using Redis's clock
+# so all workers agree.
+#
+# Returns {allowed (0/1), remaining, ms until next slot, ms until empty}
+LEAKY_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2]) * 1000
+local rate = capacity / window_ms
+
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+
+local state = redis.call('HMGET', KEYS[1], 'available', 'ts')
+local available = tonumber(state[1])
+local last = tonumber(state[2])
+if available == nil or last == nil then
+    available = capacity
+else
+    available = math.min(capacity, available + math.max(0, now - last) * rate)
+end
+
+local allowed = 0
+if available >= 1 then
+    available = available - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'available', tostring(available), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(window_ms))
+
+local retry_ms = 0
+if allowed == 0 then
+    retry_ms = math.ceil((1 - available) / rate)
+end
+return {allowed, math.floor(available), retry_ms, math.ceil((capacity - available) / rate)}
+"""
+
+
 class RateLimiter:
     """Redis-based rate limiter for API endpoints"""
 
     def __init__(self):
         """Initialize Redis connection"""
         self.redis_client: Optional[redis.Redis] = None
+        self._leaky_bucket: Optional[AsyncScript] = None
         self._initialize_redis()
 
     def _initialize_redis(self):
@@ -29,6 +72,8 @@ class RateLimiter:
                 encoding="utf-8",
                 decode_responses=True
             )
+            # EVALSHA, falling back to EVAL (and caching) on NOSCRIPT
+            self._leaky_bucket = self.redis_client.register_script(LEAKY_BUCKET_SCRIPT)
             logger.info("Rate limiter Redis connection initialized")
         except Exception as e:
             logger.error(f"Failed to connect to Redis for rate limiting: {e}")
@@ -41,7 +86,10 @@ class RateLimiter:
         window_seconds: int
     ) -> tuple[bool, dict]:
         """
-        Check if request is within rate limit
+        Check if request is within rate limit (lazy leaky bucket)
+
+        Bursts of up to max_requests are allowed; after that a slot frees up
+        every window_seconds / max_requests seconds.
 
         Args:
             key: Unique identifier for the rate limit (e.g., IP address, user ID)
@@ -59,32 +107,17 @@ class RateLimiter:
             return True, {"limit": max_requests, "remaining": max_requests, "reset": 0}
 
         try:
-            current_time = datetime.utcnow()
-            window_start = int(current_time.timestamp())
-
-            # Use sliding window algorithm
-            redis_key = f"rate_limit:{key}:{window_start // window_seconds}"
-
-            # Increment counter
-            current_count = await self.redis_client.incr(redis_key)
-
-            # Set expiration on first request
-            if current_count == 1:
-                await self.redis_client.expire(redis_key, window_seconds)
-
-            # Get TTL to calculate reset time
-            ttl = await self.redis_client.ttl(redis_key)
-            reset_time = int(current_time.timestamp()) + ttl
-
-            # Check if limit exceeded
-            is_allowed = current_count <= max_requests
-            remaining = max(0, max_requests - current_count)
+            allowed, remaining, retry_ms, drain_ms = await self._leaky_bucket(
+                keys=[f"rate_limit:{key}"],
+                args=[max_requests, window_seconds],
+            )
+            now = time.time()
 
-            return is_allowed, {
+            return bool(allowed), {
                 "limit": max_requests,
                 "remaining": remaining,
-                "reset": reset_time,
-                "retry_after": ttl if not is_allowed else 0
+                "reset": int(now + drain_ms / 1000),
+                "retry_after": -(-retry_ms // 1000)
             }
 
         except Exception as e:
@@ -201,7 +234,8 @@ async def auth_rate_limit(request: Request) -> None:
     """
     Rate limit for authentication endpoints
     More restrictive to prevent brute force attacks
-    20 requests per minute for development, adjust for production
+    20 requests per minute (a burst of 20, then one every 3 seconds)
+    for development, adjust for production
     """
     await rate_limit_dependency(
         request,
@@ -227,7 +261,7 @@ async def api_rate_limit(request: Request) -> None:
 async def strict_rate_limit(request: Request) -> None:
     """
     Strict rate limit for sensitive operations
-    3 requests per hour
+    3 requests per hour (a burst of 3, then one every 20 minutes)
     """
     await rate_limit_dependency(
         request,
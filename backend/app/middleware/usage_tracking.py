@@ -83,8 +83,8 @@ class UsageTrackingMiddleware(BaseHTTPMiddleware):
             # Try to get tenant_id from request state (set by auth)
             tenant_id = getattr(request.state, 'tenant_id', None)
 
-            if not tenant_id:
-                # Try to extract from JWT token
+            if not tenant_id and not hasattr(request.state, 'tenant_id'):
+                # Auth didn't run for this request; try to extract from JWT token
                 tenant_id = self._extract_tenant_from_token(request)
 
             if not tenant_id:
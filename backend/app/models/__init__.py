@@ -3,7 +3,8 @@ from app.models.base import TenantScopedModel
 from app.models.tenant import Tenant
 from app.models.branch import Branch
 from app.models.user import User
-from app.models.audit_log import AuditLog
+from app.models.audit_log import AuditLog, AuditStatsHourly, AuditStatsUser
+from app.models.background_job import BackgroundJob
 from app.models.file import File, FileCategory
 from app.models.subscription_tier import SubscriptionTier
 from app.models.payment_method import PaymentMethod, PaymentMethodType
@@ -21,6 +22,9 @@ __all__ = [
     "Branch",
     "User",
     "AuditLog",
+    "AuditStatsHourly",
+    "AuditStatsUser",
+    "BackgroundJob",
     "File",
     "FileCategory",
     "SubscriptionTier",
@@ -1,5 +1,4 @@
-from sqlalchemy import Column, String, DateTime, UUID, Text, JSON, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, UUID, Text, JSON, BigInteger, Index, UniqueConstraint, DDL, event, text
 from datetime import datetime
 from app.core.database import Base
 from app.models.base import BaseModel
@@ -106,7 +105,34 @@ class AuditLog(Base, BaseModel):
     # Indexes for common queries
     __table_args__ = (
         Index('ix_audit_logs_user_created', 'user_id', 'created_at'),
-        Index('ix_audit_logs_tenant_created', 'tenant_id', 'created_at'),
+        # Partial indexes over active rows (every endpoint filters is_active):
+        # keyset pagination on (created_at, id), tenant-scoped and unscoped
+        Index('ix_audit_logs_tenant_created_id', 'tenant_id', text('created_at DESC'), text('id DESC'),
+              postgresql_where=text('is_active')),
+        Index('ix_audit_logs_created_id', text('created_at DESC'), text('id DESC'),
+              postgresql_where=text('is_active')),
+        # Tenant-scoped action filters and distinct actions / resources lookups
+        Index('ix_audit_logs_tenant_action_created', 'tenant_id', 'action', text('created_at DESC'),
+              postgresql_where=text('is_active')),
+        Index('ix_audit_logs_tenant_resource', 'tenant_id', 'resource',
+              postgresql_where=text('is_active')),
+        # Tenant-scoped user / status filters on the list endpoint
+        Index('ix_audit_logs_tenant_user_created', 'tenant_id', 'user_id', text('created_at DESC'),
+              postgresql_where=text('is_active')),
+        Index('ix_audit_logs_tenant_status_created', 'tenant_id', 'status', text('created_at DESC'),
+              postgresql_where=text('is_active')),
+        # Trigram indexes for the substring search on the list endpoint
+        # (ILIKE '%...%'); need the pg_trgm extension, see below
+        Index('ix_audit_logs_request_id_trgm', 'request_id',
+              postgresql_using='gin', postgresql_ops={'request_id': 'gin_trgm_ops'},
+              postgresql_where=text('is_active')),
+        Index('ix_audit_logs_ip_address_trgm', 'ip_address',
+              postgresql_using='gin', postgresql_ops={'ip_address': 'gin_trgm_ops'},
+              postgresql_where=text('is_active')),
+        # Block-range index for cross-tenant time-range scans (archiving,
+        # rollups): rows are appended in created_at order, so it stays tiny
+        Index('ix_audit_logs_created_brin', 'created_at',
+              postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
         Index('ix_audit_logs_action_created', 'action', 'created_at'),
         Index('ix_audit_logs_resource_created', 'resource', 'created_at'),
         Index('ix_audit_logs_status_created', 'status', 'created_at'),
@@ -138,6 +164,58 @@ class AuditLog(Base, BaseModel):
         }
 
 
+# The trigram indexes above need pg_trgm; create it along with the table
+# (migrations do the same)
+event.listen(
+    AuditLog.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class AuditStatsHourly(Base):
+    """
+    Hourly rollup of audit_logs: row counts per tenant, action and status.
+
+    Maintained by AuditStatsService (PostgreSQL only). Covers complete hours
+    up to the newest hour_bucket; later logs are counted live.
+    """
+
+    __tablename__ = "audit_stats_hourly"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), nullable=True)  # null for system-level logs
+    hour_bucket = Column(DateTime(timezone=True), nullable=False)
+    action = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)
+    log_count = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'hour_bucket', 'action', 'status',
+                         name='uix_audit_stats_hourly_key', postgresql_nulls_not_distinct=True),
+        Index('ix_audit_stats_hourly_bucket', 'hour_bucket'),
+    )
+
+
+class AuditStatsUser(Base):
+    """
+    Rolled-up audit log counts per tenant and user, over the same hours as
+    AuditStatsHourly, for the distinct-user total.
+    """
+
+    __tablename__ = "audit_stats_users"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    tenant_id = Column(UUID(as_uuid=True), nullable=True)
+    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    log_count = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('tenant_id', 'user_id',
+                         name='uix_audit_stats_users_key', postgresql_nulls_not_distinct=True),
+    )
+
+
 # Action type constants for consistency
 class AuditAction:
     """Standardized audit action names"""
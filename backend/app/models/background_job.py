@@ -0,0 +1,32 @@
+from sqlalchemy import Column, String, DateTime, UUID, Text, JSON, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+import uuid
+
+
+class BackgroundJob(Base):
+    """
+    Status record of a long-running admin job (seed data, database reset,
+    audit log archive) executed via BackgroundTasks.
+
+    Jobs run in whichever worker accepted the request, but their status is
+    polled through any worker, so it lives here rather than in process
+    memory. Maintained by BackgroundJobService; records are purged a while
+    after they were created.
+    """
+
+    __tablename__ = "background_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    action = Column(String(100), nullable=False)  # e.g. 'system.seed_data'
+    tenant_id = Column(UUID(as_uuid=True), nullable=True)  # tenant-scoped jobs only; no FK so a reset can't drop the record
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, completed, failed
+    progress = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index('ix_background_jobs_created_at', 'created_at'),
+    )
@@ -47,7 +47,13 @@ class AuditLogResponse(AuditLogBase):
 class AuditLogListResponse(BaseModel):
     """Paginated audit log list response"""
     logs: List[AuditLogResponse]
-    total: int = Field(..., description="Total number of logs matching filters")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of logs matching filters (only with with_total; "
+                    "estimated from table statistics when no filters apply)",
+    )
+    has_more: bool = Field(..., description="Whether more logs exist after this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page (pass as cursor)")
     limit: int = Field(..., description="Number of logs per page")
     offset: int = Field(..., description="Current page offset")
 
@@ -57,7 +57,10 @@ class BranchInDB(BranchBase):
         from_attributes = True
 
 class BranchResponse(BranchInDB):
-    pass
+    @classmethod
+    def from_branch(cls, branch) -> "BranchResponse":
+        """Create response from a Branch model without re-validating trusted DB values"""
+        return cls.model_construct(**{name: getattr(branch, name) for name in cls.model_fields})
 
 class BranchListResponse(BaseModel):
     branches: list[BranchResponse]
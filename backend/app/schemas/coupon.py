@@ -178,6 +178,11 @@ class CouponRedemptionResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_row(cls, row) -> "CouponRedemptionResponse":
+        """Create response from a row labelled with the response's field names"""
+        return cls.model_construct(**row._mapping)
+
 
 class CouponRedemptionListResponse(BaseModel):
     """Paginated redemption list"""
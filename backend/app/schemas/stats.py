@@ -0,0 +1,49 @@
+"""
+Admin Statistics Schemas
+Response models for the system-wide statistics dashboard
+"""
+from pydantic import BaseModel, Field
+from typing import Dict
+
+
+class SystemStatsOverview(BaseModel):
+    """Platform-wide totals"""
+    total_tenants: int = Field(..., description="Active tenants")
+    total_users: int = Field(..., description="Active users")
+    total_branches: int = Field(..., description="Active branches")
+    verified_users: int = Field(..., description="Active users with a verified email")
+    unverified_users: int = Field(..., description="Active users without a verified email")
+    inactive_tenants: int = Field(..., description="Deactivated tenants")
+
+
+class SystemStatsBreakdowns(BaseModel):
+    """Distribution of active users and tenants"""
+    users_by_role: Dict[str, int] = Field(..., description="Active users keyed by system_/tenant_ role")
+    tenants_by_tier: Dict[str, int] = Field(..., description="Active tenants per subscription tier")
+
+
+class SystemStatsRecentActivity(BaseModel):
+    """Registrations and audit activity in recent windows"""
+    new_tenants_30d: int
+    new_users_30d: int
+    logins_24h: int
+    total_actions_24h: int
+
+
+class SystemStatsGrowth(BaseModel):
+    """Last 7 days compared with the previous 7 days"""
+    tenants_last_7d: int
+    tenants_prev_7d: int
+    tenant_growth_percentage: float
+    users_last_7d: int
+    users_prev_7d: int
+    user_growth_percentage: float
+
+
+class SystemStatistics(BaseModel):
+    """System-wide statistics for super admins"""
+    overview: SystemStatsOverview
+    users_by_role: Dict[str, int] = Field(..., description="Active users keyed by system_/tenant_ role")
+    tenants_by_tier: Dict[str, int] = Field(..., description="Active tenants per subscription tier")
+    recent_activity: SystemStatsRecentActivity
+    growth: SystemStatsGrowth
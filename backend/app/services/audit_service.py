@@ -3,7 +3,9 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from uuid import UUID
 from fastapi import Request
+from loguru import logger
 
+from app.core.database import SessionLocal
 from app.models.audit_log import AuditLog, AuditAction, AuditStatus
 from app.models.user import User
 
@@ -46,6 +48,7 @@ class AuditService:
         user_agent: Optional[str] = None,
         request_id: Optional[str] = None,
         request: Optional[Request] = None,
+        commit: bool = True,
     ) -> AuditLog:
         """
         Log an audit event.
@@ -63,6 +66,8 @@ class AuditService:
             user_agent: Client user agent (will extract from request if not provided)
             request_id: Request ID for correlation (will extract from request if not provided)
             request: FastAPI request object (used to extract metadata if not provided)
+            commit: Commit immediately. Pass False to add the entry to the caller's
+                transaction so it is persisted by the caller's own commit.
 
         Returns:
             AuditLog: The created audit log entry
@@ -91,11 +96,46 @@ class AuditService:
         )
 
         db.add(audit_log)
-        db.commit()
-        db.refresh(audit_log)
+        if commit:
+            db.commit()
+            db.refresh(audit_log)
 
         return audit_log
 
+    @staticmethod
+    def log_action_detached(**kwargs) -> None:
+        """
+        Log an audit event on a session of its own.
+
+        Meant to run from BackgroundTasks after the response has been sent,
+        when the request's session is already closed. Accepts the same
+        keyword arguments as log_action (except db/commit); capture request
+        metadata (ip_address, user_agent, request_id) before scheduling.
+        Failures are logged, never raised.
+        """
+        db = SessionLocal()
+        try:
+            AuditService.log_action(db=db, **kwargs)
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to write audit log entry: {}", kwargs.get("action"))
+        finally:
+            db.close()
+
+    @staticmethod
+    def get_request_meta(request: Request) -> dict:
+        """
+        Capture audit metadata from the request before it goes out of scope.
+
+        Returns ip_address, user_agent and request_id, ready to pass to
+        log_action / log_action_detached from a background task.
+        """
+        return {
+            "ip_address": AuditService._get_client_ip(request),
+            "user_agent": request.headers.get("user-agent"),
+            "request_id": getattr(request.state, "request_id", None),
+        }
+
     @staticmethod
     def _get_client_ip(request: Request) -> str:
         """
@@ -0,0 +1,148 @@
+"""
+Audit Statistics Rollups
+Hourly per-tenant rollups of audit_logs (PostgreSQL only), so audit
+statistics sum a few rollup rows plus the not-yet-rolled-up tail instead of
+aggregating the whole table.
+
+Rollups cover complete hours up to the newest hour_bucket; anything after
+that is counted live from audit_logs. Archive jobs subtract the rows they
+delete and clearing the audit log truncates the rollups with it.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import bindparam, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.audit_log import AuditLog, AuditStatsHourly, AuditStatsUser
+
+# Transaction-scoped advisory lock serialising roll-ups with archive deletes
+ROLLUP_LOCK_KEY = 0x61756474
+
+# Only hours that ended at least this long ago are rolled up, so
+# transactions still open across the hour boundary are not missed
+ROLLUP_LAG = timedelta(hours=1)
+
+
+class AuditStatsService:
+    """Maintenance of the audit_stats_hourly / audit_stats_users rollups"""
+
+    @staticmethod
+    def rolled_up_until(db: Session) -> Optional[datetime]:
+        """End of the newest rolled-up hour, or None if nothing is rolled up yet."""
+        newest = db.scalar(select(func.max(AuditStatsHourly.hour_bucket)))
+        return newest + timedelta(hours=1) if newest else None
+
+    @staticmethod
+    def refresh(db: Session) -> None:
+        """
+        Roll up every complete hour after the newest rollup bucket.
+
+        Commits. Returns without doing anything while another worker holds
+        the rollup lock; the statistics stay exact meanwhile because
+        whatever isn't rolled up is counted live.
+        """
+        if not db.scalar(select(func.pg_try_advisory_xact_lock(ROLLUP_LOCK_KEY))):
+            db.rollback()
+            return
+
+        since = AuditStatsService.rolled_up_until(db)
+        until = db.scalar(select(func.date_trunc("hour", func.now() - ROLLUP_LAG)))
+        if since is not None and since >= until:
+            db.rollback()
+            return
+
+        criteria = [AuditLog.is_active == True, AuditLog.created_at < until]
+        if since is not None:
+            criteria.append(AuditLog.created_at >= since)
+
+        # Inline 'hour' so the GROUP BY expression matches the selected one
+        # (a bound parameter would appear as two different placeholders)
+        bucket = func.date_trunc(literal_column("'hour'"), AuditLog.created_at)
+        hourly = insert(AuditStatsHourly).from_select(
+            ["id", "tenant_id", "hour_bucket", "action", "status", "log_count"],
+            select(
+                func.gen_random_uuid(), AuditLog.tenant_id, bucket,
+                AuditLog.action, AuditLog.status, func.count(),
+            ).where(*criteria).group_by(
+                AuditLog.tenant_id, bucket, AuditLog.action, AuditLog.status
+            ),
+        )
+        db.execute(hourly.on_conflict_do_update(
+            constraint="uix_audit_stats_hourly_key",
+            set_={"log_count": AuditStatsHourly.log_count + hourly.excluded.log_count},
+        ))
+
+        users = insert(AuditStatsUser).from_select(
+            ["id", "tenant_id", "user_id", "log_count"],
+            select(
+                func.gen_random_uuid(), AuditLog.tenant_id, AuditLog.user_id, func.count(),
+            ).where(*criteria, AuditLog.user_id.isnot(None)).group_by(
+                AuditLog.tenant_id, AuditLog.user_id
+            ),
+        )
+        db.execute(users.on_conflict_do_update(
+            constraint="uix_audit_stats_users_key",
+            set_={"log_count": AuditStatsUser.log_count + users.excluded.log_count},
+        ))
+        db.commit()
+
+    @staticmethod
+    def subtract_deleted(db: Session, rows: Iterable) -> Iterator:
+        """
+        Pass deleted audit log rows through, then subtract the rolled-up
+        ones from the rollups once `rows` is exhausted.
+
+        Rows need user_id, tenant_id, action, status, created_at and
+        is_active; like refresh, only active rows count. The rollup lock is
+        taken before the first row is pulled and held until the caller's
+        commit, so no roll-up can count rows being deleted. Nothing is
+        committed here.
+        """
+        db.execute(select(func.pg_advisory_xact_lock(ROLLUP_LOCK_KEY)))
+        until = AuditStatsService.rolled_up_until(db)
+
+        hourly: Counter = Counter()
+        users: Counter = Counter()
+        for row in rows:
+            if row.is_active and until is not None and row.created_at < until:
+                # created_at comes back in the session time zone, the same
+                # one date_trunc() bucketed it in
+                hour = row.created_at.replace(minute=0, second=0, microsecond=0)
+                hourly[(row.tenant_id, hour, row.action, row.status)] += 1
+                if row.user_id:
+                    users[(row.tenant_id, row.user_id)] += 1
+            yield row
+
+        if hourly:
+            hourly_table = AuditStatsHourly.__table__
+            db.execute(
+                update(hourly_table)
+                .where(
+                    hourly_table.c.tenant_id.is_not_distinct_from(bindparam("b_tenant_id")),
+                    hourly_table.c.hour_bucket == bindparam("b_hour"),
+                    hourly_table.c.action == bindparam("b_action"),
+                    hourly_table.c.status == bindparam("b_status"),
+                )
+                .values(log_count=hourly_table.c.log_count - bindparam("b_count")),
+                [
+                    {"b_tenant_id": t, "b_hour": h, "b_action": a, "b_status": s, "b_count": n}
+                    for (t, h, a, s), n in hourly.items()
+                ],
+            )
+        if users:
+            users_table = AuditStatsUser.__table__
+            db.execute(
+                update(users_table)
+                .where(
+                    users_table.c.tenant_id.is_not_distinct_from(bindparam("b_tenant_id")),
+                    users_table.c.user_id == bindparam("b_user_id"),
+                )
+                .values(log_count=users_table.c.log_count - bindparam("b_count")),
+                [
+                    {"b_tenant_id": t, "b_user_id": u, "b_count": n}
+                    for (t, u), n in users.items()
+                ],
+            )
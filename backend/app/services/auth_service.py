@@ -8,7 +8,7 @@ User Architecture:
 - Tenant Users (tenant_id=UUID): tenant_role = 'owner' | 'admin' | 'member'
 """
 from sqlalchemy.orm import Session
-from fastapi import HTTPException, status, Request
+from fastapi import BackgroundTasks, HTTPException, status, Request
 from datetime import datetime, timedelta
 from uuid import UUID
 import secrets
@@ -114,11 +114,8 @@ class AuthService:
                 Tenant.id == user.tenant_id
             ).first()
 
-        # Update last login
+        # Update last login; the login audit entry rides on the same commit
         user.last_login_at = datetime.utcnow()
-        self.db.commit()
-
-        # Log successful login
         AuditService.log_action(
             db=self.db,
             user_id=user.id,
@@ -132,8 +129,10 @@ class AuthService:
                 "tenant_role": user.tenant_role.value if user.tenant_role else None,
             },
             status=AuditStatus.SUCCESS,
-            request=request
+            request=request,
+            commit=False,
         )
+        self.db.commit()
 
         # Create tokens
         token_data = self._build_token_data(user)
@@ -159,13 +158,18 @@ class AuthService:
             )
         )
 
-    async def logout(self, user: User, request: Request = None) -> dict:
-        """Log user logout for audit purposes"""
+    def logout(
+        self,
+        user: User,
+        background_tasks: BackgroundTasks,
+        request: Request = None,
+    ) -> dict:
+        """Log user logout for audit purposes (written after the response is sent)"""
 
         # Log logout event
         if request:
-            AuditService.log_action(
-                db=self.db,
+            background_tasks.add_task(
+                AuditService.log_action_detached,
                 user_id=user.id,
                 tenant_id=user.tenant_id,
                 action=AuditAction.LOGOUT,
@@ -173,7 +177,7 @@ class AuthService:
                 resource_id=user.id,
                 details={"email": user.email},
                 status=AuditStatus.SUCCESS,
-                request=request
+                **AuditService.get_request_meta(request),
             )
 
         return {"message": "Logged out successfully"}
@@ -460,7 +464,7 @@ class AuthService:
             message="Password has been reset successfully. You can now login with your new password."
         )
 
-    async def verify_email(self, request: VerifyEmailRequest) -> VerifyEmailResponse:
+    def verify_email(self, request: VerifyEmailRequest) -> VerifyEmailResponse:
         """Verify user email with token"""
 
         # Find user with matching verification token
@@ -569,7 +573,7 @@ class AuthService:
                 detail="Invalid or expired refresh token"
             )
 
-    async def accept_invite(
+    def accept_invite(
         self,
         token: str,
         password: str,
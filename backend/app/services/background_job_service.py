@@ -0,0 +1,109 @@
+"""
+Background Job Records
+Status, progress and result of long-running admin jobs (seed data, database
+reset, audit log archive), stored in background_jobs so that any worker can
+answer a status poll, not just the one running the job.
+
+Every method works on a short session of its own: jobs update their record
+while their own work sits in a long, uncommitted transaction, and records
+must be visible to pollers straight away.
+"""
+from datetime import timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, update
+
+from app.core.database import SessionLocal
+from app.models.background_job import BackgroundJob
+
+# Job records are purged this long after they were created
+JOB_RETENTION = timedelta(days=1)
+
+
+class BackgroundJobService:
+    """Bookkeeping for jobs run via BackgroundTasks"""
+
+    @staticmethod
+    def create(
+        action: str,
+        tenant_id: Optional[UUID] = None,
+        progress: Optional[dict] = None,
+    ) -> str:
+        """Record a new pending job and return its task ID; purges expired records."""
+        db = SessionLocal()
+        try:
+            db.execute(
+                delete(BackgroundJob)
+                .where(BackgroundJob.created_at < func.now() - JOB_RETENTION)
+            )
+            job = BackgroundJob(action=action, tenant_id=tenant_id, progress=progress)
+            db.add(job)
+            db.commit()
+            return str(job.id)
+        finally:
+            db.close()
+
+    @staticmethod
+    def get(task_id: str) -> Optional[dict]:
+        """Status dict of a job, or None if there is no such (unexpired) job."""
+        try:
+            job_id = UUID(task_id)
+        except ValueError:
+            return None
+
+        db = SessionLocal()
+        try:
+            job = db.get(BackgroundJob, job_id)
+            if not job:
+                return None
+            return {
+                "task_id": str(job.id),
+                "action": job.action,
+                "tenant_id": str(job.tenant_id) if job.tenant_id else None,
+                "status": job.status,
+                "progress": job.progress,
+                "result": job.result,
+                "error": job.error,
+                "created_at": job.created_at.isoformat(),
+                "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+            }
+        finally:
+            db.close()
+
+    @staticmethod
+    def start(task_id: str) -> None:
+        """Mark a job as running."""
+        BackgroundJobService._update(task_id, status="running")
+
+    @staticmethod
+    def report_progress(task_id: str, progress: dict) -> None:
+        """Replace a running job's progress."""
+        BackgroundJobService._update(task_id, progress=progress)
+
+    @staticmethod
+    def complete(task_id: str, result: dict) -> None:
+        """Mark a job as completed with its result."""
+        BackgroundJobService._update(
+            task_id, status="completed", result=result, finished_at=func.now()
+        )
+
+    @staticmethod
+    def fail(task_id: str, error: str) -> None:
+        """Mark a job as failed with its error message."""
+        BackgroundJobService._update(
+            task_id, status="failed", error=error, finished_at=func.now()
+        )
+
+    @staticmethod
+    def _update(task_id: str, **values) -> None:
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == UUID(task_id))
+                .values(**values)
+            )
+            db.commit()
+        finally:
+            db.close()
@@ -3,7 +3,8 @@ Coupon Service for managing promotional discounts.
 Handles coupon validation, application, and redemption tracking.
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, select
+from sqlalchemy.engine import Row
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Tuple
 from uuid import UUID
@@ -21,6 +22,24 @@ from app.schemas.coupon import (
 )
 
 
+# Columns of a CouponRedemptionResponse, labelled with its field names
+REDEMPTION_RESPONSE_COLUMNS = (
+    CouponRedemption.id,
+    CouponRedemption.coupon_id,
+    CouponRedemption.tenant_id,
+    CouponRedemption.upgrade_request_id,
+    CouponRedemption.discount_type,
+    CouponRedemption.discount_value,
+    CouponRedemption.discount_applied,
+    CouponRedemption.applied_at,
+    CouponRedemption.expires_at,
+    CouponRedemption.is_expired,
+    Coupon.code.label("coupon_code"),
+    Coupon.name.label("coupon_name"),
+    CouponRedemption.created_at,
+)
+
+
 class CouponService:
     """Service for coupon management and validation"""
 
@@ -150,13 +169,18 @@ class CouponService:
         tenant_id: UUID,
         tier_code: Optional[str] = None,
         billing_period: Optional[str] = None,
-        amount: Optional[int] = None
+        amount: Optional[int] = None,
+        coupon: Optional[Coupon] = None
     ) -> CouponValidateResponse:
         """
         Validate a coupon code for a tenant.
         Returns validation result with discount details.
+
+        Pass `coupon` when the caller already loaded it by `code`, to skip
+        looking it up again.
         """
-        coupon = CouponService.get_coupon_by_code(db, code)
+        if coupon is None:
+            coupon = CouponService.get_coupon_by_code(db, code)
 
         if not coupon:
             return CouponValidateResponse(
@@ -275,13 +299,18 @@ class CouponService:
         tenant_id: UUID,
         upgrade_request_id: UUID,
         original_amount: int,
-        created_by_id: Optional[UUID] = None
+        created_by_id: Optional[UUID] = None,
+        coupon: Optional[Coupon] = None
     ) -> Tuple[Optional[CouponRedemption], int, str]:
         """
         Apply a coupon to an upgrade request.
         Returns: (redemption, discount_amount, description)
+
+        Pass `coupon` when the caller already loaded it, to skip looking it
+        up again by `coupon_id`.
         """
-        coupon = CouponService.get_coupon_by_id(db, coupon_id)
+        if coupon is None:
+            coupon = CouponService.get_coupon_by_id(db, coupon_id)
         if not coupon:
             return None, 0, "Coupon not found"
 
@@ -332,22 +361,56 @@ class CouponService:
         page: int = 1,
         page_size: int = 20,
         include_expired: bool = False
-    ) -> Tuple[List[CouponRedemption], int]:
-        """Get coupon redemptions for a tenant"""
-        query = db.query(CouponRedemption).filter(
+    ) -> Tuple[List[Row], int]:
+        """Get a page of coupon redemptions for a tenant as response rows"""
+        criteria = [
             CouponRedemption.tenant_id == tenant_id,
-            CouponRedemption.is_active == True
-        )
-
+            CouponRedemption.is_active == True,
+        ]
         if not include_expired:
-            query = query.filter(CouponRedemption.is_expired == False)
+            criteria.append(CouponRedemption.is_expired == False)
 
-        total = query.count()
-        redemptions = query.order_by(
-            CouponRedemption.applied_at.desc()
-        ).offset((page - 1) * page_size).limit(page_size).all()
+        return CouponService._redemption_page(db, criteria, page, page_size)
 
-        return redemptions, total
+    @staticmethod
+    def get_coupon_redemptions(
+        db: Session,
+        coupon_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> Tuple[List[Row], int]:
+        """Get a page of redemptions of a coupon as response rows"""
+        criteria = [
+            CouponRedemption.coupon_id == coupon_id,
+            CouponRedemption.is_active == True,
+        ]
+        return CouponService._redemption_page(db, criteria, page, page_size)
+
+    @staticmethod
+    def _redemption_page(
+        db: Session,
+        criteria: list,
+        page: int,
+        page_size: int,
+    ) -> Tuple[List[Row], int]:
+        """
+        Count the matching redemptions and fetch one page of
+        REDEMPTION_RESPONSE_COLUMNS rows, newest first. The coupon's code and
+        name come from a join in the same SELECT; no ORM objects are built.
+        """
+        total = db.scalar(
+            select(func.count()).select_from(CouponRedemption).where(*criteria)
+        )
+        rows = db.execute(
+            select(*REDEMPTION_RESPONSE_COLUMNS)
+            .outerjoin(Coupon, Coupon.id == CouponRedemption.coupon_id)
+            .where(*criteria)
+            .order_by(CouponRedemption.applied_at.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        ).all()
+
+        return rows, total
 
     @staticmethod
     def get_active_tenant_discount(
@@ -3,10 +3,13 @@ Feature Service
 
 Business logic for feature flag management and checking.
 """
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-from typing import Set, List, Dict, Optional
+from typing import FrozenSet, Set, List, Dict, Optional
+from uuid import UUID
 import logging
 
+from app.core.cache import ttl_cache
 from app.models.tenant import Tenant
 from app.models.subscription_tier import SubscriptionTier
 from app.core.features import (
@@ -17,22 +20,31 @@ from app.core.features import (
     get_feature_metadata,
     get_features_by_module,
     get_all_feature_codes,
+    get_feature_code_set,
 )
 
 logger = logging.getLogger(__name__)
 
+# Tier feature sets are read on every feature check; tier edits made in this
+# worker clear the cache, other workers pick them up within the TTL
+TIER_FEATURES_CACHE_TTL = 60
+
 
 class FeatureService:
     """Service for feature flag operations"""
 
     @staticmethod
-    def get_tier_features(db: Session, tier_code: str) -> Set[str]:
+    @ttl_cache(seconds=TIER_FEATURES_CACHE_TTL)
+    def get_tier_features(db: Session, tier_code: str) -> FrozenSet[str]:
         """
         Get features for a tier from database or defaults.
 
         Priority:
         1. Database tier.features if populated
         2. TIER_DEFAULT_FEATURES from code
+
+        Cached per tier code for TIER_FEATURES_CACHE_TTL seconds; call
+        FeatureService.get_tier_features.cache_clear() after editing a tier.
         """
         tier = db.query(SubscriptionTier).filter(
             SubscriptionTier.code == tier_code,
@@ -45,10 +57,10 @@ class FeatureService:
                 # Check if these are actual feature codes (contain dots)
                 # vs marketing strings
                 if any("." in str(f) for f in tier.features):
-                    return set(tier.features)
+                    return frozenset(tier.features)
 
         # Fall back to defaults
-        return TIER_DEFAULT_FEATURES.get(tier_code, set())
+        return frozenset(TIER_DEFAULT_FEATURES.get(tier_code, ()))
 
     @staticmethod
     def get_tenant_features(db: Session, tenant: Tenant) -> Set[str]:
@@ -105,20 +117,21 @@ class FeatureService:
 
         This is for adding features beyond what the tier provides.
         """
-        if not tenant.features:
-            tenant.features = {}
+        # Build a new dict: in-place changes to a JSON column aren't flushed
+        features = dict(tenant.features or {})
 
-        enabled = tenant.features.get("enabled", [])
+        enabled = list(features.get("enabled", []))
         if feature_code not in enabled:
             enabled.append(feature_code)
-            tenant.features["enabled"] = enabled
+            features["enabled"] = enabled
 
         # Remove from disabled if present
-        disabled = tenant.features.get("disabled", [])
+        disabled = list(features.get("disabled", []))
         if feature_code in disabled:
             disabled.remove(feature_code)
-            tenant.features["disabled"] = disabled
+            features["disabled"] = disabled
 
+        tenant.features = features
         db.commit()
         logger.info(f"Enabled feature '{feature_code}' for tenant {tenant.id}")
 
@@ -129,29 +142,45 @@ class FeatureService:
 
         This is for removing features that the tier would normally provide.
         """
-        if not tenant.features:
-            tenant.features = {}
+        # Build a new dict: in-place changes to a JSON column aren't flushed
+        features = dict(tenant.features or {})
 
-        disabled = tenant.features.get("disabled", [])
+        disabled = list(features.get("disabled", []))
         if feature_code not in disabled:
             disabled.append(feature_code)
-            tenant.features["disabled"] = disabled
+            features["disabled"] = disabled
 
         # Remove from enabled if present
-        enabled = tenant.features.get("enabled", [])
+        enabled = list(features.get("enabled", []))
         if feature_code in enabled:
             enabled.remove(feature_code)
-            tenant.features["enabled"] = enabled
+            features["enabled"] = enabled
 
+        tenant.features = features
         db.commit()
         logger.info(f"Disabled feature '{feature_code}' for tenant {tenant.id}")
 
     @staticmethod
-    def reset_tenant_overrides(db: Session, tenant: Tenant) -> None:
-        """Reset tenant to tier-default features (remove all overrides)"""
-        tenant.features = {}
+    def reset_tenant_overrides(db: Session, tenant_id: UUID) -> Optional[str]:
+        """
+        Reset tenant to tier-default features (remove all overrides).
+
+        Single UPDATE ... RETURNING; returns the tenant's tier, or None if
+        the tenant doesn't exist.
+        """
+        tier = db.execute(
+            update(Tenant)
+            .where(Tenant.id == tenant_id)
+            .values(features={})
+            .returning(Tenant.tier)
+        ).scalar_one_or_none()
+        if tier is None:
+            db.rollback()
+            return None
+
         db.commit()
-        logger.info(f"Reset feature overrides for tenant {tenant.id}")
+        logger.info(f"Reset feature overrides for tenant {tenant_id}")
+        return tier
 
     @staticmethod
     def get_features_with_status(
@@ -240,13 +269,14 @@ class FeatureService:
             raise ValueError(f"Tier '{tier_code}' not found")
 
         # Validate feature codes
-        valid_codes = set(get_all_feature_codes())
+        valid_codes = get_feature_code_set()
         invalid = [f for f in features if f not in valid_codes]
         if invalid:
             raise ValueError(f"Invalid feature codes: {invalid}")
 
         tier.features = features
         db.commit()
+        FeatureService.get_tier_features.cache_clear()
         db.refresh(tier)
 
         logger.info(f"Updated features for tier '{tier_code}': {len(features)} features")
@@ -16,6 +16,7 @@ from app.schemas.subscription_tier import (
     PublicTierResponse,
 )
 from app.core.exceptions import NotFoundException, ConflictException
+from app.services.feature_service import FeatureService
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +61,7 @@ class SubscriptionTierService:
         self.db.commit()
         self.db.refresh(tier)
 
+        FeatureService.get_tier_features.cache_clear()
         logger.info(f"Created subscription tier: {tier.code}")
         return tier
 
@@ -113,6 +115,7 @@ class SubscriptionTierService:
         self.db.commit()
         self.db.refresh(tier)
 
+        FeatureService.get_tier_features.cache_clear()
         logger.info(f"Updated subscription tier: {tier.code}")
         return tier
 
@@ -139,6 +142,7 @@ class SubscriptionTierService:
 
         self.db.commit()
 
+        FeatureService.get_tier_features.cache_clear()
         logger.info(f"Deleted subscription tier: {tier.code}")
         return True
 
@@ -30,7 +30,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_db_ro
 from app.core.security import create_access_token, get_password_hash
 from app.models.tenant import Tenant
 from app.models.branch import Branch
@@ -95,6 +95,28 @@ def db_session(engine, _session_factory) -> Session:
     connection.close()
 
 
+@pytest.fixture()
+def detached_sessions(db_session, monkeypatch):
+    """
+    Point SessionLocal at the test connection for code that opens sessions
+    of its own (background jobs, job records, detached audit writes).
+
+    Each such session joins the test transaction through a savepoint, so its
+    commits and rollbacks stay inside the test and are undone with it.
+    """
+    from app.api.v1.endpoints import admin_tools, audit
+    from app.services import audit_service, background_job_service
+
+    def _session_local():
+        return Session(
+            bind=db_session.connection(), join_transaction_mode="create_savepoint",
+        )
+
+    for module in (admin_tools, audit, audit_service, background_job_service):
+        monkeypatch.setattr(module, "SessionLocal", _session_local)
+    return _session_local
+
+
 # ---------------------------------------------------------------------------
 # FastAPI test clients
 # ---------------------------------------------------------------------------
@@ -106,6 +128,7 @@ def client(db_session) -> TestClient:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_db_ro] = _override_get_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -118,6 +141,7 @@ async def async_client(db_session) -> AsyncClient:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_db_ro] = _override_get_db
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -365,7 +389,7 @@ def auth_headers():
 
 
 # ---------------------------------------------------------------------------
-# Autouse fixtures: disable email and rate limiting
+# Autouse fixtures: disable email and rate limiting, reset caches
 # ---------------------------------------------------------------------------
 
 @pytest.fixture(autouse=True)
@@ -383,6 +407,14 @@ def mock_email_service(monkeypatch):
                 monkeypatch.setattr(svc, method_name, _noop)
 
 
+@pytest.fixture(autouse=True)
+def clear_tier_feature_cache():
+    """Each test rolls back its tiers, so drop tier feature sets cached by the last one."""
+    from app.services.feature_service import FeatureService
+
+    FeatureService.get_tier_features.cache_clear()
+
+
 @pytest.fixture(autouse=True)
 def disable_rate_limiting():
     """Override rate limit dependencies to no-ops for all tests."""
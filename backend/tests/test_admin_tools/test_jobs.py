@@ -0,0 +1,119 @@
+"""Seed-data / reset-database background jobs and their status polling."""
+from sqlalchemy import select
+
+from app.api.v1.endpoints.admin_tools import (
+    _bulk_insert_seed_users,
+    _copy_seed_users,
+    _iter_seed_user_rows,
+)
+from app.models.tenant import Tenant
+from app.models.user import User, TenantRole
+
+SEED_SUBDOMAINS = ("acme", "techstart", "demo")
+
+
+def _run_and_poll(client, headers, path):
+    """POST a job endpoint and return its final status record."""
+    resp = client.post(f"/api/v1/admin/tools/{path}", headers=headers)
+    assert resp.status_code == 202
+    task_id = resp.json()["task_id"]
+
+    # TestClient runs background tasks before returning the response
+    resp = client.get(f"/api/v1/admin/tools/jobs/{task_id}", headers=headers)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+class TestSeedUserLoading:
+    """COPY and the executemany fallback load the same user rows."""
+
+    def _load(self, db_session, create_tenant, create_branch, loader):
+        tenant = create_tenant()
+        hq = create_branch(tenant_id=tenant.id, name="Head Office", code="HQ", is_hq=True)
+        rows = _iter_seed_user_rows([
+            (tenant.id, {"name": tenant.name, "subdomain": tenant.subdomain}, hq.id),
+        ])
+
+        count = loader(db_session, rows)
+
+        users = db_session.scalars(
+            select(User).where(User.tenant_id == tenant.id).order_by(User.email)
+        ).all()
+        assert count == len(users) == 3
+        return tenant, hq, users
+
+    def _assert_seed_users(self, tenant, hq, users):
+        assert [u.email for u in users] == [
+            f"{role}@{tenant.subdomain}.com" for role in ("admin", "member", "owner")
+        ]
+        assert {u.tenant_role for u in users} == set(TenantRole)
+        for user in users:
+            assert user.default_branch_id == hq.id
+            assert user.permissions == []
+            assert user.meta_data == {}
+            assert user.is_active and user.is_verified
+
+    def test_copy(self, db_session, create_tenant, create_branch):
+        self._assert_seed_users(
+            *self._load(db_session, create_tenant, create_branch, _copy_seed_users)
+        )
+
+    def test_executemany_fallback(self, db_session, create_tenant, create_branch):
+        self._assert_seed_users(
+            *self._load(db_session, create_tenant, create_branch, _bulk_insert_seed_users)
+        )
+
+
+class TestSeedAndResetJobs:
+    """Jobs run on their own session; any worker can answer the poll."""
+
+    def test_seed_then_poll(
+        self, client, db_session, detached_sessions, super_admin, auth_headers,
+    ):
+        job = _run_and_poll(client, auth_headers(super_admin), "seed-data")
+
+        assert job["status"] == "completed"
+        assert job["result"]["created"]["tenants"] == 3
+        assert job["result"]["created"]["users"] == 9
+
+        tenants = db_session.scalars(
+            select(Tenant).where(Tenant.subdomain.in_(SEED_SUBDOMAINS))
+        ).all()
+        assert len(tenants) == 3
+        owner = db_session.scalar(select(User).where(User.email == "owner@acme.com"))
+        assert owner is not None
+        assert owner.tenant_role == TenantRole.OWNER
+
+        # Seeding again finds every demo tenant already there
+        job = _run_and_poll(client, auth_headers(super_admin), "seed-data")
+        assert job["status"] == "completed"
+        assert job["result"]["created"] == {"tenants": 0, "branches": 0, "users": 0}
+
+    def test_reset_then_poll(
+        self, client, db_session, detached_sessions, tenant_with_admin,
+        super_admin, auth_headers,
+    ):
+        job = _run_and_poll(client, auth_headers(super_admin), "reset-database")
+
+        assert job["status"] == "completed"
+        assert job["result"]["deleted"]["tenants"] >= 1
+        assert "warning" in job["result"]
+        assert db_session.scalar(select(Tenant.id).limit(1)) is None
+        assert db_session.scalar(
+            select(User.id).where(User.tenant_id.isnot(None)).limit(1)
+        ) is None
+        assert db_session.scalar(select(User.id).where(User.id == super_admin.id))
+
+        # Nothing left to delete: no deletes and no data-loss warning
+        job = _run_and_poll(client, auth_headers(super_admin), "reset-database")
+        assert job["result"]["message"] == "Database already clean"
+        assert "warning" not in job["result"]
+
+    def test_unknown_job_is_not_found(
+        self, client, detached_sessions, super_admin, auth_headers,
+    ):
+        resp = client.get(
+            "/api/v1/admin/tools/jobs/00000000-0000-0000-0000-000000000000",
+            headers=auth_headers(super_admin),
+        )
+        assert resp.status_code == 404
@@ -0,0 +1,123 @@
+"""Audit log archive jobs — export, delete, status polling and download."""
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.api.v1.endpoints import audit
+from app.models.audit_log import AuditLog
+
+OLD = datetime(2020, 1, 1, tzinfo=timezone.utc)
+CUTOFF = datetime(2021, 1, 1, tzinfo=timezone.utc)
+ARCHIVE_URL = "/api/v1/admin/audit-logs/archive"
+
+
+@pytest.fixture()
+def archive_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit, "ARCHIVE_DIR", tmp_path)
+    return tmp_path
+
+
+def _add_old_logs(db_session, count):
+    db_session.add_all([
+        AuditLog(action="user.update", resource="user", details={"n": i}, created_at=OLD)
+        for i in range(count)
+    ])
+    db_session.flush()
+
+
+def _archive_and_poll(client, headers):
+    """POST an archive job and return its final status record."""
+    resp = client.post(
+        ARCHIVE_URL, params={"before_date": CUTOFF.isoformat()}, headers=headers,
+    )
+    assert resp.status_code == 202
+    body = resp.json()
+    assert body["status_url"] == f"{ARCHIVE_URL}/{body['task_id']}"
+
+    # TestClient runs background tasks before returning the response
+    resp = client.get(body["status_url"], headers=headers)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def _old_log_count(db_session):
+    return db_session.scalar(
+        select(func.count()).select_from(AuditLog).where(AuditLog.created_at < CUTOFF)
+    )
+
+
+class TestArchiveJob:
+
+    def test_archive_then_poll_and_download(
+        self, client, db_session, detached_sessions, archive_dir, super_admin, auth_headers,
+    ):
+        _add_old_logs(db_session, 5)
+        recent = AuditLog(action="user.create", resource="user")
+        db_session.add(recent)
+        db_session.flush()
+        headers = auth_headers(super_admin)
+
+        job = _archive_and_poll(client, headers)
+
+        assert job["status"] == "completed"
+        assert job["result"]["archived"] == 5
+        assert job["progress"]["records_processed"] == 5
+        assert _old_log_count(db_session) == 0
+        assert db_session.scalar(select(AuditLog.id).where(AuditLog.id == recent.id))
+
+        name = job["result"]["file"]["name"]
+        assert (archive_dir / name).is_file()
+        assert audit._archive_meta_path(archive_dir / name).is_file()
+        assert not list(archive_dir.glob("*.partial"))
+
+        listing = client.get("/api/v1/admin/audit-logs/archives", headers=headers).json()
+        assert [(a["name"], a["total_records"]) for a in listing["archives"]] == [(name, 5)]
+
+        resp = client.get(f"/api/v1/admin/audit-logs/archives/{name}", headers=headers)
+        assert resp.status_code == 200
+        archived = resp.json()
+        assert archived["total_records"] == 5
+        assert sorted(log["details"]["n"] for log in archived["logs"]) == list(range(5))
+
+    def test_nothing_to_archive(
+        self, client, detached_sessions, archive_dir, super_admin, auth_headers,
+    ):
+        job = _archive_and_poll(client, auth_headers(super_admin))
+
+        assert job["status"] == "completed"
+        assert job["result"]["archived"] == 0
+        assert job["result"]["file"] is None
+        assert not list(archive_dir.iterdir())
+
+    def test_failed_write_rolls_back_the_deletes(
+        self, client, db_session, detached_sessions, archive_dir, super_admin,
+        auth_headers, monkeypatch,
+    ):
+        _add_old_logs(db_session, 5)
+        archive_log_dict = audit._archive_log_dict
+        written = []
+
+        def _fail_midway(row, include_tenant_id):
+            if len(written) == 3:
+                raise OSError("disk full")
+            written.append(row)
+            return archive_log_dict(row, include_tenant_id)
+
+        monkeypatch.setattr(audit, "_archive_log_dict", _fail_midway)
+
+        job = _archive_and_poll(client, auth_headers(super_admin))
+
+        assert job["status"] == "failed"
+        assert "disk full" in job["error"]
+        assert _old_log_count(db_session) == 5
+        assert not list(archive_dir.iterdir())
+
+    def test_unknown_job_is_not_found(
+        self, client, detached_sessions, super_admin, auth_headers,
+    ):
+        resp = client.get(
+            f"{ARCHIVE_URL}/00000000-0000-0000-0000-000000000000",
+            headers=auth_headers(super_admin),
+        )
+        assert resp.status_code == 404
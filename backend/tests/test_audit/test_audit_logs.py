@@ -0,0 +1,283 @@
+"""Audit log listing tests — query count regressions."""
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import CacheStats
+
+from app.models.audit_log import AuditLog
+
+
+class TestAuditLogListQueries:
+    """Listing audit logs must not issue per-row queries."""
+
+    def test_list_fetches_page_in_one_query(
+        self, client, db_session, super_admin, auth_headers,
+    ):
+        for i in range(5):
+            db_session.add(AuditLog(action="user.update", resource="user", details={"n": i}))
+        db_session.flush()
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        connection = db_session.get_bind()
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            resp = client.get("/api/v1/admin/audit-logs/", headers=auth_headers(super_admin))
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+        assert resp.status_code == 200
+        assert len(resp.json()["logs"]) == 5
+        audit_statements = [s for s in statements if "audit_logs" in s]
+        assert len(audit_statements) == 1
+
+    def test_list_with_total_adds_one_query(
+        self, client, db_session, super_admin, auth_headers,
+    ):
+        for i in range(3):
+            db_session.add(AuditLog(action="user.update", resource="user", details={"n": i}))
+        db_session.flush()
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        connection = db_session.get_bind()
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            resp = client.get(
+                "/api/v1/admin/audit-logs/?with_total=true&action=user.update",
+                headers=auth_headers(super_admin),
+            )
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+        assert resp.status_code == 200
+        assert resp.json()["total"] == 3
+        audit_statements = [s for s in statements if "audit_logs" in s]
+        assert len(audit_statements) <= 2
+
+    def test_filter_values_reuse_compiled_statement(
+        self, client, db_session, super_admin, auth_headers,
+    ):
+        db_session.add(AuditLog(action="user.update", resource="user"))
+        db_session.flush()
+
+        cache_hits = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if "audit_logs" in statement:
+                cache_hits.append(context.cache_hit)
+
+        connection = db_session.get_bind()
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            for action in ("user.update", "user.create", "user.delete"):
+                resp = client.get(
+                    f"/api/v1/admin/audit-logs/?action={action}",
+                    headers=auth_headers(super_admin),
+                )
+                assert resp.status_code == 200
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+        # Same filter shape, different values: compiled once, then cached
+        assert len(cache_hits) == 3
+        assert all(hit == CacheStats.CACHE_HIT for hit in cache_hits[1:])
+
+
+class TestAuditLogCursorPagination:
+    """Keyset cursor pages over (created_at, id)."""
+
+    def _add_tied_logs(self, db_session, count):
+        from datetime import datetime, timezone
+
+        # Identical timestamps: only the id tiebreaker orders these
+        created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        logs = [
+            AuditLog(action="cursor.test", resource="user", created_at=created_at)
+            for _ in range(count)
+        ]
+        db_session.add_all(logs)
+        db_session.flush()
+        return {str(log.id) for log in logs}
+
+    def test_pages_walk_ties_without_gaps_or_duplicates(
+        self, client, db_session, super_admin, auth_headers,
+    ):
+        expected = self._add_tied_logs(db_session, 7)
+
+        seen = []
+        url = "/api/v1/admin/audit-logs/?action=cursor.test&limit=3"
+        cursor = None
+        for _ in range(5):
+            resp = client.get(
+                url + (f"&cursor={cursor}" if cursor else ""),
+                headers=auth_headers(super_admin),
+            )
+            assert resp.status_code == 200
+            page = resp.json()
+            seen.extend(log["id"] for log in page["logs"])
+            cursor = page["next_cursor"]
+            if not page["has_more"]:
+                break
+
+        assert len(seen) == len(expected)
+        assert set(seen) == expected
+
+    def test_last_page_has_no_next_cursor(
+        self, client, db_session, super_admin, auth_headers,
+    ):
+        self._add_tied_logs(db_session, 3)
+
+        resp = client.get(
+            "/api/v1/admin/audit-logs/?action=cursor.test&limit=3",
+            headers=auth_headers(super_admin),
+        )
+
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page["logs"]) == 3
+        assert page["has_more"] is False
+        assert page["next_cursor"] is None
+
+    def test_malformed_cursor_is_rejected(self, client, super_admin, auth_headers):
+        resp = client.get(
+            "/api/v1/admin/audit-logs/?cursor=not-a-cursor",
+            headers=auth_headers(super_admin),
+        )
+
+        assert resp.status_code == 400
+
+    def test_total_only_with_total(
+        self, client, db_session, super_admin, auth_headers,
+    ):
+        self._add_tied_logs(db_session, 4)
+        url = "/api/v1/admin/audit-logs/?action=cursor.test&limit=2"
+
+        resp = client.get(url, headers=auth_headers(super_admin))
+        assert resp.status_code == 200
+        assert resp.json()["total"] is None
+
+        resp = client.get(url + "&with_total=true", headers=auth_headers(super_admin))
+        assert resp.status_code == 200
+        assert resp.json()["total"] == 4
+
+
+class TestAuditStatisticsRollups:
+    """Statistics combine the hourly rollups with the live tail."""
+
+    def _add_logs(self, db_session, user_id=None):
+        from datetime import datetime, timedelta, timezone
+
+        old = datetime.now(timezone.utc) - timedelta(hours=5)
+        for i in range(3):
+            db_session.add(AuditLog(
+                action="user.update", resource="user", user_id=user_id, created_at=old,
+            ))
+        # Soft-deleted: neither counted nor rolled up
+        db_session.add(AuditLog(
+            action="user.update", resource="user", user_id=user_id, created_at=old,
+            is_active=False,
+        ))
+        db_session.add(AuditLog(action="user.create", resource="user"))
+        db_session.flush()
+
+    def test_rolled_up_and_live_logs_are_both_counted(self, db_session, detached_sessions):
+        from app.api.v1.endpoints.audit import _audit_statistics, _refresh_audit_rollups
+        from app.models.audit_log import AuditStatsHourly
+
+        self._add_logs(db_session)
+
+        # Nothing rolled up yet: everything is counted live
+        live = _audit_statistics(db_session, True, None)
+        assert live.total_logs == 4
+        assert live.actions_by_type == {"user.update": 3, "user.create": 1}
+
+        # The statistics read itself never writes the rollups
+        assert db_session.query(AuditStatsHourly).count() == 0
+
+        # Rolled-up hours plus the live tail; nothing is counted twice
+        _refresh_audit_rollups()
+        assert db_session.query(AuditStatsHourly).count() > 0
+        assert _audit_statistics(db_session, True, None) == live
+
+        _refresh_audit_rollups()
+        assert _audit_statistics(db_session, True, None) == live
+
+    def test_endpoint_refreshes_rollups_after_responding(
+        self, client, db_session, detached_sessions, super_admin, auth_headers,
+    ):
+        from app.api.v1.endpoints.audit import invalidate_audit_caches
+        from app.models.audit_log import AuditStatsHourly
+
+        invalidate_audit_caches()
+        self._add_logs(db_session)
+
+        resp = client.get("/api/v1/admin/audit-logs/statistics", headers=auth_headers(super_admin))
+
+        assert resp.status_code == 200
+        # TestClient runs background tasks before returning the response
+        assert db_session.query(AuditStatsHourly).count() > 0
+
+    def test_archiving_inactive_logs_keeps_rollups_non_negative(
+        self, db_session, detached_sessions, super_admin, tmp_path, monkeypatch,
+    ):
+        from datetime import datetime, timezone
+
+        from sqlalchemy import func
+
+        from app.api.v1.endpoints import audit
+        from app.api.v1.endpoints.audit import (
+            _archive_logs,
+            _audit_statistics,
+            _refresh_audit_rollups,
+        )
+        from app.models.audit_log import AuditStatsHourly, AuditStatsUser
+
+        monkeypatch.setattr(audit, "ARCHIVE_DIR", tmp_path)
+        self._add_logs(db_session, user_id=super_admin.id)
+        _refresh_audit_rollups()
+        assert db_session.query(AuditStatsUser).count() == 1
+
+        # Archives the soft-deleted log too, which the rollups never counted
+        _archive_logs(db_session, None, datetime.now(timezone.utc), "test")
+
+        assert db_session.scalar(func.min(AuditStatsHourly.log_count).select()) == 0
+        assert db_session.scalar(func.min(AuditStatsUser.log_count).select()) == 0
+        stats = _audit_statistics(db_session, True, None)
+        assert stats.total_logs == 0
+        assert stats.actions_by_type == {}
+
+
+class TestAuditRoutes:
+    """The audit router is registered exactly once."""
+
+    def test_audit_routes_are_unique(self):
+        import warnings
+
+        from fastapi.openapi.utils import get_openapi
+
+        from app.main import app
+
+        audit_operations = [
+            (path, method)
+            for path, operations in app.openapi()["paths"].items()
+            if path.startswith("/api/v1/admin/audit-logs")
+            for method in operations
+        ]
+        assert audit_operations
+        assert len(audit_operations) == len(set(audit_operations))
+
+        # The schema is keyed by path, so a second registration would only
+        # show up as FastAPI's duplicate operation ID warning
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            get_openapi(title=app.title, version=app.version, routes=app.routes)
+        duplicates = [
+            str(w.message) for w in caught
+            if "Duplicate Operation ID" in str(w.message) and "audit_logs" in str(w.message)
+        ]
+        assert duplicates == []
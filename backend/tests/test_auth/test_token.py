@@ -80,3 +80,21 @@ class TestTokenRefresh:
         )
         assert me_resp.status_code == 200
         assert me_resp.json()["email"] == admin.email
+
+
+class TestAccessTokenCache:
+
+    def test_cached_token_still_rejects_inactive_user(self, client, db_session, tenant_with_admin):
+        tenant, _, admin = tenant_with_admin
+
+        login_resp = client.post("/api/v1/auth/login", json={
+            "email": admin.email,
+            "password": "Test1234",
+        })
+        headers = {"Authorization": f"Bearer {login_resp.json()['tokens']['access_token']}"}
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+        # The token's payload is now cached; the user lookup is not
+        admin.is_active = False
+        db_session.flush()
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == 403
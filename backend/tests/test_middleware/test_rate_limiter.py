@@ -0,0 +1,120 @@
+"""
+Leaky bucket rate limiter tests.
+
+Run the Lua script against the Redis at REDIS_URL (DB 15 in tests);
+skipped when no Redis server is reachable. The fail-open tests need none.
+"""
+import asyncio
+import math
+import time
+import uuid
+
+import pytest
+
+from app.middleware import rate_limiter as rate_limiter_module
+from app.middleware.rate_limiter import RateLimiter
+
+
+@pytest.fixture()
+async def limiter():
+    limiter = RateLimiter()
+    try:
+        await limiter.redis_client.ping()
+    except Exception as e:
+        await limiter.close()
+        pytest.skip(f"Redis not reachable: {e}")
+    yield limiter
+    await limiter.close()
+
+
+@pytest.fixture()
+async def key(limiter):
+    key = f"test:{uuid.uuid4().hex}"
+    yield key
+    await limiter.redis_client.delete(f"rate_limit:{key}")
+
+
+async def _check_many(limiter, key, count, max_requests, window_seconds):
+    return [
+        await limiter.check_rate_limit(key, max_requests, window_seconds)
+        for _ in range(count)
+    ]
+
+
+class TestLeakyBucket:
+
+    async def test_burst_up_to_the_limit_is_allowed(self, limiter, key):
+        results = await _check_many(limiter, key, 3, max_requests=3, window_seconds=3600)
+
+        assert [allowed for allowed, _ in results] == [True, True, True]
+        assert [info["remaining"] for _, info in results] == [2, 1, 0]
+        assert all(info["limit"] == 3 for _, info in results)
+
+    async def test_denied_after_the_limit(self, limiter, key):
+        results = await _check_many(limiter, key, 10, max_requests=3, window_seconds=3600)
+
+        # Never more than the limit within the window, however many tries
+        assert [allowed for allowed, _ in results] == [True] * 3 + [False] * 7
+
+    async def test_retry_after_and_reset(self, limiter, key):
+        before = time.time()
+        await _check_many(limiter, key, 3, max_requests=3, window_seconds=3600)
+        allowed, info = await limiter.check_rate_limit(key, 3, 3600)
+
+        assert not allowed
+        assert info["remaining"] == 0
+        # One slot drains every window / limit seconds (20 minutes here)
+        assert 1190 <= info["retry_after"] <= 1200
+        # The bucket is empty again a full window after the burst
+        assert before + 3590 <= info["reset"] <= time.time() + 3600
+
+    async def test_slot_frees_after_window_over_limit(self, limiter, key):
+        # 4 per second: a slot frees up every 250 ms
+        await _check_many(limiter, key, 4, max_requests=4, window_seconds=1)
+        allowed, info = await limiter.check_rate_limit(key, 4, 1)
+        assert not allowed
+        assert info["retry_after"] == 1  # 250 ms, rounded up to a second
+
+        await asyncio.sleep(0.3)
+        results = await _check_many(limiter, key, 2, max_requests=4, window_seconds=1)
+
+        assert [allowed for allowed, _ in results] == [True, False]
+
+    async def test_sustained_rate_stays_below_double_the_limit(self, limiter, key):
+        # A fixed window lets 2 x limit through around a window boundary;
+        # the bucket allows its burst plus one slot per window / limit
+        start = time.monotonic()
+        allowed_count = 0
+        while time.monotonic() - start < 0.6:
+            allowed, _ = await limiter.check_rate_limit(key, 4, 1)
+            allowed_count += allowed
+            await asyncio.sleep(0.01)
+        elapsed = time.monotonic() - start
+
+        assert 4 < allowed_count <= 4 + math.ceil(elapsed * 4)
+        assert allowed_count < 2 * 4
+
+
+class TestFailOpen:
+
+    async def test_redis_error_allows_the_request(self, monkeypatch):
+        # Nothing listens on port 1, so every Redis call fails
+        monkeypatch.setattr(rate_limiter_module.settings, "REDIS_URL", "redis://127.0.0.1:1/0")
+        limiter = RateLimiter()
+        try:
+            results = await _check_many(limiter, "fail-open", 5, max_requests=3, window_seconds=60)
+        finally:
+            await limiter.close()
+
+        assert all(allowed for allowed, _ in results)
+        assert all(info["remaining"] == 3 for _, info in results)
+
+    async def test_no_redis_client_allows_the_request(self):
+        limiter = RateLimiter()
+        await limiter.close()
+        limiter.redis_client = None
+
+        allowed, info = await limiter.check_rate_limit("no-redis", 3, 60)
+
+        assert allowed
+        assert info == {"limit": 3, "remaining": 3, "reset": 0}
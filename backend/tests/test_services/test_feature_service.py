@@ -0,0 +1,34 @@
+"""FeatureService unit tests."""
+from app.services.feature_service import FeatureService
+
+
+class TestFeatureOverrides:
+    """Overrides live in the plain JSON tenants.features column."""
+
+    def _reloaded_features(self, db_session, tenant):
+        db_session.expire(tenant)
+        return tenant.features
+
+    def test_enable_adds_to_existing_override_list(self, db_session, create_tenant):
+        tenant = create_tenant()
+        tenant.features = {"enabled": ["reports"], "disabled": ["api_access"]}
+        db_session.flush()
+
+        FeatureService.enable_feature(db_session, tenant, "api_access")
+
+        assert self._reloaded_features(db_session, tenant) == {
+            "enabled": ["reports", "api_access"],
+            "disabled": [],
+        }
+
+    def test_disable_adds_to_existing_override_list(self, db_session, create_tenant):
+        tenant = create_tenant()
+        tenant.features = {"enabled": ["reports"], "disabled": ["api_access"]}
+        db_session.flush()
+
+        FeatureService.disable_feature(db_session, tenant, "reports")
+
+        assert self._reloaded_features(db_session, tenant) == {
+            "enabled": [],
+            "disabled": ["api_access", "reports"],
+        }
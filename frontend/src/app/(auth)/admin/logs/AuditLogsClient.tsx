@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, Fragment } from 'react';
+import { useState, useEffect, Fragment } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { auditAPI, type ArchiveResult } from '@/lib/api/audit';
 import { useDevModeStore } from '@/lib/store/devModeStore';
@@ -63,6 +63,8 @@ export default function AuditLogsClient() {
   const { devMode } = useDevModeStore();
   const [page, setPage] = useState(1);
   const [pageSize] = useState(50);
+  // Keyset cursor for each page reached via Next (page 1 has none)
+  const [cursors, setCursors] = useState<(string | null)[]>([null]);
   const [search, setSearch] = useState('');
   const [actionFilter, setActionFilter] = useState<string>('all');
   const [resourceFilter, setResourceFilter] = useState<string>('all');
@@ -153,8 +155,10 @@ export default function AuditLogsClient() {
 
   // Build query params
   const params = {
-    skip: (page - 1) * pageSize,
+    ...(cursors[page - 1] ? { cursor: cursors[page - 1]! } : { skip: (page - 1) * pageSize }),
     limit: pageSize,
+    // Only count matching logs when a filter set is first loaded
+    with_total: page === 1,
     ...(search && { search }),
     ...(actionFilter !== 'all' && { action: actionFilter }),
     ...(resourceFilter !== 'all' && { resource: resourceFilter }),
@@ -173,8 +177,14 @@ export default function AuditLogsClient() {
   });
 
   const logs = response?.logs || [];
-  const total = response?.total || 0;
-  const totalPages = Math.ceil(total / pageSize);
+  const hasMore = response?.has_more ?? false;
+
+  // Total comes with page 1 only; keep it while paging through later pages
+  const [total, setTotal] = useState(0);
+  useEffect(() => {
+    if (response?.total != null) setTotal(response.total);
+  }, [response?.total]);
+  const totalPages = Math.max(page, Math.ceil(total / pageSize));
 
   const getStatusBadge = (status: string) => {
     switch (status) {
@@ -706,11 +716,11 @@ export default function AuditLogsClient() {
         </div>
 
         {/* Pagination */}
-        {!isLoading && totalPages > 1 && (
+        {!isLoading && (page > 1 || hasMore) && (
           <div className="flex items-center justify-between px-6 py-4 border-t">
             <div className="text-sm text-gray-500">
               Showing {(page - 1) * pageSize + 1} to{' '}
-              {Math.min(page * pageSize, total)} of {total.toLocaleString()} logs
+              {(page - 1) * pageSize + logs.length} of {total.toLocaleString()} logs
             </div>
             <div className="flex gap-2">
               <Button
@@ -730,8 +740,12 @@ export default function AuditLogsClient() {
               <Button
                 variant="outline"
                 size="sm"
-                onClick={() => setPage((p) => Math.min(totalPages, p + 1))}
-                disabled={page === totalPages}
+                onClick={() => {
+                  const nextCursor = response?.next_cursor ?? null;
+                  setCursors((c) => [...c.slice(0, page), nextCursor]);
+                  setPage((p) => p + 1);
+                }}
+                disabled={!hasMore}
               >
                 Next
                 <ChevronRight className="h-4 w-4" />
@@ -2,9 +2,9 @@
 
 import { useState, useRef, useCallback, useEffect } from 'react';
 import { useRouter } from 'next/navigation';
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
+import { keepPreviousData, useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api/client';
-import { adminToolsAPI, RuntimeSettings } from '@/lib/api/admin-tools';
+import { adminToolsAPI, BackgroundJobAccepted, RuntimeSettings } from '@/lib/api/admin-tools';
 import { useDevModeStore } from '@/lib/store/devModeStore';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
@@ -118,9 +118,11 @@ export default function AdminToolsPage() {
     refetch: refetchSystemInfo,
     isFetching: systemInfoFetching,
   } = useQuery({
-    queryKey: ['system-info'],
-    queryFn: () => adminToolsAPI.getSystemInfo(),
+    // Env vars are only fetched while the section is expanded
+    queryKey: ['system-info', showEnvVars],
+    queryFn: () => adminToolsAPI.getSystemInfo({ includeEnv: showEnvVars }),
     enabled: devMode,
+    placeholderData: keepPreviousData,
   });
 
   // ── Request Logs ────────────────────────────────────────────────────────
@@ -156,7 +158,10 @@ export default function AdminToolsPage() {
   // ── Seed / Reset ───────────────────────────────────────────────────────
 
   const seedDataMutation = useMutation({
-    mutationFn: () => apiClient.post<SeedDataResponse>('/admin/tools/seed-data'),
+    mutationFn: async () => {
+      const job = await apiClient.post<BackgroundJobAccepted>('/admin/tools/seed-data');
+      return adminToolsAPI.waitForJob<SeedDataResponse>(job.task_id);
+    },
     onSuccess: (data) => {
       setSeedResult(data);
       setResetResult(null);
@@ -173,7 +178,10 @@ export default function AdminToolsPage() {
   });
 
   const resetDatabaseMutation = useMutation({
-    mutationFn: () => apiClient.post<ResetDatabaseResponse>('/admin/tools/reset-database'),
+    mutationFn: async () => {
+      const job = await apiClient.post<BackgroundJobAccepted>('/admin/tools/reset-database');
+      return adminToolsAPI.waitForJob<ResetDatabaseResponse>(job.task_id);
+    },
     onSuccess: (data) => {
       setResetResult(data);
       setSeedResult(null);
@@ -327,11 +335,17 @@ export default function AdminToolsPage() {
                 >
                   <div className="flex items-center gap-2">
                     {showEnvVars ? <EyeOff className="h-4 w-4" /> : <Eye className="h-4 w-4" />}
-                    Environment Variables ({Object.keys(systemInfo.env_vars).length})
+                    Environment Variables
+                    {systemInfo.env_vars && ` (${Object.keys(systemInfo.env_vars).length})`}
                   </div>
                   {showEnvVars ? <ChevronUp className="h-4 w-4" /> : <ChevronDown className="h-4 w-4" />}
                 </button>
-                {showEnvVars && (
+                {showEnvVars && !systemInfo.env_vars && (
+                  <div className="border-t px-4 py-3 text-xs text-muted-foreground">
+                    Loading...
+                  </div>
+                )}
+                {showEnvVars && systemInfo.env_vars && (
                   <div className="border-t max-h-64 overflow-y-auto">
                     <table className="w-full text-xs">
                       <tbody>
@@ -21,7 +21,8 @@ export interface SystemInfo {
   migration_version: string;
   uptime: string;
   uptime_seconds: number;
-  env_vars: Record<string, string>;
+  // Only present when requested with include_env
+  env_vars?: Record<string, string>;
 }
 
 export interface LogEntry {
@@ -30,6 +31,21 @@ export interface LogEntry {
   message: string;
 }
 
+export interface BackgroundJobAccepted {
+  status: 'accepted';
+  task_id: string;
+}
+
+export interface BackgroundJob<T = unknown> {
+  task_id: string;
+  action: string;
+  status: 'pending' | 'running' | 'completed' | 'failed';
+  result: T | null;
+  error: string | null;
+  created_at: string;
+  finished_at: string | null;
+}
+
 export const adminToolsAPI = {
   getSettings: async (): Promise<RuntimeSettings> => {
     return apiClient.get<RuntimeSettings>('/admin/tools/settings');
@@ -39,8 +55,9 @@ export const adminToolsAPI = {
     return apiClient.post<RuntimeSettings>('/admin/tools/settings', data);
   },
 
-  getSystemInfo: async (): Promise<SystemInfo> => {
-    return apiClient.get<SystemInfo>('/admin/tools/system-info');
+  getSystemInfo: async (params?: { includeEnv?: boolean }): Promise<SystemInfo> => {
+    const qs = params?.includeEnv ? '?include_env=true' : '';
+    return apiClient.get<SystemInfo>(`/admin/tools/system-info${qs}`);
   },
 
   getLogs: async (params?: { level?: string; limit?: number; offset?: number }): Promise<LogEntry[]> => {
@@ -51,4 +68,18 @@ export const adminToolsAPI = {
     const qs = queryParams.toString();
     return apiClient.get<LogEntry[]>(`/admin/tools/logs${qs ? `?${qs}` : ''}`);
   },
+
+  getJob: async <T>(taskId: string): Promise<BackgroundJob<T>> => {
+    return apiClient.get<BackgroundJob<T>>(`/admin/tools/jobs/${taskId}`);
+  },
+
+  /** Poll a background job until it finishes, resolving with its result. */
+  waitForJob: async <T>(taskId: string, intervalMs = 1000): Promise<T> => {
+    for (;;) {
+      const job = await adminToolsAPI.getJob<T>(taskId);
+      if (job.status === 'completed') return job.result as T;
+      if (job.status === 'failed') throw new Error(job.error || 'Background job failed');
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+  },
 };
@@ -17,7 +17,10 @@ export interface AuditLog {
 
 export interface AuditLogListResponse {
   logs: AuditLog[];
-  total: number;
+  // Only present when requested with with_total (may be an estimate)
+  total: number | null;
+  has_more: boolean;
+  next_cursor: string | null;
   limit: number;
   offset: number;
 }
@@ -34,7 +37,9 @@ export interface AuditStatistics {
 
 export interface AuditLogParams {
   skip?: number;
+  cursor?: string;
   limit?: number;
+  with_total?: boolean;
   action?: string;
   resource?: string;
   status?: string;
@@ -58,6 +63,23 @@ export interface ArchiveResult {
   file: ArchiveFile | null;
 }
 
+export interface ArchiveJobAccepted {
+  status: 'accepted';
+  task_id: string;
+  status_url: string;
+}
+
+export interface ArchiveJob {
+  task_id: string;
+  tenant_id: string | null;
+  status: 'pending' | 'running' | 'completed' | 'failed';
+  progress: { records_processed: number; bytes_written: number };
+  result: ArchiveResult | null;
+  error: string | null;
+  created_at: string;
+  finished_at: string | null;
+}
+
 export interface ArchiveInfo {
   name: string;
   size_bytes: number;
@@ -73,6 +95,19 @@ export interface ArchiveListResponse {
   total: number;
 }
 
+// Gzipped archives are sent with Content-Encoding: gzip and arrive decompressed
+const archiveDownloadName = (filename: string): string => filename.replace(/\.gz$/, '');
+
+/** Poll an archive job until it finishes, resolving with its result. */
+const waitForArchiveJob = async (jobUrl: string, intervalMs = 1000): Promise<ArchiveResult> => {
+  for (;;) {
+    const job = await apiClient.get<ArchiveJob>(jobUrl);
+    if (job.status === 'completed') return job.result as ArchiveResult;
+    if (job.status === 'failed') throw new Error(job.error || 'Archive job failed');
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
+};
+
 export const auditAPI = {
   /**
    * Get paginated list of audit logs with optional filters
@@ -81,7 +116,9 @@ export const auditAPI = {
     const queryParams = new URLSearchParams();
 
     if (params.skip !== undefined) queryParams.append('skip', params.skip.toString());
+    if (params.cursor) queryParams.append('cursor', params.cursor);
     if (params.limit !== undefined) queryParams.append('limit', params.limit.toString());
+    if (params.with_total) queryParams.append('with_total', 'true');
     if (params.action) queryParams.append('action', params.action);
     if (params.resource) queryParams.append('resource', params.resource);
     if (params.status) queryParams.append('status', params.status);
@@ -134,11 +171,13 @@ export const auditAPI = {
 
   /**
    * Archive old audit logs before a given date
-   * Exports logs to JSON file, then deletes from database
+   * Exports logs to a gzipped JSON file, then deletes from database.
+   * Runs as a background job on the server; resolves once it finishes.
    */
   archiveLogs: async (beforeDate?: string): Promise<ArchiveResult> => {
     const params = beforeDate ? `?before_date=${encodeURIComponent(beforeDate)}` : '';
-    return apiClient.post<ArchiveResult>(`/admin/audit-logs/archive${params}`);
+    const job = await apiClient.post<ArchiveJobAccepted>(`/admin/audit-logs/archive${params}`);
+    return waitForArchiveJob(`/admin/audit-logs/archive/${job.task_id}`);
   },
 
   /**
@@ -152,7 +191,7 @@ export const auditAPI = {
    * Download an archive file
    */
   downloadArchive: async (filename: string): Promise<void> => {
-    return apiClient.downloadFile(`/admin/audit-logs/archives/${encodeURIComponent(filename)}`, filename);
+    return apiClient.downloadFile(`/admin/audit-logs/archives/${encodeURIComponent(filename)}`, archiveDownloadName(filename));
   },
 
   /**
@@ -173,7 +212,9 @@ export const tenantAuditAPI = {
     const queryParams = new URLSearchParams();
 
     if (params.skip !== undefined) queryParams.append('skip', params.skip.toString());
+    if (params.cursor) queryParams.append('cursor', params.cursor);
     if (params.limit !== undefined) queryParams.append('limit', params.limit.toString());
+    if (params.with_total) queryParams.append('with_total', 'true');
     if (params.action) queryParams.append('action', params.action);
     if (params.resource) queryParams.append('resource', params.resource);
     if (params.status) queryParams.append('status', params.status);
@@ -206,11 +247,13 @@ export const tenantAuditAPI = {
 
   /**
    * Archive old audit logs for current tenant
-   * Exports logs to JSON file, then deletes from database
+   * Exports logs to a gzipped JSON file, then deletes from database.
+   * Runs as a background job on the server; resolves once it finishes.
    */
   archiveLogs: async (beforeDate?: string): Promise<ArchiveResult> => {
     const params = beforeDate ? `?before_date=${encodeURIComponent(beforeDate)}` : '';
-    return apiClient.post<ArchiveResult>(`/admin/audit-logs/tenant/archive${params}`);
+    const job = await apiClient.post<ArchiveJobAccepted>(`/admin/audit-logs/tenant/archive${params}`);
+    return waitForArchiveJob(`/admin/audit-logs/tenant/archive/${job.task_id}`);
   },
 
   /**
@@ -224,6 +267,6 @@ export const tenantAuditAPI = {
    * Download an archive file for current tenant
    */
   downloadArchive: async (filename: string): Promise<void> => {
-    return apiClient.downloadFile(`/admin/audit-logs/tenant/archives/${encodeURIComponent(filename)}`, filename);
+    return apiClient.downloadFile(`/admin/audit-logs/tenant/archives/${encodeURIComponent(filename)}`, archiveDownloadName(filename));
   },
 };